@@ -5,9 +5,11 @@ Variables
 ---------
 __version__ : str, default "0.0.0+unknown"
     Version of the package. If the package metadata is unavailable (e.g. in editable or source-only
-    environments), a fallback value is provided (PEP 440 compliant).
+    environments), a fallback value is provided (PEP 440 compliant). Resolved lazily on first
+    access (PEP 562) and cached, so importers that never read it skip the metadata lookup.
 __all__ : list
-    Public objects exposed by this package.
+    Public objects exposed by this package. They are imported lazily on first access (PEP 562), so
+    importing the package itself does not load the conversion pipeline.
 
 Functions
 ---------
@@ -29,19 +31,17 @@ importlib.metadata.version
 PackageNotFoundError
     Exception raised when the package is not found in the environment.
 """
-from importlib.metadata import version, PackageNotFoundError
+from functools import lru_cache
+import importlib
 import platform
+from typing import TYPE_CHECKING, Any
 
-try:
-    if __package__ is None: # erroneous script execution
-        raise PackageNotFoundError
-    __version__ = version(__package__)
-except PackageNotFoundError:
-    __version__ = "0.0.0+unknown"
+if TYPE_CHECKING:
+    from loretex.api import SpecResult, convert_file, convert_spec, convert_string
+    from loretex.conversion import ConversionConfig, MarkdownToLaTeXConverter
+    from loretex.parsers.markdown_converter import convert_markdown_to_latex
 
-from loretex.api import SpecResult, convert_file, convert_spec, convert_string
-from loretex.conversion import ConversionConfig, MarkdownToLaTeXConverter
-from loretex.parsers.markdown_converter import convert_markdown_to_latex
+    __version__: str
 
 __all__ = [
     "ConversionConfig",
@@ -55,7 +55,46 @@ __all__ = [
     "info",
 ]
 
+_LAZY_ATTRIBUTES = {
+    "ConversionConfig": "loretex.conversion",
+    "MarkdownToLaTeXConverter": "loretex.conversion",
+    "SpecResult": "loretex.api",
+    "convert_file": "loretex.api",
+    "convert_markdown_to_latex": "loretex.parsers.markdown_converter",
+    "convert_spec": "loretex.api",
+    "convert_string": "loretex.api",
+}
+"""Public names resolved on first access, mapped to the module defining them."""
+
+
+@lru_cache(maxsize=1)
+def _get_version() -> str:
+    """Look up the installed package version once (reads distribution metadata from disk)."""
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        if __package__ is None: # erroneous script execution
+            raise PackageNotFoundError
+        return version(__package__)
+    except PackageNotFoundError:
+        return "0.0.0+unknown"
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        return _get_version()
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 def info() -> str:
     """Format diagnostic information on package and platform."""
-    return f"{__package__} {__version__} | Platform: {platform.system()} Python {platform.python_version()}"
+    return f"{__package__} {_get_version()} | Platform: {platform.system()} Python {platform.python_version()}"
@@ -12,6 +12,7 @@ See Also
 --------
 loretex.cli: Module implementing the application's command-line interface.
 """
-from .cli import app
+from loretex.cli import app
 
-app()
+if __name__ == "__main__":
+    app()
@@ -6,9 +6,12 @@ This module exposes simple, stable entry points for common conversion workflows.
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Mapping
+from types import MappingProxyType
+from typing import Hashable, Mapping
+import warnings
 
 from loretex.config.params import (
     DEFAULT_CALLOUT_BODY_FONT,
@@ -17,9 +20,16 @@ from loretex.config.params import (
     SpecParams,
 )
 from loretex.conversion import ConversionConfig, MarkdownToLaTeXConverter
-from loretex.conversion.config import has_anchor_override
+from loretex.conversion.config import config_cache_key, has_anchor_override
 from loretex.pipeline import AssemblyPlan, assemble
-from loretex.utils.io import ensure_output_dir, load_yaml_spec
+from loretex.utils.io import (
+    ensure_output_dir,
+    load_yaml_spec,
+    read_utf8,
+    read_utf8_files,
+    write_text_if_changed,
+    write_utf8,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -38,6 +48,10 @@ def convert_string(
 
     This is the canonical public entry point. All other helpers ultimately
     delegate to :meth:`MarkdownToLaTeXConverter.convert_string`.
+
+    Configs given as mappings are coerced once per distinct value and cached; for batch
+    work, building a :class:`ConversionConfig` (and converter) once and reusing it is still
+    the cheapest option.
     """
     conversion_config = _coerce_config(config)
     converter = MarkdownToLaTeXConverter(config=conversion_config, transforms=transforms)
@@ -54,7 +68,7 @@ def convert_file(
     """
     Convert a Markdown file to LaTeX. Returns the LaTeX string.
     """
-    markdown_text = input_path.read_text(encoding="utf-8")
+    markdown_text = read_utf8(input_path)
     latex_text = convert_string(
         markdown_text,
         config=config,
@@ -63,7 +77,7 @@ def convert_file(
     )
 
     if output_path is not None:
-        output_path.write_text(latex_text, encoding="utf-8")
+        write_utf8(output_path, latex_text)
 
     return latex_text
 
@@ -81,7 +95,7 @@ class SpecResult:
     main_output: Path | None
 
 
-def convert_spec(spec_input: Path | dict) -> SpecResult:
+def convert_spec(spec_input: Path | dict, *, max_workers: int | None = None) -> SpecResult:
     """
     Convert chapters from a YAML specification file (or pre-loaded dict).
 
@@ -89,6 +103,12 @@ def convert_spec(spec_input: Path | dict) -> SpecResult:
     ----------
     spec_input : Path | dict
         Either the path to a YAML spec file, or an already-loaded spec dict.
+    max_workers : int | None
+        Number of worker processes used to convert chapters in parallel. ``None`` (the
+        default) and ``1`` convert serially in the calling process. Specs with fewer than
+        ``_PARALLEL_MIN_CHAPTERS`` chapters are always converted serially, since worker
+        start-up would cost more than it saves. Parsing errors and warnings raised in
+        workers reach the caller as they would in a serial run.
 
     Returns
     -------
@@ -104,7 +124,7 @@ def convert_spec(spec_input: Path | dict) -> SpecResult:
     params = SpecParams.from_spec(spec, base_dir=base_dir)
 
     # Layer 1 — pure orchestration (no I/O)
-    converted = _convert_chapters(params)
+    converted = _convert_chapters(params, max_workers=max_workers)
 
     # Layer 3 — I/O: write results to disk
     chapter_outputs = _write_chapters(params, converted)
@@ -115,64 +135,158 @@ def convert_spec(spec_input: Path | dict) -> SpecResult:
     return SpecResult(chapter_outputs=chapter_outputs, main_output=main_output)
 
 
-def _convert_chapters(params: SpecParams) -> list[tuple[Path, str]]:
+def _convert_chapters(
+    params: SpecParams, *, max_workers: int | None = None
+) -> list[tuple[Path, str]]:
     """Layer 1: pure orchestration — convert every chapter and return pairs.
 
-    Returns a list of ``(output_path, latex_text)`` without performing any I/O.
+    Returns a list of ``(output_path, latex_text)`` without writing anything. Chapter
+    sources are read up front; conversions run in a process pool when ``max_workers`` asks
+    for it and the spec is large enough, preserving chapter order.
     """
     base_config = ConversionConfig.from_dict(params.conversion)
-    if not has_anchor_override(params.conversion):
+    if (
+        not has_anchor_override(params.conversion)
+        and base_config.headings.anchor_level != params.anchor_level
+    ):
         base_config = base_config.with_overrides(
             {"headings": {"anchor_level": params.anchor_level}}
         )
-    converter = MarkdownToLaTeXConverter(config=base_config)
+    base_anchor = base_config.headings.anchor_level
 
-    results: list[tuple[Path, str]] = []
+    sources = read_utf8_files(chapter.md_path for chapter in params.chapters)
+    chapter_overrides: list[Mapping[str, object]] = []
     for chapter in params.chapters:
-        markdown_text = chapter.md_path.read_text(encoding="utf-8")
         overrides = chapter.options or {}
-        if chapter.local_anchor is not None and not has_anchor_override(overrides):
+        # An anchor equal to the base config's is a no-op override; skipping it lets the
+        # converter reuse its prebuilt config and generator for the chapter.
+        if (
+            chapter.local_anchor is not None
+            and chapter.local_anchor != base_anchor
+            and not has_anchor_override(overrides)
+        ):
             overrides = _apply_anchor_override(overrides, chapter.local_anchor)
-        latex_text = converter.convert_string(markdown_text, overrides)
-        results.append((chapter.tex_output, latex_text))
-    return results
+        chapter_overrides.append(overrides)
+
+    workers = max_workers or 1
+    if len(sources) < _PARALLEL_MIN_CHAPTERS or workers <= 1:
+        converter = MarkdownToLaTeXConverter(config=base_config)
+        latex_texts = [
+            converter.convert_string(markdown_text, overrides)
+            for markdown_text, overrides in zip(sources, chapter_overrides)
+        ]
+    else:
+        workers = min(workers, len(sources))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_chapter_worker,
+            initargs=(base_config.to_dict(),),
+        ) as executor:
+            results = executor.map(
+                _convert_chapter_in_worker,
+                sources,
+                chapter_overrides,
+                chunksize=max(1, len(sources) // (4 * workers)),
+            )
+            latex_texts = []
+            for latex_text, caught in results:
+                # Re-issued in chapter order, as a serial run would have emitted them.
+                for message, category, filename, lineno in caught:
+                    warnings.warn_explicit(message, category, filename, lineno)
+                latex_texts.append(latex_text)
+    return [
+        (chapter.tex_output, latex_text)
+        for chapter, latex_text in zip(params.chapters, latex_texts)
+    ]
+
+
+_PARALLEL_MIN_CHAPTERS = 3
+"""Smallest number of chapters for which :func:`convert_spec` starts worker processes."""
+
+_WORKER_CONVERTER: MarkdownToLaTeXConverter | None = None
+"""Converter built once per worker process by :func:`_init_chapter_worker`."""
+
+
+def _init_chapter_worker(config_data: Mapping[str, object]) -> None:
+    """Build the worker's converter from the plain-dict form of the base config."""
+    global _WORKER_CONVERTER
+    _WORKER_CONVERTER = MarkdownToLaTeXConverter(config=ConversionConfig.from_dict(config_data))
+
+
+def _convert_chapter_in_worker(
+    markdown_text: str, overrides: Mapping[str, object]
+) -> tuple[str, list[tuple[str, type[Warning], str, int]]]:
+    """Convert one chapter source inside a worker process (must stay module-level to pickle).
+
+    Warnings are recorded rather than emitted, since the parent process cannot see them;
+    they are returned with the LaTeX text so the parent can re-issue them.
+    """
+    if _WORKER_CONVERTER is None:
+        raise RuntimeError("Chapter worker used before _init_chapter_worker ran.")
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        latex_text = _WORKER_CONVERTER.convert_string(markdown_text, overrides)
+    return latex_text, [
+        (str(warning.message), warning.category, warning.filename, warning.lineno)
+        for warning in caught
+    ]
 
 
 def _write_chapters(
     params: SpecParams, converted: list[tuple[Path, str]]
 ) -> list[Path]:
-    """Layer 3: I/O — write converted chapters to disk."""
+    """Layer 3: I/O — write converted chapters to disk (unchanged files are left untouched)."""
     ensure_output_dir(params.output_dir)
     outputs: list[Path] = []
     for tex_path, latex_text in converted:
         tex_path.parent.mkdir(parents=True, exist_ok=True)
-        tex_path.write_text(latex_text, encoding="utf-8")
+        write_text_if_changed(tex_path, latex_text)
         outputs.append(tex_path)
     return outputs
 
 
+_CALLOUT_TITLE_FONT_COMMAND = "\\renewcommand{{\\loretexcallouttitlefont}}{{{}}}"
+_CALLOUT_BODY_FONT_COMMAND = "\\renewcommand{{\\loretexcalloutbodyfont}}{{{}}}"
+
+_TEMPLATE_DEFAULTS: Mapping[str, str] = MappingProxyType(
+    {
+        "document_font": DEFAULT_DOCUMENT_FONT,
+        "title": "",
+        "author": "",
+        "date": "",
+        "bibliography": "",
+        "callout_title_font": _CALLOUT_TITLE_FONT_COMMAND.format(DEFAULT_CALLOUT_TITLE_FONT),
+        "callout_body_font": _CALLOUT_BODY_FONT_COMMAND.format(DEFAULT_CALLOUT_BODY_FONT),
+    }
+)
+"""Template variables for a spec that sets none of the optional fields (read-only)."""
+
+
 def _build_template_vars(params: SpecParams) -> dict[str, str]:
     """Layer 2: build template variables from spec params (pure).
 
-    Font defaults are drawn from ``SpecParams`` field defaults rather than
-    being hardcoded here (Fix 6).
+    Starts from the precomputed ``_TEMPLATE_DEFAULTS`` (built from the ``SpecParams`` font
+    defaults, Fix 6) and only formats the fields the spec actually sets.
     """
-    document_font = params.document_font or DEFAULT_DOCUMENT_FONT
-    callout_title_font = params.callout_title_font or DEFAULT_CALLOUT_TITLE_FONT
-    callout_body_font = params.callout_body_font or DEFAULT_CALLOUT_BODY_FONT
-    template_vars: dict[str, str] = {
-        "document_font": document_font,
-        "title": f"{{{params.title}}}" if params.title else "",
-        "author": f"{{{params.author}}}" if params.author else "",
-        "date": f"{{{params.date}}}" if params.date else "",
-        "bibliography": params.bibliography or "",
-        "callout_title_font": (
-            f"\\renewcommand{{\\loretexcallouttitlefont}}{{{callout_title_font}}}"
-        ),
-        "callout_body_font": (
-            f"\\renewcommand{{\\loretexcalloutbodyfont}}{{{callout_body_font}}}"
-        ),
-    }
+    template_vars = dict(_TEMPLATE_DEFAULTS)
+    if params.document_font:
+        template_vars["document_font"] = params.document_font
+    if params.title:
+        template_vars["title"] = f"{{{params.title}}}"
+    if params.author:
+        template_vars["author"] = f"{{{params.author}}}"
+    if params.date:
+        template_vars["date"] = f"{{{params.date}}}"
+    if params.bibliography:
+        template_vars["bibliography"] = params.bibliography
+    if params.callout_title_font:
+        template_vars["callout_title_font"] = _CALLOUT_TITLE_FONT_COMMAND.format(
+            params.callout_title_font
+        )
+    if params.callout_body_font:
+        template_vars["callout_body_font"] = _CALLOUT_BODY_FONT_COMMAND.format(
+            params.callout_body_font
+        )
     template_vars.update(
         {str(key): str(value) for key, value in params.template_vars.items()}
     )
@@ -199,23 +313,36 @@ def _maybe_assemble_main(params: SpecParams, outputs: list[Path]) -> Path | None
 # ---------------------------------------------------------------------------
 
 
+_CONFIG_CACHE: dict[Hashable, ConversionConfig] = {}
+"""Configs built from mappings, keyed by :func:`config_cache_key` (oldest evicted first)."""
+
+_CONFIG_CACHE_SIZE = 32
+
+
 def _coerce_config(
     config: ConversionConfig | Mapping[str, object] | None,
 ) -> ConversionConfig:
-    if config is None:
-        return ConversionConfig()
     if isinstance(config, ConversionConfig):
         return config
-    return ConversionConfig.from_dict(config)
+    if config is None:
+        config = {}
+    try:
+        key = config_cache_key(config)
+    except TypeError:
+        return ConversionConfig.from_dict(config)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None:
+        cached = ConversionConfig.from_dict(config)
+        if len(_CONFIG_CACHE) >= _CONFIG_CACHE_SIZE:
+            del _CONFIG_CACHE[next(iter(_CONFIG_CACHE))]
+        _CONFIG_CACHE[key] = cached
+    return cached
 
 
 def _apply_anchor_override(overrides: Mapping[str, object], anchor_level: int) -> dict:
-    updated = dict(overrides)
-    headings = updated.get("headings")
+    headings = overrides.get("headings")
     if isinstance(headings, Mapping):
-        headings = dict(headings)
+        headings = {"anchor_level": anchor_level, **headings}
     else:
-        headings = {}
-    headings.setdefault("anchor_level", anchor_level)
-    updated["headings"] = headings
-    return updated
+        headings = {"anchor_level": anchor_level}
+    return {**overrides, "headings": headings}
@@ -9,7 +9,7 @@ to a YAML specification.
 
 Functions
 ---------
-convert(spec_path: Path) -> None
+convert(spec_path: Path, jobs: int) -> None
     Convert Markdown notes to LaTeX files based on the provided YAML specification.
 convert_file(input_path: Path, output_path: Path | None, config_path: Path | None) -> None
     Convert a single Markdown file to LaTeX.
@@ -23,18 +23,17 @@ Notes
 -----
 In the `Typer` constructor, `add_completion=False` disables automatic installation of shell
 completion support (e.g., Bash, Zsh) to keep the CLI interface minimal.
+
+The conversion pipeline and YAML loader are imported inside the commands that use them, so
+`--help`, `--version` and `info` only pay for importing `typer`.
 """
 
 from pathlib import Path
+from typing import Mapping
 
 import typer
 
-from loretex import info as pkg_info, __version__
-from loretex.api import convert_file as api_convert_file
-from loretex.api import convert_spec as api_convert_spec
-from loretex.conversion import ConversionConfig
-from loretex.conversion.config import has_anchor_override
-from loretex.utils.io import load_yaml_spec
+import loretex
 
 app = typer.Typer(add_completion=False, no_args_is_help=True)
 
@@ -46,18 +45,25 @@ def main_callback(
     )
 ) -> None:
     if version:
-        typer.echo(__version__)
+        typer.echo(loretex.__version__)
         raise typer.Exit()
 
 @app.command("info")
 def cli_info() -> None:
     """Display package version and platform information."""
-    typer.echo(pkg_info())
+    typer.echo(loretex.info())
 
 
 @app.command()
 def convert(
-    spec_path: Path = typer.Option(..., "--spec", "-s", help="Path to the YAML specification file.")
+    spec_path: Path = typer.Option(..., "--spec", "-s", help="Path to the YAML specification file."),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Worker processes for chapter conversion (default: 1, converts serially).",
+    ),
 ) -> None:
     """
     Convert Markdown notes to LaTeX files according to the specification and write LaTeX files to
@@ -68,6 +74,9 @@ def convert(
     spec_path : Path
         Path to the YAML specification file defining global conversion parameters and chapter
         definitions.
+    jobs : int
+        Number of worker processes used to convert chapters in parallel. Defaults to 1
+        (serial); specs with fewer than three chapters are always converted serially.
 
     See Also
     --------
@@ -80,13 +89,17 @@ def convert(
     loretex.conversion.MarkdownToLaTeXConverter
         Conversion engine used to convert Markdown text to LaTeX format.
     """
+    from loretex.api import convert_spec as api_convert_spec
+    from loretex.utils.io import load_yaml_spec
 
     spec_data = load_yaml_spec(spec_path) or {}
-    result = api_convert_spec(spec_data)
-    for output in result.chapter_outputs:
-        typer.echo(f"[SUCCESS] Generated {output}")
+    result = api_convert_spec(spec_data, max_workers=jobs)
+    # One buffered write for the whole report instead of one echo (and flush) per output.
+    messages = [f"[SUCCESS] Generated {output}" for output in result.chapter_outputs]
     if result.main_output is not None:
-        typer.echo(f"[SUCCESS] Generated {result.main_output.name}")
+        messages.append(f"[SUCCESS] Generated {result.main_output.name}")
+    if messages:
+        typer.echo("\n".join(messages))
 
 
 @app.command("convert-file")
@@ -105,13 +118,17 @@ def convert_file(
     """
     Convert a single Markdown file to LaTeX and write to stdout or a file.
     """
-    config_data = load_yaml_spec(config_path) if config_path else {}
-    if config_data is None:
-        config_data = {}
-    config = ConversionConfig.from_dict(config_data)
-    if not has_anchor_override(config_data):
-        config = config.with_overrides({"headings": {"anchor_level": anchor_level}})
-    latex_text = api_convert_file(input_path, output_path, config=config)
+    from loretex.api import convert_file as api_convert_file
+    from loretex.conversion.config import has_anchor_override
+    from loretex.utils.io import load_yaml_spec
+
+    config_data = (load_yaml_spec(config_path) if config_path else None) or {}
+    headings = config_data.get("headings", {})
+    # Anything but a mapping is passed through as is, so the config reports it as invalid.
+    if isinstance(headings, Mapping) and not has_anchor_override(config_data):
+        config_data = {**config_data, "headings": {**headings, "anchor_level": anchor_level}}
+    # Passed as a mapping so the API coerces it through its config cache.
+    latex_text = api_convert_file(input_path, output_path, config=config_data)
 
     if output_path is None:
         typer.echo(latex_text)
@@ -15,18 +15,18 @@ Chapter
 
 Notes
 -----
-All classes are implemented using the `attrs` library for conciseness, immutability, and built-in
-type validation. Construction from raw dictionaries is supported via class methods.
+All classes are frozen, slotted standard-library dataclasses. Validation happens in the class
+methods that construct them from raw dictionaries.
 
 See Also
 --------
-attrs. https://www.attrs.org/en/stable/
-    Library for creating classes with automatic attribute management and validation.
+dataclasses. https://docs.python.org/3/library/dataclasses.html
+    Standard-library module for creating classes with automatic attribute management.
 """
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List
 
-import attr
 from loretex.config.exceptions import SpecValidationError
 
 # Presentation defaults for template assembly (Fix 6: centralised here, not in api.py)
@@ -34,8 +34,40 @@ DEFAULT_DOCUMENT_FONT: str = r"\renewcommand{\familydefault}{\sfdefault}"
 DEFAULT_CALLOUT_TITLE_FONT: str = r"\sffamily\bfseries"
 DEFAULT_CALLOUT_BODY_FONT: str = r"\sffamily"
 
-
-@attr.s(auto_attribs=True, frozen=True)
+# Validation tables, built once at import rather than on every spec/chapter parsed
+_CHAPTER_KEYS = frozenset({"file", "anchor_level", "conversion", "options", "rules", "output"})
+_SPEC_KEYS = frozenset(
+    {
+        "output_dir",
+        "anchor_level",
+        "chapters",
+        "conversion",
+        "rules",
+        "template",
+        "main_output",
+        "template_vars",
+        "bibliography",
+        "title",
+        "author",
+        "date",
+        "callout_title_font",
+        "callout_body_font",
+        "document_font",
+    }
+)
+_CHAPTER_OPTION_ALIASES = ("conversion", "options", "rules")
+_SPEC_CONVERSION_ALIASES = ("conversion", "rules")
+_OPTIONAL_STRING_KEYS = (
+    "title",
+    "author",
+    "date",
+    "callout_title_font",
+    "callout_body_font",
+    "document_font",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Chapter:
     """
     Structured representation of a single Markdown-to-LaTeX conversion unit.
@@ -92,20 +124,13 @@ class Chapter:
             raise SpecValidationError("Chapter entries must be dictionaries.")
         if "file" not in chapter_dict or not isinstance(chapter_dict["file"], str):
             raise SpecValidationError("Each chapter requires a string 'file' path.")
-        allowed_keys = {"file", "anchor_level", "conversion", "options", "rules", "output"}
-        unknown = sorted(key for key in chapter_dict if key not in allowed_keys)
+        unknown = sorted(chapter_dict.keys() - _CHAPTER_KEYS)
         if unknown:
             raise SpecValidationError(f"Unknown chapter key(s): {', '.join(unknown)}")
 
         source_ref = Path(chapter_dict["file"])
         md = _resolve_spec_path(source_ref, base_dir)
-        options = chapter_dict.get("conversion")
-        if options is None:
-            options = chapter_dict.get("options")
-        if options is None:
-            options = chapter_dict.get("rules")
-        if options is None:
-            options = {}
+        options = _first_alias(chapter_dict, _CHAPTER_OPTION_ALIASES)
         if not isinstance(options, dict):
             raise SpecValidationError("Chapter conversion options must be a dictionary.")
         local_anchor = chapter_dict.get("anchor_level", default_anchor)
@@ -117,7 +142,7 @@ class Chapter:
         tex_output = (
             _resolve_output_path(Path(output_ref), output_dir)
             if output_ref is not None
-            else output_dir / _default_output_relpath(source_ref)
+            else _default_output_path(source_ref, output_dir)
         )
         return cls(
             md_path=md,
@@ -127,7 +152,7 @@ class Chapter:
         )
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpecParams:
     """
     Structured representation of a YAML specification file.
@@ -202,24 +227,7 @@ class SpecParams:
         if not isinstance(spec, dict):
             raise SpecValidationError("Spec must be a dictionary.")
 
-        allowed_keys = {
-            "output_dir",
-            "anchor_level",
-            "chapters",
-            "conversion",
-            "rules",
-            "template",
-            "main_output",
-            "template_vars",
-            "bibliography",
-            "title",
-            "author",
-            "date",
-            "callout_title_font",
-            "callout_body_font",
-            "document_font",
-        }
-        unknown_keys = sorted(key for key in spec if key not in allowed_keys)
+        unknown_keys = sorted(spec.keys() - _SPEC_KEYS)
         if unknown_keys:
             raise SpecValidationError(f"Unknown spec key(s): {', '.join(unknown_keys)}")
 
@@ -230,11 +238,7 @@ class SpecParams:
         anchor_level = spec.get("anchor_level", 1)
         if not isinstance(anchor_level, int):
             raise SpecValidationError("anchor_level must be an integer.")
-        conversion = spec.get("conversion")
-        if conversion is None:
-            conversion = spec.get("rules")
-        if conversion is None:
-            conversion = {}
+        conversion = _first_alias(spec, _SPEC_CONVERSION_ALIASES)
         if not isinstance(conversion, dict):
             raise SpecValidationError("Spec conversion rules must be a dictionary.")
         template_path = spec.get("template")
@@ -257,22 +261,10 @@ class SpecParams:
             bibliography = "\n".join(str(item) for item in bibliography)
         if bibliography is not None and not isinstance(bibliography, str):
             raise SpecValidationError("bibliography must be a string or list of strings.")
-        title = spec.get("title")
-        author = spec.get("author")
-        date = spec.get("date")
-        callout_title_font = spec.get("callout_title_font")
-        callout_body_font = spec.get("callout_body_font")
-        document_font = spec.get("document_font")
-        for label, value in (
-            ("title", title),
-            ("author", author),
-            ("date", date),
-            ("callout_title_font", callout_title_font),
-            ("callout_body_font", callout_body_font),
-            ("document_font", document_font),
-        ):
+        optional_strings = {key: spec.get(key) for key in _OPTIONAL_STRING_KEYS}
+        for key, value in optional_strings.items():
             if value is not None and not isinstance(value, str):
-                raise SpecValidationError(f"{label} must be a string.")
+                raise SpecValidationError(f"{key} must be a string.")
         chapters_raw = spec.get("chapters", [])
         if not isinstance(chapters_raw, list):
             raise SpecValidationError("chapters must be a list.")
@@ -289,15 +281,15 @@ class SpecParams:
             main_output=main_output,
             template_vars=template_vars,
             bibliography=bibliography,
-            title=title,
-            author=author,
-            date=date,
-            callout_title_font=callout_title_font,
-            callout_body_font=callout_body_font,
-            document_font=document_font,
+            **optional_strings,
         )
 
 
+def _first_alias(data: dict, aliases: tuple[str, ...]) -> object:
+    # First non-null value among alias keys, in priority order (empty dict if none is set).
+    return next((value for key in aliases if (value := data.get(key)) is not None), {})
+
+
 def _resolve_spec_path(path: Path, base_dir: Path | None) -> Path:
     if path.is_absolute() or base_dir is None:
         return path
@@ -310,7 +302,9 @@ def _resolve_output_path(path: Path, output_dir: Path) -> Path:
     return output_dir / path
 
 
-def _default_output_relpath(source_ref: Path) -> Path:
-    if source_ref.is_absolute():
-        return Path(source_ref.name).with_suffix(".tex")
-    return source_ref.with_suffix(".tex")
+def _default_output_path(source_ref: Path, output_dir: Path) -> Path:
+    # One suffix swap and one join per chapter; absolute sources keep only their file name.
+    relative = source_ref.with_suffix(".tex")
+    if relative.is_absolute():
+        return output_dir / relative.name
+    return output_dir / relative
@@ -1,49 +1,60 @@
-"""Conversion engine public API."""
+"""Conversion engine public API.
 
-from .config import ConversionConfig, has_anchor_override
-from .engine import MarkdownToLaTeXConverter, convert_string
-from .exceptions import (
-    ConversionError,
-    InvalidCalloutError,
-    InvalidCodeFenceError,
-    InvalidHeadingError,
-    InvalidImageError,
-    InvalidListError,
-    LoretexError,
-    ParsingError,
-)
-from .generator import LaTeXGenerator
-from .inline import InlineTransformer
-from .registry import (
-    TransformRegistry,
-    clear_transforms,
-    get_default_registry,
-    get_transform,
-    list_transforms,
-    register_transform,
-    resolve_transforms,
-    restore_transforms,
-    snapshot_transforms,
-)
-from .nodes import (
-    Callout,
-    CodeBlock,
-    Document,
-    HorizontalRule,
-    Image,
-    List,
-    ListItem,
-    MathBlock,
-    Node,
-    NodeVisitor,
-    Paragraph,
-    Section,
-    Table,
-)
-from .parser import MarkdownParser
-from .transforms import Transform, apply_transforms
+Public names are resolved lazily on first access (PEP 562): importing one of them only loads the
+submodule that defines it, so e.g. ``from loretex.conversion import ConversionConfig`` does not
+import the parser, generator or inline transformer.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import ConversionConfig, has_anchor_override
+    from .engine import MarkdownToLaTeXConverter, convert_string
+    from .exceptions import (
+        ConversionError,
+        InvalidCalloutError,
+        InvalidCodeFenceError,
+        InvalidHeadingError,
+        InvalidImageError,
+        InvalidListError,
+        LoretexError,
+        ParsingError,
+    )
+    from .generator import LaTeXGenerator
+    from .inline import InlineTransformer
+    from .registry import (
+        TransformRegistry,
+        clear_transforms,
+        get_default_registry,
+        get_transform,
+        list_transforms,
+        register_transform,
+        resolve_transforms,
+        restore_transforms,
+        snapshot_transforms,
+    )
+    from .nodes import (
+        Callout,
+        CodeBlock,
+        Document,
+        HorizontalRule,
+        Image,
+        List,
+        ListItem,
+        MathBlock,
+        Node,
+        NodeVisitor,
+        Paragraph,
+        Section,
+        Table,
+    )
+    from .parser import MarkdownParser
+    from .transforms import Transform, apply_transforms, compose_transforms
 
-__all__ = [
+__all__ = (
     "Callout",
     "CodeBlock",
     "ConversionConfig",
@@ -74,6 +85,7 @@ __all__ = [
     "TransformRegistry",
     "apply_transforms",
     "clear_transforms",
+    "compose_transforms",
     "convert_string",
     "get_default_registry",
     "get_transform",
@@ -83,4 +95,61 @@ __all__ = [
     "resolve_transforms",
     "restore_transforms",
     "snapshot_transforms",
-]
+)
+
+_EXPORTS = {
+    "Callout": "nodes",
+    "CodeBlock": "nodes",
+    "ConversionConfig": "config",
+    "ConversionError": "exceptions",
+    "Document": "nodes",
+    "HorizontalRule": "nodes",
+    "Image": "nodes",
+    "InlineTransformer": "inline",
+    "InvalidCalloutError": "exceptions",
+    "InvalidCodeFenceError": "exceptions",
+    "InvalidHeadingError": "exceptions",
+    "InvalidImageError": "exceptions",
+    "InvalidListError": "exceptions",
+    "LaTeXGenerator": "generator",
+    "List": "nodes",
+    "ListItem": "nodes",
+    "LoretexError": "exceptions",
+    "MarkdownParser": "parser",
+    "MarkdownToLaTeXConverter": "engine",
+    "MathBlock": "nodes",
+    "Node": "nodes",
+    "NodeVisitor": "nodes",
+    "Paragraph": "nodes",
+    "ParsingError": "exceptions",
+    "Section": "nodes",
+    "Table": "nodes",
+    "Transform": "transforms",
+    "TransformRegistry": "registry",
+    "apply_transforms": "transforms",
+    "clear_transforms": "registry",
+    "compose_transforms": "transforms",
+    "convert_string": "engine",
+    "get_default_registry": "registry",
+    "get_transform": "registry",
+    "has_anchor_override": "config",
+    "list_transforms": "registry",
+    "register_transform": "registry",
+    "resolve_transforms": "registry",
+    "restore_transforms": "registry",
+    "snapshot_transforms": "registry",
+}
+"""Public name -> defining submodule (relative to this package)."""
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, fields
-from pathlib import Path
-from typing import Any, Mapping
-import warnings
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache, partial
+import os
+import re
+from string import Formatter
+from types import MappingProxyType
+from typing import Any, Callable, Hashable, Mapping, cast
 
 from .constants import (
     DEFAULT_CALLOUT_ENV_TEMPLATE,
@@ -18,16 +21,26 @@ from .constants import (
 
 
 def _deep_merge(base: Mapping[str, Any], override: Mapping[str, Any]) -> dict[str, Any]:
-    """Recursively merge override into base."""
+    """Recursively merge override into base (iteratively; nested mappings are copied)."""
     merged: dict[str, Any] = dict(base)
-    for key, value in override.items():
-        if isinstance(value, Mapping) and isinstance(merged.get(key), Mapping):
-            merged[key] = _deep_merge(merged[key], value)
-        else:
-            merged[key] = value
+    pending = [(merged, override)]
+    while pending:
+        target, source = pending.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if _is_mapping(value) and _is_mapping(current):
+                target[key] = nested = dict(cast(Mapping[str, Any], current))
+                pending.append((nested, value))
+            else:
+                target[key] = value
     return merged
 
 
+def _is_mapping(value: Any) -> bool:
+    # Plain dicts (YAML, literals, to_dict output) skip the Mapping ABC check.
+    return type(value) is dict or isinstance(value, Mapping)
+
+
 def _ensure_known_keys(
     data: Mapping[str, Any],
     *,
@@ -41,6 +54,11 @@ def _ensure_known_keys(
         raise ValueError(f"Unknown {context} key(s): {', '.join(unknown)}")
 
 
+def _init_field_names(cls: type) -> set[str]:
+    """Names of a config dataclass's constructor fields (private cached fields excluded)."""
+    return {f.name for f in fields(cls) if f.init}
+
+
 def _normalize_link_template(template: str) -> str:
     if "{url}" in template and "{{{url}}}" not in template:
         template = template.replace("{url}", "{{{url}}}")
@@ -53,23 +71,190 @@ def _normalize_link_template(template: str) -> str:
     return template
 
 
-@dataclass(frozen=True)
+_FORMATTER = Formatter()
+
+
+def _compile_template(template: str, **constants: Any) -> Callable[..., str]:
+    """
+    Compile a ``str.format`` template into a renderer taking keyword arguments.
+
+    Templates made only of literal text and plain named fields are split once into their
+    segments, so rendering is a single f-string concatenation instead of a ``format`` call
+    that re-parses the template. Fields given in ``constants`` are rendered into the literal
+    text up front. Anything else (positional fields, conversions, format specs, attribute or
+    index access, malformed braces) falls back to ``template.format`` with the constants
+    bound, which keeps its exact semantics and error behaviour.
+    """
+    fallback = partial(template.format, **constants) if constants else template.format
+    try:
+        parsed = list(_FORMATTER.parse(template))
+    except ValueError:
+        return fallback
+    # ``parse`` also splits at escaped braces, yielding field-less literal chunks.
+    segments: list[tuple[str, str]] = []
+    tail = ""
+    for literal, name, spec, conversion in parsed:
+        tail += literal
+        if name is None:
+            continue
+        if spec or conversion or not name.isidentifier():
+            return fallback
+        if name in constants:
+            tail += f"{constants[name]}"
+            continue
+        segments.append((tail, name))
+        tail = ""
+
+    if not segments:
+        return lambda **_values: tail
+    if len(segments) == 1:
+        ((prefix, name),) = segments
+
+        def render_one(**values: Any) -> str:
+            return f"{prefix}{values[name]}{tail}"
+
+        return render_one
+    if len(segments) == 2:
+        (prefix, first), (middle, second) = segments
+
+        def render_two(**values: Any) -> str:
+            return f"{prefix}{values[first]}{middle}{values[second]}{tail}"
+
+        return render_two
+
+    def render(**values: Any) -> str:
+        return "".join([f"{literal}{values[name]}" for literal, name in segments]) + tail
+
+    return render
+
+
+def _compile_link_template(template: str) -> Callable[..., str]:
+    return _compile_template(_normalize_link_template(template))
+
+
+def _store_as_dict(config: Any, name: str) -> None:
+    # Lookup tables are kept as plain dicts (or read-only views of one, like the shared
+    # defaults) so hot-path lookups never go through the Mapping ABC; other mappings passed
+    # by callers are copied once.
+    value = getattr(config, name)
+    if type(value) is not dict and type(value) is not MappingProxyType:
+        object.__setattr__(config, name, dict(value))
+
+
+def _reduce_config(config: Any) -> tuple[Any, tuple[Any, ...]]:
+    # Pickle by constructor fields only: compiled templates and other caches are rebuilt by
+    # __post_init__ on load, and read-only mapping views are sent as plain dicts.
+    return type(config), tuple(
+        dict(value) if type(value) is MappingProxyType else value
+        for value in (getattr(config, f.name) for f in fields(config) if f.init)
+    )
+
+
+# Shared read-only defaults, so default-constructed configs do not each copy the tables
+_DEFAULT_SECTION_COMMANDS: Mapping[int, str] = MappingProxyType(DEFAULT_SECTION_COMMANDS)
+_DEFAULT_TEXTTT_ESCAPE_MAP: Mapping[str, str] = MappingProxyType(DEFAULT_TEXTTT_ESCAPE_MAP)
+_DEFAULT_CUSTOM_MARKERS: Mapping[str, str] = MappingProxyType({"==": r"\textbf{{{text}}}"})
+_EMPTY_MAPPING: Mapping[Any, str] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
 class HeadingConfig:
     """Heading conversion rules."""
 
     anchor_level: int = 1
-    commands: Mapping[int, str] = field(default_factory=lambda: dict(DEFAULT_SECTION_COMMANDS))
+    commands: Mapping[int, str] = _DEFAULT_SECTION_COMMANDS
     fallback_command: str = "paragraph"
 
+    # Command for each relative level up to the highest configured one, built in __post_init__
+    _command_table: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    __reduce__ = _reduce_config
+
+    def __post_init__(self) -> None:
+        _store_as_dict(self, "commands")
+        levels = [key for key in self.commands if type(key) is int and 0 < key <= 32]
+        object.__setattr__(
+            self,
+            "_command_table",
+            tuple(
+                self.commands.get(level, self.fallback_command)
+                for level in range(max(levels, default=0) + 1)
+            ),
+        )
+
     def resolve_command(self, markdown_level: int) -> str:
         """Resolve Markdown heading level to a LaTeX command."""
         relative_level = markdown_level - self.anchor_level + 1
         if relative_level < 1:
             relative_level = 1
+        if relative_level < len(self._command_table):
+            return self._command_table[relative_level]
         return self.commands.get(relative_level, self.fallback_command)
 
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "HeadingConfig":
+        _ensure_known_keys(data, allowed=_init_field_names(cls), context="headings")
+        return cls(
+            anchor_level=int(data.get("anchor_level", 1)),
+            commands=_coerce_int_mapping(data.get("commands")),
+            fallback_command=_str(data.get("fallback_command", "paragraph")),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "anchor_level": self.anchor_level,
+            "commands": dict(self.commands),
+            "fallback_command": self.fallback_command,
+        }
+
 
-@dataclass(frozen=True)
+def _compile_normalization(
+    pairs: tuple[tuple[str, str], ...],
+) -> Callable[[str], str]:
+    """Build a function applying the replacement pairs in a single pass.
+
+    One alternation pass only equals replacing pair by pair when no pair can see another's
+    input or output, so pairs sharing characters, empty sources, and empty targets mixed
+    with multi-character sources fall back to sequential replaces.
+    """
+    if not pairs:
+        return str
+    independent = all(source for source, _ in pairs) and not (
+        # Deleting text can join its neighbours into a multi-character source.
+        any(not target for _, target in pairs) and any(len(source) > 1 for source, _ in pairs)
+    )
+    seen: set[str] = set()
+    for source, target in pairs:
+        if not independent or seen.intersection(source):
+            independent = False
+            break
+        seen.update(source)
+        seen.update(target)
+    if not independent:
+        def replace_each(text: str) -> str:
+            for source, target in pairs:
+                text = text.replace(source, target)
+            return text
+
+        return replace_each
+    replacements = dict(pairs)
+    if all(len(source) == 1 for source in replacements):
+        # The usual case (and the default table): one str.translate pass, no regex.
+        table = str.maketrans(replacements)
+
+        def translate(text: str) -> str:
+            return text.translate(table)
+
+        return translate
+    pattern = re.compile("|".join(map(re.escape, replacements)))
+
+    def replace_all(text: str) -> str:
+        return pattern.sub(lambda match: replacements[match.group(0)], text)
+
+    return replace_all
+
+
+@dataclass(frozen=True, slots=True)
 class InlineConfig:
     """Inline formatting rules."""
 
@@ -78,16 +263,71 @@ class InlineConfig:
     code_command: str = "texttt"
     line_break_command: str = "newline"
     inline_math_template: str = "${content}$"
-    custom_markers: Mapping[str, str] = field(
-        default_factory=lambda: {"==": r"\textbf{{{text}}}"}
-    )
-    texttt_escape_map: Mapping[str, str] = field(
-        default_factory=lambda: dict(DEFAULT_TEXTTT_ESCAPE_MAP)
-    )
+    custom_markers: Mapping[str, str] = _DEFAULT_CUSTOM_MARKERS
+    texttt_escape_map: Mapping[str, str] = _DEFAULT_TEXTTT_ESCAPE_MAP
     character_normalization: tuple[tuple[str, str], ...] = DEFAULT_CHARACTER_NORMALIZATION
 
+    # str.translate table for texttt_escape_map, built once in __post_init__
+    _texttt_table: dict[int, str] = field(init=False, repr=False, compare=False)
+    # character_normalization applier, built once in __post_init__
+    _normalize: Callable[[str], str] = field(init=False, repr=False, compare=False)
+
+    __reduce__ = _reduce_config
+
+    def __post_init__(self) -> None:
+        _store_as_dict(self, "custom_markers")
+        _store_as_dict(self, "texttt_escape_map")
+        # Escaping is per character, so multi-character keys could never match.
+        object.__setattr__(
+            self,
+            "_texttt_table",
+            str.maketrans(
+                {char: escape for char, escape in self.texttt_escape_map.items() if len(char) == 1}
+            ),
+        )
+        object.__setattr__(
+            self, "_normalize", _compile_normalization(self.character_normalization)
+        )
+
+    def escape_texttt(self, code: str) -> str:
+        """Escape LaTeX-sensitive characters for ``\\texttt{}`` in a single translate pass."""
+        return code.translate(self._texttt_table)
+
+    def normalize(self, text: str) -> str:
+        """Apply ``character_normalization`` to ``text``, equivalent to replacing pair by pair."""
+        return self._normalize(text)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "InlineConfig":
+        _ensure_known_keys(data, allowed=_init_field_names(cls), context="inline")
+        return cls(
+            bold_command=_str(data.get("bold_command", "textbf")),
+            italic_command=_str(data.get("italic_command", "textit")),
+            code_command=_str(data.get("code_command", "texttt")),
+            line_break_command=_str(data.get("line_break_command", "newline")),
+            inline_math_template=_str(data.get("inline_math_template", "${content}$")),
+            custom_markers=_coerce_str_mapping(data.get("custom_markers")),
+            texttt_escape_map=_coerce_str_mapping(data.get("texttt_escape_map"))
+            or _DEFAULT_TEXTTT_ESCAPE_MAP,
+            character_normalization=_coerce_pairs(
+                data.get("character_normalization", DEFAULT_CHARACTER_NORMALIZATION)
+            ),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "bold_command": self.bold_command,
+            "italic_command": self.italic_command,
+            "code_command": self.code_command,
+            "line_break_command": self.line_break_command,
+            "inline_math_template": self.inline_math_template,
+            "custom_markers": dict(self.custom_markers),
+            "texttt_escape_map": dict(self.texttt_escape_map),
+            "character_normalization": list(self.character_normalization),
+        }
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class LinkConfig:
     """Markdown link conversion rules."""
 
@@ -96,24 +336,52 @@ class LinkConfig:
     autolink_template: str = r"\url{{{url}}}"
     internal_ref_template: str = r"\ref{{{label}}}"
 
+    # Normalized, compiled templates, built once in __post_init__
+    _external: Callable[..., str] = field(init=False, repr=False, compare=False)
+    _url_only: Callable[..., str] = field(init=False, repr=False, compare=False)
+    _autolink: Callable[..., str] = field(init=False, repr=False, compare=False)
+    _internal: Callable[..., str] = field(init=False, repr=False, compare=False)
+
+    __reduce__ = _reduce_config
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_external", _compile_link_template(self.external_link_template))
+        object.__setattr__(self, "_url_only", _compile_link_template(self.url_only_template))
+        object.__setattr__(self, "_autolink", _compile_link_template(self.autolink_template))
+        object.__setattr__(self, "_internal", _compile_link_template(self.internal_ref_template))
+
     def format_external(self, url: str, text: str) -> str:
-        template = _normalize_link_template(self.external_link_template)
-        return template.format(url=url, text=text)
+        return self._external(url=url, text=text)
 
     def format_url_only(self, url: str) -> str:
-        template = _normalize_link_template(self.url_only_template)
-        return template.format(url=url)
+        return self._url_only(url=url)
 
     def format_autolink(self, url: str) -> str:
-        template = _normalize_link_template(self.autolink_template)
-        return template.format(url=url)
+        return self._autolink(url=url)
 
     def format_internal(self, label: str) -> str:
-        template = _normalize_link_template(self.internal_ref_template)
-        return template.format(label=label)
+        return self._internal(label=label)
 
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "LinkConfig":
+        _ensure_known_keys(data, allowed=_init_field_names(cls), context="links")
+        return cls(
+            external_link_template=_str(data.get("external_link_template", r"\href{url}{text}")),
+            url_only_template=_str(data.get("url_only_template", r"\url{url}")),
+            autolink_template=_str(data.get("autolink_template", r"\url{url}")),
+            internal_ref_template=_str(data.get("internal_ref_template", r"\ref{{{label}}}")),
+        )
 
-@dataclass(frozen=True)
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "external_link_template": self.external_link_template,
+            "url_only_template": self.url_only_template,
+            "autolink_template": self.autolink_template,
+            "internal_ref_template": self.internal_ref_template,
+        }
+
+
+@dataclass(frozen=True, slots=True)
 class CitationConfig:
     """Markdown citation conversion rules."""
 
@@ -122,29 +390,76 @@ class CitationConfig:
     separator: str = ","
     multi_cite_separator: str = " "
 
+    # Normalized, compiled templates, built once in __post_init__
+    _cite: Callable[..., str] = field(init=False, repr=False, compare=False)
+    _cite_with_locator: Callable[..., str] = field(init=False, repr=False, compare=False)
+
+    __reduce__ = _reduce_config
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_cite", _compile_link_template(self.cite_template))
+        object.__setattr__(
+            self, "_cite_with_locator", _compile_link_template(self.cite_with_locator_template)
+        )
+
     def format_citation(self, keys: list[str]) -> str:
-        template = _normalize_link_template(self.cite_template)
         joined = self.separator.join(keys)
-        return template.format(keys=joined)
+        return self._cite(keys=joined)
 
     def format_citation_with_locator(self, keys: list[str], locator: str) -> str:
-        template = _normalize_link_template(self.cite_with_locator_template)
         joined = self.separator.join(keys)
-        return template.format(keys=joined, locator=locator)
+        return self._cite_with_locator(keys=joined, locator=locator)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "CitationConfig":
+        _ensure_known_keys(data, allowed=_init_field_names(cls), context="citations")
+        return cls(
+            cite_template=_str(data.get("cite_template", r"\cite{{{keys}}}")),
+            cite_with_locator_template=_str(
+                data.get("cite_with_locator_template", r"\cite[{locator}]{{{keys}}}")
+            ),
+            separator=_str(data.get("separator", ",")),
+            multi_cite_separator=_str(data.get("multi_cite_separator", " ")),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "cite_template": self.cite_template,
+            "cite_with_locator_template": self.cite_with_locator_template,
+            "separator": self.separator,
+            "multi_cite_separator": self.multi_cite_separator,
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FootnoteConfig:
     """Markdown footnote conversion rules."""
 
     footnote_template: str = r"\footnote{{{text}}}"
 
+    # Normalized, compiled template, built once in __post_init__
+    _footnote: Callable[..., str] = field(init=False, repr=False, compare=False)
+
+    __reduce__ = _reduce_config
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_footnote", _compile_link_template(self.footnote_template))
+
     def format_footnote(self, text: str) -> str:
-        template = _normalize_link_template(self.footnote_template)
-        return template.format(text=text)
+        return self._footnote(text=text)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "FootnoteConfig":
+        _ensure_known_keys(data, allowed=_init_field_names(cls), context="footnotes")
+        return cls(
+            footnote_template=_str(data.get("footnote_template", r"\footnote{{{text}}}")),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"footnote_template": self.footnote_template}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImageConfig:
     """Image conversion rules."""
 
@@ -156,38 +471,102 @@ class ImageConfig:
     base_dir: str | None = None
     validate_paths: bool = False
 
-    def format_block(self, source_path: str, width_px: int) -> str:
+    # Stripped path prefix and block_template compiled with every field except width and
+    # source already rendered in, built once in __post_init__
+    _path_prefix: str = field(init=False, repr=False, compare=False)
+    _block: Callable[..., str] = field(init=False, repr=False, compare=False)
+
+    __reduce__ = _reduce_config
+
+    def __post_init__(self) -> None:
         include_command = self.include_command
         if not include_command.startswith("\\"):
             include_command = f"\\{include_command}"
+        path_prefix = self.path_prefix.rstrip("/")
+        object.__setattr__(self, "_path_prefix", path_prefix)
+        object.__setattr__(
+            self,
+            "_block",
+            _compile_template(
+                self.block_template,
+                include_command=include_command,
+                unit=self.width_unit,
+                path_prefix=path_prefix,
+                path_suffix=self.path_suffix,
+            ),
+        )
+
+    def format_block(self, source_path: str, width_px: int) -> str:
         if self.validate_paths:
-            base = Path(self.base_dir) if self.base_dir else None
-            prefix = self.path_prefix.rstrip("/")
-            filename = f"{source_path}{self.path_suffix}"
-            target = Path(prefix) / filename
-            if base:
-                target = base / target
-            if not target.exists():
+            target = os.path.join(self._path_prefix, f"{source_path}{self.path_suffix}")
+            if self.base_dir:
+                target = os.path.join(self.base_dir, target)
+            if not _path_exists(target):
+                import warnings  # only needed when validation finds a missing image
+
                 warnings.warn(f"Image not found: {target}", stacklevel=2)
-        return self.block_template.format(
-            include_command=include_command,
-            width=width_px,
-            unit=self.width_unit,
-            path_prefix=self.path_prefix.rstrip("/"),
-            source=source_path,
-            path_suffix=self.path_suffix,
+        return self._block(width=width_px, source=source_path)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ImageConfig":
+        _ensure_known_keys(data, allowed=_init_field_names(cls), context="images")
+        return cls(
+            path_prefix=_str(data.get("path_prefix", DEFAULT_FIGURES_PDF_PATH)),
+            path_suffix=_str(data.get("path_suffix", ".pdf")),
+            width_unit=_str(data.get("width_unit", r"\htmlpx")),
+            include_command=_str(data.get("include_command", r"\includegraphics")),
+            block_template=_str(data.get("block_template", DEFAULT_IMAGE_BLOCK_TEMPLATE)),
+            base_dir=data.get("base_dir"),
+            validate_paths=bool(data.get("validate_paths", False)),
         )
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "path_prefix": self.path_prefix,
+            "path_suffix": self.path_suffix,
+            "width_unit": self.width_unit,
+            "include_command": self.include_command,
+            "block_template": self.block_template,
+            "base_dir": self.base_dir,
+            "validate_paths": self.validate_paths,
+        }
+
+
+@lru_cache(maxsize=4096)
+def _path_exists(path: str) -> bool:
+    # Images are usually referenced repeatedly within a document; stat each path only once.
+    # The converter clears this cache before each document (see ``clear_image_path_cache``).
+    return os.path.exists(path)
+
 
-@dataclass(frozen=True)
+def clear_image_path_cache() -> None:
+    """Forget cached image existence checks, so files created or removed since are seen."""
+    _path_exists.cache_clear()
+
+
+@dataclass(frozen=True, slots=True)
 class ListConfig:
     """List environment rules."""
 
     unordered_environment: str = "itemize"
     ordered_environment: str = "enumerate"
 
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ListConfig":
+        _ensure_known_keys(data, allowed=_init_field_names(cls), context="lists")
+        return cls(
+            unordered_environment=_str(data.get("unordered_environment", "itemize")),
+            ordered_environment=_str(data.get("ordered_environment", "enumerate")),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "unordered_environment": self.unordered_environment,
+            "ordered_environment": self.ordered_environment,
+        }
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CodeBlockConfig:
     """Code block environment rules."""
 
@@ -205,8 +584,22 @@ class CodeBlockConfig:
     def end(self) -> str:
         return f"\\end{{{self.environment}}}"
 
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "CodeBlockConfig":
+        _ensure_known_keys(data, allowed=_init_field_names(cls), context="code_blocks")
+        return cls(
+            environment=_str(data.get("environment", "lstlisting")),
+            options_template=data.get("options_template"),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "environment": self.environment,
+            "options_template": self.options_template,
+        }
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HorizontalRuleConfig:
     """Horizontal rule rendering rules."""
 
@@ -215,16 +608,37 @@ class HorizontalRuleConfig:
     def render(self) -> str:
         return self.template
 
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any] | str) -> "HorizontalRuleConfig":
+        # Accepts either the template itself or a mapping holding it.
+        if isinstance(data, Mapping):
+            return cls(template=_str(data.get("template", r"\hrule")))
+        return cls(template=_str(data))
 
-@dataclass(frozen=True)
+    def to_dict(self) -> dict[str, Any]:
+        return {"template": self.template}
+
+
+@dataclass(frozen=True, slots=True)
 class CalloutConfig:
     """Callout conversion rules."""
 
-    environment_map: Mapping[str, str] = field(default_factory=dict)
+    environment_map: Mapping[str, str] = _EMPTY_MAPPING
     default_environment_template: str = DEFAULT_CALLOUT_ENV_TEMPLATE
     title_template: str | None = "[{title}]"
     type_normalization: str = "lower"
 
+    # Compiled default_environment_template, built once in __post_init__
+    _default_environment: Callable[..., str] = field(init=False, repr=False, compare=False)
+
+    __reduce__ = _reduce_config
+
+    def __post_init__(self) -> None:
+        _store_as_dict(self, "environment_map")
+        object.__setattr__(
+            self, "_default_environment", _compile_template(self.default_environment_template)
+        )
+
     def normalize_type(self, callout_type: str) -> str:
         if self.type_normalization == "lower":
             return callout_type.lower()
@@ -234,14 +648,36 @@ class CalloutConfig:
 
     def resolve_environment(self, callout_type: str) -> str:
         normalized = self.normalize_type(callout_type)
-        if normalized in self.environment_map:
-            return self.environment_map[normalized]
-        if callout_type in self.environment_map:
-            return self.environment_map[callout_type]
-        return self.default_environment_template.format(type=normalized)
+        # Values are coerced to str, so None can only mean the key is absent.
+        environment: str | None = self.environment_map.get(normalized)
+        if environment is None:
+            environment = self.environment_map.get(callout_type)
+        if environment is None:
+            return self._default_environment(type=normalized)
+        return environment
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "CalloutConfig":
+        _ensure_known_keys(data, allowed=_init_field_names(cls), context="callouts")
+        return cls(
+            environment_map=_coerce_str_mapping(data.get("environment_map")),
+            default_environment_template=_str(
+                data.get("default_environment_template", DEFAULT_CALLOUT_ENV_TEMPLATE)
+            ),
+            title_template=data.get("title_template", "[{title}]"),
+            type_normalization=_str(data.get("type_normalization", "lower")),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "environment_map": dict(self.environment_map),
+            "default_environment_template": self.default_environment_template,
+            "title_template": self.title_template,
+            "type_normalization": self.type_normalization,
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TableConfig:
     """Table rendering rules."""
 
@@ -250,15 +686,43 @@ class TableConfig:
     multicolumn_align: str = "c"
     multirow_command: str = "multirow"
 
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "TableConfig":
+        _ensure_known_keys(data, allowed=_init_field_names(cls), context="tables")
+        return cls(
+            environment=_str(data.get("environment", "tabular")),
+            include_hlines=bool(data.get("include_hlines", True)),
+            multicolumn_align=_str(data.get("multicolumn_align", "c")),
+            multirow_command=_str(data.get("multirow_command", "multirow")),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "environment": self.environment,
+            "include_hlines": self.include_hlines,
+            "multicolumn_align": self.multicolumn_align,
+            "multirow_command": self.multirow_command,
+        }
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParsingConfig:
     """Parsing behavior options."""
 
     strip_yaml_front_matter: bool = False
 
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ParsingConfig":
+        _ensure_known_keys(data, allowed=_init_field_names(cls), context="parsing")
+        return cls(
+            strip_yaml_front_matter=bool(data.get("strip_yaml_front_matter", False)),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"strip_yaml_front_matter": self.strip_yaml_front_matter}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MathConfig:
     """Math conversion rules."""
 
@@ -269,8 +733,16 @@ class MathConfig:
             return f"\\[{content}\\]"
         return f"$${content}$$"
 
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "MathConfig":
+        _ensure_known_keys(data, allowed=_init_field_names(cls), context="math")
+        return cls(block_style=_str(data.get("block_style", "dollars")))
 
-@dataclass(frozen=True)
+    def to_dict(self) -> dict[str, Any]:
+        return {"block_style": self.block_style}
+
+
+@dataclass(frozen=True, slots=True)
 class LabelConfig:
     """Heading label generation rules."""
 
@@ -279,8 +751,26 @@ class LabelConfig:
     label_prefix: str = ""
     label_separator: str = "-"
 
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "LabelConfig":
+        _ensure_known_keys(data, allowed=_init_field_names(cls), context="labels")
+        return cls(
+            auto_label_headings=bool(data.get("auto_label_headings", False)),
+            label_template=_str(data.get("label_template", r"\label{{{label}}}")),
+            label_prefix=_str(data.get("label_prefix", "")),
+            label_separator=_str(data.get("label_separator", "-")),
+        )
 
-@dataclass(frozen=True)
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "auto_label_headings": self.auto_label_headings,
+            "label_template": self.label_template,
+            "label_prefix": self.label_prefix,
+            "label_separator": self.label_separator,
+        }
+
+
+@dataclass(frozen=True, slots=True)
 class WikiLinkConfig:
     """Wiki-link conversion rules."""
 
@@ -288,16 +778,40 @@ class WikiLinkConfig:
     alias_template: str = r"\ref{{{label}}}"
     label_separator: str = "-"
 
+    # Normalized, compiled templates, built once in __post_init__
+    _link: Callable[..., str] = field(init=False, repr=False, compare=False)
+    _alias: Callable[..., str] = field(init=False, repr=False, compare=False)
+
+    __reduce__ = _reduce_config
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_link", _compile_link_template(self.link_template))
+        object.__setattr__(self, "_alias", _compile_link_template(self.alias_template))
+
     def format_link(self, label: str) -> str:
-        template = _normalize_link_template(self.link_template)
-        return template.format(label=label)
+        return self._link(label=label)
 
     def format_alias(self, label: str, _alias: str) -> str:
-        template = _normalize_link_template(self.alias_template)
-        return template.format(label=label)
+        return self._alias(label=label)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "WikiLinkConfig":
+        _ensure_known_keys(data, allowed=_init_field_names(cls), context="wiki_links")
+        return cls(
+            link_template=_str(data.get("link_template", r"\ref{{{label}}}")),
+            alias_template=_str(data.get("alias_template", r"\ref{{{label}}}")),
+            label_separator=_str(data.get("label_separator", "-")),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "link_template": self.link_template,
+            "alias_template": self.alias_template,
+            "label_separator": self.label_separator,
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConversionConfig:
     """Aggregate configuration for Markdown-to-LaTeX conversion."""
 
@@ -317,6 +831,17 @@ class ConversionConfig:
     labels: LabelConfig = field(default_factory=LabelConfig)
     wiki_links: WikiLinkConfig = field(default_factory=WikiLinkConfig)
 
+    # Configs derived by with_overrides, keyed by config_cache_key(overrides)
+    _overrides_cache: dict[Hashable, ConversionConfig] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Section to_dict() results used as merge bases by with_overrides (never handed out)
+    _section_dicts: dict[str, dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    __reduce__ = _reduce_config
+
     @classmethod
     def from_dict(cls, data: Mapping[str, Any] | None) -> "ConversionConfig":
         if not data:
@@ -324,360 +849,148 @@ class ConversionConfig:
         if not isinstance(data, Mapping):
             raise TypeError("ConversionConfig data must be a mapping.")
 
-        section_aliases = {"list": "lists", "code-blocks": "code_blocks"}
         _ensure_known_keys(
             data,
-            allowed={field.name for field in fields(cls)},
-            aliases=section_aliases,
+            allowed=_init_field_names(cls),
+            aliases=_SECTION_ALIASES,
             context="conversion",
         )
-
-        headings_data = data.get("headings", {})
-        inline_data = data.get("inline", {})
-        links_data = data.get("links", {})
-        citations_data = data.get("citations", {})
-        footnotes_data = data.get("footnotes", {})
-        images_data = data.get("images", {})
-        lists_data = data.get("lists", data.get("list", {}))
-        code_blocks_data = data.get("code_blocks", data.get("code-blocks", {}))
-        callouts_data = data.get("callouts", {})
-        tables_data = data.get("tables", {})
-        parsing_data = data.get("parsing", {})
-        math_data = data.get("math", {})
-        labels_data = data.get("labels", {})
-        wiki_links_data = data.get("wiki_links", {})
-
-        _ensure_known_keys(
-            headings_data,
-            allowed={field.name for field in fields(HeadingConfig)},
-            context="headings",
-        )
-        _ensure_known_keys(
-            inline_data,
-            allowed={field.name for field in fields(InlineConfig)},
-            context="inline",
-        )
-        _ensure_known_keys(
-            links_data,
-            allowed={field.name for field in fields(LinkConfig)},
-            context="links",
-        )
-        _ensure_known_keys(
-            citations_data,
-            allowed={field.name for field in fields(CitationConfig)},
-            context="citations",
-        )
-        _ensure_known_keys(
-            footnotes_data,
-            allowed={field.name for field in fields(FootnoteConfig)},
-            context="footnotes",
-        )
-        _ensure_known_keys(
-            images_data,
-            allowed={field.name for field in fields(ImageConfig)},
-            context="images",
-        )
-        _ensure_known_keys(
-            lists_data,
-            allowed={field.name for field in fields(ListConfig)},
-            context="lists",
-        )
-        _ensure_known_keys(
-            code_blocks_data,
-            allowed={field.name for field in fields(CodeBlockConfig)},
-            context="code_blocks",
-        )
-        _ensure_known_keys(
-            callouts_data,
-            allowed={field.name for field in fields(CalloutConfig)},
-            context="callouts",
-        )
-        _ensure_known_keys(
-            tables_data,
-            allowed={field.name for field in fields(TableConfig)},
-            context="tables",
-        )
-        _ensure_known_keys(
-            parsing_data,
-            allowed={field.name for field in fields(ParsingConfig)},
-            context="parsing",
-        )
-        _ensure_known_keys(
-            math_data,
-            allowed={field.name for field in fields(MathConfig)},
-            context="math",
-        )
-        _ensure_known_keys(
-            labels_data,
-            allowed={field.name for field in fields(LabelConfig)},
-            context="labels",
-        )
-        _ensure_known_keys(
-            wiki_links_data,
-            allowed={field.name for field in fields(WikiLinkConfig)},
-            context="wiki_links",
-        )
-
-        headings = HeadingConfig(
-            anchor_level=int(headings_data.get("anchor_level", 1)),
-            commands=_coerce_int_mapping(headings_data.get("commands")),
-            fallback_command=str(headings_data.get("fallback_command", "paragraph")),
-        )
-
-        inline = InlineConfig(
-            bold_command=str(inline_data.get("bold_command", "textbf")),
-            italic_command=str(inline_data.get("italic_command", "textit")),
-            code_command=str(inline_data.get("code_command", "texttt")),
-            line_break_command=str(inline_data.get("line_break_command", "newline")),
-            inline_math_template=str(
-                inline_data.get("inline_math_template", "${content}$")
-            ),
-            custom_markers=_coerce_str_mapping(inline_data.get("custom_markers")),
-            texttt_escape_map=_coerce_str_mapping(
-                inline_data.get("texttt_escape_map")
-            )
-            or dict(DEFAULT_TEXTTT_ESCAPE_MAP),
-            character_normalization=tuple(
-                tuple(pair)
-                for pair in inline_data.get("character_normalization", DEFAULT_CHARACTER_NORMALIZATION)
-            ),
-        )
-
-        links = LinkConfig(
-            external_link_template=str(
-                links_data.get("external_link_template", r"\href{url}{text}")
-            ),
-            url_only_template=str(
-                links_data.get("url_only_template", r"\url{url}")
-            ),
-            autolink_template=str(
-                links_data.get("autolink_template", r"\url{url}")
-            ),
-            internal_ref_template=str(
-                links_data.get("internal_ref_template", r"\ref{{{label}}}")
-            ),
-        )
-
-        citations = CitationConfig(
-            cite_template=str(
-                citations_data.get("cite_template", r"\cite{{{keys}}}")
-            ),
-            cite_with_locator_template=str(
-                citations_data.get(
-                    "cite_with_locator_template",
-                    r"\cite[{locator}]{{{keys}}}",
-                )
-            ),
-            separator=str(citations_data.get("separator", ",")),
-            multi_cite_separator=str(citations_data.get("multi_cite_separator", " ")),
-        )
-
-        footnotes = FootnoteConfig(
-            footnote_template=str(
-                footnotes_data.get("footnote_template", r"\footnote{{{text}}}")
-            ),
-        )
-
-        images = ImageConfig(
-            path_prefix=str(images_data.get("path_prefix", DEFAULT_FIGURES_PDF_PATH)),
-            path_suffix=str(images_data.get("path_suffix", ".pdf")),
-            width_unit=str(images_data.get("width_unit", r"\htmlpx")),
-            include_command=str(images_data.get("include_command", r"\includegraphics")),
-            block_template=str(
-                images_data.get(
-                    "block_template",
-                    DEFAULT_IMAGE_BLOCK_TEMPLATE,
-                )
-            ),
-            base_dir=images_data.get("base_dir"),
-            validate_paths=bool(images_data.get("validate_paths", False)),
-        )
-
-        lists = ListConfig(
-            unordered_environment=str(
-                lists_data.get("unordered_environment", "itemize")
-            ),
-            ordered_environment=str(lists_data.get("ordered_environment", "enumerate")),
-        )
-
-        code_blocks = CodeBlockConfig(
-            environment=str(code_blocks_data.get("environment", "lstlisting")),
-            options_template=code_blocks_data.get("options_template"),
-        )
-
-        hr_data = data.get("horizontal_rule", r"\hrule")
-        if isinstance(hr_data, Mapping):
-            hr_template = str(hr_data.get("template", r"\hrule"))
-        else:
-            hr_template = str(hr_data)
-        horizontal_rule = HorizontalRuleConfig(template=hr_template)
-
-        callouts = CalloutConfig(
-            environment_map=_coerce_str_mapping(callouts_data.get("environment_map")),
-            default_environment_template=str(
-                callouts_data.get("default_environment_template", DEFAULT_CALLOUT_ENV_TEMPLATE)
-            ),
-            title_template=callouts_data.get("title_template", "[{title}]"),
-            type_normalization=str(callouts_data.get("type_normalization", "lower")),
-        )
-
-        tables = TableConfig(
-            environment=str(tables_data.get("environment", "tabular")),
-            include_hlines=bool(tables_data.get("include_hlines", True)),
-            multicolumn_align=str(tables_data.get("multicolumn_align", "c")),
-            multirow_command=str(tables_data.get("multirow_command", "multirow")),
-        )
-
-        return cls(
-            headings=headings,
-            inline=inline,
-            links=links,
-            citations=citations,
-            footnotes=footnotes,
-            images=images,
-            lists=lists,
-            code_blocks=code_blocks,
-            horizontal_rule=horizontal_rule,
-            callouts=callouts,
-            tables=tables,
-            parsing=ParsingConfig(
-                strip_yaml_front_matter=bool(
-                    parsing_data.get("strip_yaml_front_matter", False)
-                )
-            ),
-            math=MathConfig(
-                block_style=str(math_data.get("block_style", "dollars"))
-            ),
-            labels=LabelConfig(
-                auto_label_headings=bool(
-                    labels_data.get("auto_label_headings", False)
-                ),
-                label_template=str(
-                    labels_data.get("label_template", r"\label{{{label}}}")
-                ),
-                label_prefix=str(labels_data.get("label_prefix", "")),
-                label_separator=str(labels_data.get("label_separator", "-")),
-            ),
-            wiki_links=WikiLinkConfig(
-                link_template=str(
-                    wiki_links_data.get("link_template", r"\ref{{{label}}}")
-                ),
-                alias_template=str(
-                    wiki_links_data.get("alias_template", r"\ref{{{label}}}")
-                ),
-                label_separator=str(
-                    wiki_links_data.get("label_separator", "-")
-                ),
-            ),
-        )
+        sections = {}
+        for name, section_type in _SECTION_TYPES.items():
+            section_data = data.get(name, _MISSING)
+            if section_data is _MISSING:
+                alias = _SECTION_ALIAS_BY_NAME.get(name)
+                section_data = data.get(alias, {}) if alias else {}
+            sections[name] = section_type.from_dict(section_data)
+        return cls(**sections)
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "headings": {
-                "anchor_level": self.headings.anchor_level,
-                "commands": dict(self.headings.commands),
-                "fallback_command": self.headings.fallback_command,
-            },
-            "inline": {
-                "bold_command": self.inline.bold_command,
-                "italic_command": self.inline.italic_command,
-                "code_command": self.inline.code_command,
-                "line_break_command": self.inline.line_break_command,
-                "inline_math_template": self.inline.inline_math_template,
-                "custom_markers": dict(self.inline.custom_markers),
-                "texttt_escape_map": dict(self.inline.texttt_escape_map),
-                "character_normalization": list(self.inline.character_normalization),
-            },
-            "links": {
-                "external_link_template": self.links.external_link_template,
-                "url_only_template": self.links.url_only_template,
-                "autolink_template": self.links.autolink_template,
-                "internal_ref_template": self.links.internal_ref_template,
-            },
-            "citations": {
-                "cite_template": self.citations.cite_template,
-                "cite_with_locator_template": self.citations.cite_with_locator_template,
-                "separator": self.citations.separator,
-                "multi_cite_separator": self.citations.multi_cite_separator,
-            },
-            "footnotes": {
-                "footnote_template": self.footnotes.footnote_template,
-            },
-            "images": {
-                "path_prefix": self.images.path_prefix,
-                "path_suffix": self.images.path_suffix,
-                "width_unit": self.images.width_unit,
-                "include_command": self.images.include_command,
-                "block_template": self.images.block_template,
-                "base_dir": self.images.base_dir,
-                "validate_paths": self.images.validate_paths,
-            },
-            "lists": {
-                "unordered_environment": self.lists.unordered_environment,
-                "ordered_environment": self.lists.ordered_environment,
-            },
-            "code_blocks": {
-                "environment": self.code_blocks.environment,
-                "options_template": self.code_blocks.options_template,
-            },
-            "horizontal_rule": {
-                "template": self.horizontal_rule.template,
-            },
-            "callouts": {
-                "environment_map": dict(self.callouts.environment_map),
-                "default_environment_template": self.callouts.default_environment_template,
-                "title_template": self.callouts.title_template,
-                "type_normalization": self.callouts.type_normalization,
-            },
-            "tables": {
-                "environment": self.tables.environment,
-                "include_hlines": self.tables.include_hlines,
-                "multicolumn_align": self.tables.multicolumn_align,
-                "multirow_command": self.tables.multirow_command,
-            },
-            "parsing": {
-                "strip_yaml_front_matter": self.parsing.strip_yaml_front_matter,
-            },
-            "math": {
-                "block_style": self.math.block_style,
-            },
-            "labels": {
-                "auto_label_headings": self.labels.auto_label_headings,
-                "label_template": self.labels.label_template,
-                "label_prefix": self.labels.label_prefix,
-                "label_separator": self.labels.label_separator,
-            },
-            "wiki_links": {
-                "link_template": self.wiki_links.link_template,
-                "alias_template": self.wiki_links.alias_template,
-                "label_separator": self.wiki_links.label_separator,
-            },
-        }
+        return {name: getattr(self, name).to_dict() for name in _SECTION_TYPES}
 
     def with_overrides(self, overrides: Mapping[str, Any] | None) -> "ConversionConfig":
+        """Return this config with overrides deep-merged on top (memoized by override value)."""
         if not overrides:
             return self
-        merged = _deep_merge(self.to_dict(), overrides)
-        return ConversionConfig.from_dict(merged)
+        try:
+            key = config_cache_key(overrides)
+        except TypeError:
+            return self._apply_overrides(overrides)
+        cache = self._overrides_cache
+        derived = cache.get(key)
+        if derived is None:
+            derived = self._apply_overrides(overrides)
+            if len(cache) >= _OVERRIDES_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = derived
+        return derived
+
+    def _apply_overrides(self, overrides: Mapping[str, Any]) -> "ConversionConfig":
+        # Equivalent to from_dict(_deep_merge(to_dict(), overrides)), but only the sections
+        # named in overrides are merged and rebuilt; the others are shared with self.
+        _ensure_known_keys(
+            overrides,
+            allowed=_init_field_names(ConversionConfig),
+            aliases=_SECTION_ALIASES,
+            context="conversion",
+        )
+        changes = {}
+        for name, value in overrides.items():
+            section_type = _SECTION_TYPES.get(name)
+            if section_type is None:
+                # An alias key: the merged dict always holds the canonical key, which wins.
+                continue
+            if isinstance(value, Mapping):
+                value = _deep_merge(self._section_dict(name), value)
+            changes[name] = section_type.from_dict(value)
+        return replace(self, **changes)
+
+    def _section_dict(self, name: str) -> dict[str, Any]:
+        # Serialized once per config: _deep_merge copies whatever it merges into and the
+        # section from_dict methods copy their inputs, so the cached dict is never mutated.
+        data = self._section_dicts.get(name)
+        if data is None:
+            data = self._section_dicts[name] = getattr(self, name).to_dict()
+        return data
+
+
+_OVERRIDES_CACHE_SIZE = 32
+
+_SECTION_TYPES: dict[str, Any] = {
+    "headings": HeadingConfig,
+    "inline": InlineConfig,
+    "links": LinkConfig,
+    "citations": CitationConfig,
+    "footnotes": FootnoteConfig,
+    "images": ImageConfig,
+    "lists": ListConfig,
+    "code_blocks": CodeBlockConfig,
+    "horizontal_rule": HorizontalRuleConfig,
+    "callouts": CalloutConfig,
+    "tables": TableConfig,
+    "parsing": ParsingConfig,
+    "math": MathConfig,
+    "labels": LabelConfig,
+    "wiki_links": WikiLinkConfig,
+}
+"""Section configs of :class:`ConversionConfig`, by config key (in field order)."""
+
+_SECTION_ALIASES = {"list": "lists", "code-blocks": "code_blocks"}
+_SECTION_ALIAS_BY_NAME = {name: alias for alias, name in _SECTION_ALIASES.items()}
+_MISSING = object()
 
 
 def has_anchor_override(data: Mapping[str, Any]) -> bool:
     """Check whether a config mapping already specifies headings.anchor_level."""
     headings = data.get("headings")
+    if type(headings) is dict:  # plain dicts (YAML, literals) skip the ABC check
+        return "anchor_level" in headings
     return isinstance(headings, Mapping) and "anchor_level" in headings
 
 
-def _coerce_int_mapping(value: Any) -> dict[int, str]:
+def config_cache_key(data: Any) -> Hashable:
+    """Build a hashable key identifying (nested) config data by value.
+
+    Mappings keep their key order, which is significant (e.g. equal-length
+    ``inline.custom_markers`` are tried in insertion order); sequences compare irrespective
+    of list/tuple type, and scalars are tagged with their type so that e.g. ``1`` and
+    ``1.0`` stay distinct. Raises ``TypeError`` if a leaf value is unhashable.
+    """
+    if isinstance(data, Mapping):
+        return (
+            Mapping,
+            tuple((type(key), key, config_cache_key(value)) for key, value in data.items()),
+        )
+    if isinstance(data, (list, tuple)):
+        return tuple(config_cache_key(item) for item in data)
+    hash(data)
+    return (type(data), data)
+
+
+def _coerce_int_mapping(value: Any) -> Mapping[int, str]:
     if not value:
-        return dict(DEFAULT_SECTION_COMMANDS)
+        return _DEFAULT_SECTION_COMMANDS
     if not isinstance(value, Mapping):
         raise TypeError("Expected mapping for headings.commands")
-    return {int(key): str(val) for key, val in value.items()}
+    return {int(key): _str(val) for key, val in value.items()}
+
+
+def _coerce_pairs(value: Any) -> tuple[tuple[str, str], ...]:
+    # The default (like tuple data passed in from Python) already has the target shape.
+    if value is DEFAULT_CHARACTER_NORMALIZATION or (
+        type(value) is tuple and all(type(pair) is tuple for pair in value)
+    ):
+        return value
+    return tuple(tuple(pair) for pair in value)
+
+
+def _str(value: Any) -> str:
+    # Config values are nearly always strings already; skip the str() call for those.
+    return value if type(value) is str else str(value)
 
 
-def _coerce_str_mapping(value: Any) -> dict[str, str]:
+def _coerce_str_mapping(value: Any) -> Mapping[str, str]:
     if not value:
-        return {}
+        return _EMPTY_MAPPING
     if not isinstance(value, Mapping):
         raise TypeError("Expected mapping for environment maps")
-    return {str(key): str(val) for key, val in value.items()}
+    return {_str(key): _str(val) for key, val in value.items()}
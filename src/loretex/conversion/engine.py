@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
+import re
 from typing import Mapping
 
-from .config import ConversionConfig
+from .config import ConversionConfig, clear_image_path_cache
 from .generator import LaTeXGenerator
 from .inline import InlineTransformer
 from .parser import MarkdownParser
 from .registry import TransformRegistry, get_default_registry, resolve_transforms
-from .transforms import Transform, apply_transforms
+from .transforms import Transform, compose_transforms
 
 
 class MarkdownToLaTeXConverter:
@@ -27,6 +28,7 @@ class MarkdownToLaTeXConverter:
         self._config = config or ConversionConfig()
         self._parser = parser or MarkdownParser()
         self._generator = generator or LaTeXGenerator(self._config)
+        self._override_generators: dict[int, tuple[ConversionConfig, LaTeXGenerator]] = {}
         self._transform_registry = transform_registry or get_default_registry()
         self._transforms = transforms or []
         if transform_names:
@@ -34,6 +36,8 @@ class MarkdownToLaTeXConverter:
                 *self._transforms,
                 *self._transform_registry.resolve(transform_names),
             ]
+        # Composed once here rather than re-walking the list for every converted document.
+        self._transform = compose_transforms(self._transforms) if self._transforms else None
 
     def convert_string(self, source: str, overrides: Mapping[str, object] | None = None) -> str:
         """Convert Markdown string to LaTeX.
@@ -54,19 +58,44 @@ class MarkdownToLaTeXConverter:
             config = self._config.with_overrides(overrides)
         else:
             config = self._config
+        if config.images.validate_paths:
+            # Existence checks are cached within one document only; the filesystem (and the
+            # working directory relative paths depend on) may change between conversions.
+            clear_image_path_cache()
         if config.parsing.strip_yaml_front_matter:
             source = _strip_yaml_front_matter(source)
         source, footnotes = _extract_footnotes(source)
-        if overrides or footnotes:
+        if footnotes:
             inline_transformer = InlineTransformer(config, footnotes)
             generator = LaTeXGenerator(config, inline_transformer=inline_transformer)
-        else:
+        elif config is self._config:
             generator = self._generator
+        else:
+            generator = self._generator_for(config)
         ast = self._parser.parse(source)
-        if self._transforms:
-            ast = apply_transforms(ast, self._transforms)
+        if self._transform is not None:
+            ast = self._transform(ast)
         return ast.accept(generator)
 
+    def _generator_for(self, config: ConversionConfig) -> LaTeXGenerator:
+        """Return a footnote-free generator for a config derived from overrides.
+
+        ``with_overrides`` returns the same config object for repeated overrides, so the
+        generator built for it is kept (by identity, alongside the config) and reused.
+        """
+        cached = self._override_generators.get(id(config))
+        if cached is not None and cached[0] is config:
+            return cached[1]
+        generator = LaTeXGenerator(config)
+        if len(self._override_generators) >= _OVERRIDE_GENERATORS_SIZE:
+            del self._override_generators[next(iter(self._override_generators))]
+        self._override_generators[id(config)] = (config, generator)
+        return generator
+
+
+_OVERRIDE_GENERATORS_SIZE = 32
+"""Generators kept per converter for override-derived configs (oldest evicted first)."""
+
 
 def convert_string(
     source: str,
@@ -84,46 +113,57 @@ def convert_string(
 
 
 def _strip_yaml_front_matter(source: str) -> str:
-    lines = source.splitlines()
-    if not lines:
+    opening = _FRONT_MATTER_OPEN_RE.match(source)
+    if opening is None:
         return source
-    if lines[0].strip() != "---":
+    closing = _FRONT_MATTER_CLOSE_RE.search(source, opening.end())
+    if closing is None:
         return source
-    for idx in range(1, len(lines)):
-        if lines[idx].strip() == "---":
-            return "\n".join(lines[idx + 1 :]).lstrip("\n")
-    return source
+    return source[closing.end() :].lstrip(_LINE_BREAK_CHARS)
+
+
+# Line boundaries recognized by str.splitlines, so delimiters match the same lines as before
+_LINE_BREAK_CHARS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_LINE_BREAK = r"(?:\r\n|[\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029])"
+_INLINE_SPACE = r"[^\S\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]*"
+# A "---" line (surrounding whitespace allowed) opening the source, then the next one after it
+_FRONT_MATTER_OPEN_RE = re.compile(rf"{_INLINE_SPACE}---{_INLINE_SPACE}{_LINE_BREAK}")
+_FRONT_MATTER_CLOSE_RE = re.compile(
+    rf"(?<=[\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]){_INLINE_SPACE}---{_INLINE_SPACE}"
+    rf"(?:{_LINE_BREAK}|\Z)"
+)
 
 
 def _extract_footnotes(source: str) -> tuple[str, dict[str, str]]:
-    lines = source.splitlines()
-    if not lines:
-        return source, {}
+    if _NON_LF_LINE_BREAK_RE.search(source):
+        # Rare: normalize every ``str.splitlines`` boundary to "\n" so the regex sees lines.
+        source = "\n".join(source.splitlines()) + "\n"
     footnotes: dict[str, str] = {}
-    output_lines: list[str] = []
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        if line.startswith("[^") and "]: " in line:
-            key, rest = line.split("]: ", 1)
-            key = key[2:]
-            content_lines = [rest.rstrip()]
-            i += 1
-            while i < len(lines):
-                next_line = lines[i]
-                if next_line.startswith("[^") and "]: " in next_line:
-                    break
-                if next_line.strip() == "":
-                    content_lines.append("")
-                    i += 1
-                    continue
-                if next_line.startswith("    ") or next_line.startswith("\t"):
-                    content_lines.append(next_line.strip())
-                    i += 1
-                    continue
-                break
-            footnotes[key] = "\n".join(content_lines).strip()
-            continue
-        output_lines.append(line)
-        i += 1
-    return "\n".join(output_lines), footnotes
+    if "[^" in source:
+        parts: list[str] = []
+        last = 0
+        for match in _FOOTNOTE_RE.finditer(source):
+            parts.append(source[last : match.start()])
+            key, rest, continuation = match.groups()
+            content = [rest.rstrip(), *(line.strip() for line in continuation.split("\n"))]
+            footnotes[key] = "\n".join(content).strip()
+            last = match.end()
+        if parts:
+            parts.append(source[last:])
+            source = "".join(parts)
+    # Output matches "\n".join(source.splitlines()): drop a single trailing newline.
+    if source.endswith("\n"):
+        source = source[:-1]
+    return source, footnotes
+
+
+# Line boundaries recognized by str.splitlines other than a line feed
+_NON_LF_LINE_BREAK_RE = re.compile(r"[\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
+# A definition line ("[^key]: text", key up to the first "]: ") followed by its continuation:
+# blank lines and lines indented by four spaces or a tab. The trailing newline is consumed
+# with the block so the surrounding lines join back up unchanged.
+_FOOTNOTE_RE = re.compile(
+    r"^\[\^(.*?)\]: (.*)\n?((?:(?:(?:    |\t).*|[^\S\n]*)(?:\n|\Z))*)",
+    re.MULTILINE,
+)
@@ -27,6 +27,11 @@ class LoretexError(Exception):
         self.context = context
         super().__init__(message)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Subclass constructors take other arguments than ``args``, so unpickling (e.g. an
+        # error raised in a worker process) rebuilds the instance without calling them.
+        return (_restore_error, (type(self), self.args), self.__dict__)
+
 
 class ConversionError(LoretexError):
     """Raised when conversion fails."""
@@ -101,3 +106,9 @@ class InvalidImageError(ParsingError):
             line=line,
             content=content,
         )
+
+
+def _restore_error(cls: type[LoretexError], args: tuple[Any, ...]) -> LoretexError:
+    error = cls.__new__(cls)
+    error.args = args
+    return error
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import re
+from typing import Callable
 
 from .config import ConversionConfig
 from .inline import InlineTransformer
-from .labels import slugify
+from .labels import make_label
 from .nodes import (
     Callout,
     CodeBlock,
@@ -16,6 +17,7 @@ from .nodes import (
     List,
     ListItem,
     MathBlock,
+    Node,
     NodeVisitor,
     Paragraph,
     Section,
@@ -33,12 +35,40 @@ class LaTeXGenerator(NodeVisitor):
     ) -> None:
         self._config = config or ConversionConfig()
         self._inline = inline_transformer or InlineTransformer(self._config)
+        # type(node) -> bound visit method, so children are rendered with one lookup and one
+        # call instead of going through node.accept(self).
+        self._dispatch = _VisitDispatch(
+            self,
+            {
+                Document: self.visit_document,
+                Section: self.visit_section,
+                Paragraph: self.visit_paragraph,
+                List: self.visit_list,
+                ListItem: self.visit_list_item,
+                CodeBlock: self.visit_code_block,
+                HorizontalRule: self.visit_horizontal_rule,
+                MathBlock: self.visit_math_block,
+                Callout: self.visit_callout,
+                Image: self.visit_image,
+                Table: self.visit_table,
+            },
+        )
+        multirow_command = self._config.tables.multirow_command
+        if not multirow_command.startswith("\\"):
+            multirow_command = f"\\{multirow_command}"
+        self._multirow_command = multirow_command
 
     def visit_document(self, node: Document) -> str:
         """Generate LaTeX for the full document."""
-        blocks = [child.accept(self) for child in node.children if child]
-        blocks = [block for block in blocks if block.strip() != ""]
-        return "\n\n".join(blocks)
+        # One pass, no intermediate lists; isspace() skips blank blocks without a stripped copy.
+        dispatch = self._dispatch
+        return "\n\n".join(
+            block
+            for block in (
+                dispatch[type(child)](child) for child in node.children if child is not None
+            )
+            if block and not block.isspace()
+        )
 
     def visit_section(self, node: Section) -> str:
         """Convert heading to LaTeX sectioning command."""
@@ -62,44 +92,39 @@ class LaTeXGenerator(NodeVisitor):
             if node.ordered
             else self._config.lists.unordered_environment
         )
-        items = [item.accept(self) for item in node.items]
+        dispatch = self._dispatch
+        items = [dispatch[type(item)](item) for item in node.items]
         body = "\n".join(items)
         return f"\\begin{{{env}}}\n{body}\n\\end{{{env}}}"
 
     def visit_list_item(self, node: ListItem) -> str:
         """Convert list item to LaTeX \\item."""
-        segments: list[tuple[str, str]] = []
+        content = node.content
+        convert = self._inline.convert
+        if len(content) == 1 and isinstance(content[0], Paragraph):
+            # The common bullet: a single paragraph on the \item line.
+            text = convert(content[0].content).strip()
+            return f"\\item {text}" if text else "\\item"
+        # Consecutive paragraphs form one text segment; the first segment, if it is text,
+        # goes on the \item line itself. The trailing None flushes the last segment.
+        lines = ["\\item"]
         text_parts: list[str] = []
-
-        for child in node.content:
+        first = True
+        for child in (*content, None):
             if isinstance(child, Paragraph):
-                text_parts.append(self._inline.convert(child.content))
+                text_parts.append(convert(child.content))
                 continue
             if text_parts:
-                segments.append(("text", "\n".join(text_parts).strip()))
+                text = "\n".join(text_parts).strip()
+                if not first:
+                    lines.append(text)
+                elif text:
+                    lines[0] = f"\\item {text}"
                 text_parts = []
-            segments.append(("block", child.accept(self)))
-
-        if text_parts:
-            segments.append(("text", "\n".join(text_parts).strip()))
-
-        if not segments:
-            return "\\item"
-
-        lines: list[str] = []
-        first_kind, first_value = segments[0]
-        if first_kind == "text":
-            if first_value:
-                lines.append(f"\\item {first_value}")
-            else:
-                lines.append("\\item")
-        else:
-            lines.append("\\item")
-            lines.append(first_value)
-
-        for _kind, value in segments[1:]:
-            lines.append(value)
-
+                first = False
+            if child is not None:
+                lines.append(self._dispatch[type(child)](child))
+                first = False
         return "\n".join(lines)
 
     def visit_code_block(self, node: CodeBlock) -> str:
@@ -118,8 +143,12 @@ class LaTeXGenerator(NodeVisitor):
 
     def visit_callout(self, node: Callout) -> str:
         """Convert callout to custom LaTeX environment."""
-        body_blocks = [child.accept(self) for child in node.children]
-        body = "\n\n".join(block for block in body_blocks if block.strip() != "")
+        dispatch = self._dispatch
+        body = "\n\n".join(
+            block
+            for block in (dispatch[type(child)](child) for child in node.children)
+            if block and not block.isspace()
+        )
         environment = self._config.callouts.resolve_environment(node.callout_type)
         title = self._inline.convert(node.title) if node.title else None
         if title and self._config.callouts.title_template is not None:
@@ -135,73 +164,84 @@ class LaTeXGenerator(NodeVisitor):
 
     def visit_table(self, node: Table) -> str:
         """Convert table node to LaTeX tabular environment."""
+        tables = self._config.tables
+        environment = tables.environment
+        hline = "\\hline\n" if tables.include_hlines else ""
+        multirow_command = self._multirow_command
+        multicolumn_align = tables.multicolumn_align
+        convert = self._inline.convert
+
         col_spec = "".join(node.alignments)
-        header_cells = " & ".join(self._inline.convert(c) for c in node.header)
-        body_lines = []
+        header_cells = " & ".join(convert(c) for c in node.header)
+        parts = [
+            f"\\begin{{{environment}}}{{{col_spec}}}\n{hline}{header_cells} \\\\\n{hline}"
+        ]
         for row in node.rows:
             rendered_cells = []
             idx = 0
-            while idx < len(row):
+            row_length = len(row)
+            while idx < row_length:
                 cell = row[idx]
                 content, col_span, row_span = _parse_cell_span(cell)
-                latex = self._inline.convert(content)
+                latex = convert(content)
                 if row_span > 1:
-                    command = self._config.tables.multirow_command
-                    if not command.startswith("\\"):
-                        command = f"\\{command}"
-                    latex = f"{command}{{{row_span}}}{{*}}{{{latex}}}"
+                    latex = f"{multirow_command}{{{row_span}}}{{*}}{{{latex}}}"
                 if col_span > 1:
-                    align = self._config.tables.multicolumn_align
-                    latex = f"\\multicolumn{{{col_span}}}{{{align}}}{{{latex}}}"
+                    latex = f"\\multicolumn{{{col_span}}}{{{multicolumn_align}}}{{{latex}}}"
                     idx += col_span
                 else:
                     idx += 1
                 rendered_cells.append(latex)
-            cells = " & ".join(rendered_cells)
-            body_lines.append(f"{cells} \\\\")
-
-        if self._config.tables.include_hlines:
-            return (
-                f"\\begin{{{self._config.tables.environment}}}{{{col_spec}}}\n"
-                f"\\hline\n"
-                f"{header_cells} \\\\\n"
-                f"\\hline\n"
-                + "\n".join(body_lines)
-                + "\n"
-                "\\hline\n"
-                f"\\end{{{self._config.tables.environment}}}"
-            )
-
-        return (
-            f"\\begin{{{self._config.tables.environment}}}{{{col_spec}}}\n"
-            f"{header_cells} \\\\\n"
-            + "\n".join(body_lines)
-            + "\n"
-            f"\\end{{{self._config.tables.environment}}}"
-        )
+            parts.append(" & ".join(rendered_cells))
+            parts.append(" \\\\\n")
+        if not node.rows:
+            # A table without body rows still gets its (empty) body line.
+            parts.append("\n")
+        parts.append(f"{hline}\\end{{{environment}}}")
+        return "".join(parts)
 
     def _make_label(self, title: str) -> str:
-        normalized = slugify(title, self._config.labels.label_separator)
-        prefix = self._config.labels.label_prefix
-        if prefix:
-            return f"{prefix}{self._config.labels.label_separator}{normalized}"
-        return normalized
+        labels = self._config.labels
+        return make_label(title, labels.label_separator, labels.label_prefix)
+
+
+class _VisitDispatch(dict[type, Callable[[Node], str]]):
+    """Visit methods keyed by node type; other node types fall back to ``node.accept``."""
+
+    def __init__(self, visitor: NodeVisitor, methods: dict[type, Callable[..., str]]) -> None:
+        super().__init__(methods)
+        self._visitor = visitor
+
+    def __missing__(self, node_type: type) -> Callable[[Node], str]:
+        visitor = self._visitor
+
+        def accept(node: Node) -> str:
+            return node.accept(visitor)
+
+        self[node_type] = accept
+        return accept
+
+
+_CELL_SPAN_RE = re.compile(r"\{([^{}]+)\}\s*$")
+"""Trailing ``{col=N,row=M}`` span annotation of a table cell."""
 
 
 def _parse_cell_span(cell: str) -> tuple[str, int, int]:
-    match = re.search(r"\{([^{}]+)\}\s*$", cell)
+    # Most cells carry no annotation; skip the regex unless a brace is present.
+    if "{" not in cell:
+        return cell, 1, 1
+    match = _CELL_SPAN_RE.search(cell)
+    if match is None:
+        return cell, 1, 1
     col_span = 1
     row_span = 1
-    if match:
-        props = match.group(1)
-        for entry in props.split(","):
-            entry = entry.strip()
-            if "=" not in entry:
-                continue
-            key, value = [part.strip() for part in entry.split("=", 1)]
-            if key == "col":
-                col_span = int(value)
-            if key == "row":
-                row_span = int(value)
-        cell = cell[:match.start()].rstrip()
-    return cell, col_span, row_span
+    for entry in match.group(1).split(","):
+        key, separator, value = entry.partition("=")
+        if not separator:
+            continue
+        key = key.strip()
+        if key == "col":
+            col_span = int(value.strip())
+        elif key == "row":
+            row_span = int(value.strip())
+    return cell[:match.start()].rstrip(), col_span, row_span
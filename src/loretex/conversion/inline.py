@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import re
+from typing import Callable
 
 from .config import ConversionConfig
-from .labels import slugify
+from .labels import make_label, slugify
+
+# First characters of code, math, line breaks, images, references, links and emphasis.
+_INLINE_SIGILS = frozenset("`$\\<[*_")
 
 
 class InlineTransformer:
@@ -14,6 +18,14 @@ class InlineTransformer:
     _inline_code_pattern = re.compile(r"`([^`\n]+)`")
     _inline_math_dollar_pattern = re.compile(r"(?<!\\)\$(?!\$)([^$\n]+?)\$(?!\$)")
     _inline_math_paren_pattern = re.compile(r"\\\((.+?)\\\)")
+    # One scan for both delimiters; the leftmost span wins, so math nested in math stays put.
+    _inline_math_pattern = re.compile(
+        f"{_inline_math_paren_pattern.pattern}|{_inline_math_dollar_pattern.pattern}"
+    )
+    # Placeholder for the n-th extracted math span; unlike underscores, no emphasis pattern
+    # can pick up NUL. NULs already in the text are escaped as \x00N\x00 while math is out,
+    # so they can never be mistaken for a placeholder.
+    _math_token_pattern = re.compile("\x00(?:M(\\d+)|N)\x00")
     _footnote_ref_pattern = re.compile(r"\[\^([^\]]+)\]")
     _wiki_link_pattern = re.compile(r"\[\[([^\]]+)\]\]")
     _citation_pattern = re.compile(r"\[@([^\]]+)\]")
@@ -26,7 +38,26 @@ class InlineTransformer:
     _italic_underscore_pattern = re.compile(
         r"(?<![A-Za-z0-9_])_([^_\n]+)_(?![A-Za-z0-9_])"
     )
+    _line_break_pattern = re.compile(r"<br\s*/?>")
     _image_pattern = re.compile(r"<img src=\"([^\"]+)\.svg\" width=\"(\d+)\"[^>]*>")
+    # Matches wherever any pass of _apply_markup would; text without a match (plain prose)
+    # is left alone after a single scan instead of nine.
+    _markup_pattern = re.compile(
+        "|".join(
+            pattern.pattern
+            for pattern in (
+                _image_pattern,
+                _citation_pattern,
+                _footnote_ref_pattern,
+                _wiki_link_pattern,
+                _link_pattern,
+                _autolink_pattern,
+                _bold_pattern,
+                _italic_star_pattern,
+                _italic_underscore_pattern,
+            )
+        )
+    )
 
     def __init__(
         self,
@@ -35,6 +66,29 @@ class InlineTransformer:
     ) -> None:
         self._config = config or ConversionConfig()
         self._footnotes_map = footnotes_map or {}
+        inline = self._config.inline
+        self._bold_command = self._ensure_command(inline.bold_command)
+        self._italic_command = self._ensure_command(inline.italic_command)
+        self._code_command = self._ensure_command(inline.code_command)
+        self._line_break = f"{self._ensure_command(inline.line_break_command)} "
+        # Longest markers first, so e.g. "===" is not consumed as "==" + "="
+        self._custom_marker_patterns = [
+            (
+                re.compile(rf"{re.escape(marker)}([^\n]+?){re.escape(marker)}"),
+                self._custom_marker_formatter(template),
+            )
+            for marker, template in sorted(
+                inline.custom_markers.items(),
+                key=lambda item: len(item[0]),
+                reverse=True,
+            )
+            if marker
+        ]
+        # Every inline construct starts with one of these characters; text containing none of
+        # them only needs character normalization.
+        self._sigils = _INLINE_SIGILS.union(
+            marker[0] for marker in inline.custom_markers if marker
+        )
 
     def convert(self, text: str) -> str:
         """Convert inline Markdown syntax to LaTeX.
@@ -49,6 +103,8 @@ class InlineTransformer:
         str
             Text with inline Markdown converted to LaTeX.
         """
+        if self._sigils.isdisjoint(text):
+            return self._normalize_characters(text)
         fragments: list[str] = []
         last_idx = 0
         for match in self._inline_code_pattern.finditer(text):
@@ -60,98 +116,130 @@ class InlineTransformer:
 
     def _convert_non_code(self, text: str) -> str:
         """Convert inline formatting for non-code segments."""
+        if self._sigils.isdisjoint(text):
+            return self._normalize_characters(text)
         text, math_spans = self._extract_inline_math(text)
-        line_break = self._ensure_command(self._config.inline.line_break_command)
-        text = re.sub(r"<br\s*/?>", lambda _match: f"{line_break} ", text)
+        if "<br" in text:
+            text = self._replace_line_breaks(text)
         text = self._apply_custom_markers(text)
+        if self._markup_pattern.search(text) is not None:
+            text = self._apply_markup(text)
+        text = self._normalize_characters(text)
+        return self._restore_inline_math(text, math_spans)
+
+    def _replace_line_breaks(self, text: str) -> str:
+        """Replace ``<br>`` tags (any spacing, optional slash) with the line-break command."""
+        line_break = self._line_break
+        text = text.replace("<br>", line_break).replace("<br/>", line_break)
+        text = text.replace("<br />", line_break)
+        if "<br" not in text:
+            return text
+        # Rarer spellings such as "<br  />": the literal forms above are a subset of the
+        # pattern's matches, so finishing with it gives the same result as using it alone.
+        return self._line_break_pattern.sub(lambda _match: line_break, text)
+
+    def _apply_markup(self, text: str) -> str:
+        """Run the image, reference, link and emphasis passes, in order.
+
+        Order matters: later passes also see the output of earlier ones (footnote text, for
+        instance, still gets its links and emphasis converted).
+        """
+        # Formatters are bound once per call so each substitution callback is a plain call.
+        format_image = self._config.images.format_block
+        format_citation = self._format_citation
+        format_footnote_ref = self._format_footnote_ref
+        format_wiki_link = self._format_wiki_link
+        format_link = self._format_link
+        format_autolink = self._format_autolink
         text = self._image_pattern.sub(
-            lambda match: self._config.images.format_block(
-                match.group(1), int(match.group(2))
-            ),
+            lambda match: format_image(match.group(1), int(match.group(2))),
             text,
         )
         text = self._citation_pattern.sub(
-            lambda match: self._format_citation(match.group(1)),
+            lambda match: format_citation(match.group(1)),
             text,
         )
         text = self._footnote_ref_pattern.sub(
-            lambda match: self._format_footnote_ref(match.group(1)),
+            lambda match: format_footnote_ref(match.group(1)),
             text,
         )
         text = self._wiki_link_pattern.sub(
-            lambda match: self._format_wiki_link(match.group(1)),
+            lambda match: format_wiki_link(match.group(1)),
             text,
         )
         text = self._link_pattern.sub(
-            lambda match: self._format_link(match.group(1), match.group(2)),
+            lambda match: format_link(match.group(1), match.group(2)),
             text,
         )
         text = self._autolink_pattern.sub(
-            lambda match: self._format_autolink(match.group(1)),
-            text,
-        )
-        bold_command = self._ensure_command(self._config.inline.bold_command)
-        italic_command = self._ensure_command(self._config.inline.italic_command)
-        text = self._bold_pattern.sub(
-            lambda match: f"{bold_command}{{{match.group(1)}}}",
-            text,
-        )
-        text = self._italic_star_pattern.sub(
-            lambda match: f"{italic_command}{{{match.group(1)}}}",
-            text,
-        )
-        text = self._italic_underscore_pattern.sub(
-            lambda match: f"{italic_command}{{{match.group(1)}}}",
+            lambda match: format_autolink(match.group(1)),
             text,
         )
-        text = self._normalize_characters(text)
-        return self._restore_inline_math(text, math_spans)
+        return self._apply_emphasis(text)
+
+    def _apply_emphasis(self, text: str) -> str:
+        """Convert **bold**, *italic* and _italic_, in that order.
+
+        The passes stay sequential (each sees the previous one's output); a pass is skipped
+        outright when its marker character does not occur.
+        """
+        if "*" in text:
+            bold_command = self._bold_command
+            italic_command = self._italic_command
+            text = self._bold_pattern.sub(
+                lambda match: f"{bold_command}{{{match.group(1)}}}",
+                text,
+            )
+            text = self._italic_star_pattern.sub(
+                lambda match: f"{italic_command}{{{match.group(1)}}}",
+                text,
+            )
+        if "_" in text:
+            italic_command = self._italic_command
+            text = self._italic_underscore_pattern.sub(
+                lambda match: f"{italic_command}{{{match.group(1)}}}",
+                text,
+            )
+        return text
 
     def _format_inline_code(self, code: str) -> str:
         """Format inline code as LaTeX texttt with escaping."""
-        command = self._ensure_command(self._config.inline.code_command)
         escaped = self._escape_texttt(code)
-        return f"{command}{{{escaped}}}"
+        return f"{self._code_command}{{{escaped}}}"
 
     def _escape_texttt(self, code: str) -> str:
         """Escape LaTeX-sensitive characters inside inline code."""
-        return "".join(self._config.inline.texttt_escape_map.get(char, char) for char in code)
+        return self._config.inline.escape_texttt(code)
 
     def _normalize_characters(self, text: str) -> str:
         """Normalize typographic characters for LaTeX."""
-        normalized = text
-        for source, target in self._config.inline.character_normalization:
-            normalized = normalized.replace(source, target)
-        return normalized
-
-    def _extract_inline_math(self, text: str) -> tuple[str, dict[str, str]]:
-        placeholders: dict[str, str] = {}
-        counter = 0
-
-        def _replace(pattern: re.Pattern[str], source: str) -> str:
-            nonlocal counter
-
-            def repl(match: re.Match[str]) -> str:
-                nonlocal counter
-                content = match.group(1)
-                token = f"__LORETEX_MATH_{counter}__"
-                placeholders[token] = self._format_inline_math(content)
-                counter += 1
-                return token
-
-            return pattern.sub(repl, source)
-
-        text = _replace(self._inline_math_paren_pattern, text)
-        text = _replace(self._inline_math_dollar_pattern, text)
-        return text, placeholders
-
-    def _restore_inline_math(self, text: str, placeholders: dict[str, str]) -> str:
-        if not placeholders:
+        return self._config.inline.normalize(text)
+
+    def _extract_inline_math(self, text: str) -> tuple[str, list[str]]:
+        spans: list[str] = []
+        format_math = self._format_inline_math
+
+        def repl(match: re.Match[str]) -> str:
+            # Group 1 is the \(...\) content, group 2 the $...$ content.
+            content = match.group(1)
+            spans.append(format_math(content if content is not None else match.group(2)))
+            return f"\x00M{len(spans) - 1}\x00"
+
+        if "\x00" not in text:
+            return self._inline_math_pattern.sub(repl, text), spans
+        text = self._inline_math_pattern.sub(repl, text.replace("\x00", "\x00N\x00"))
+        # Spans are restored verbatim, so their escaped NULs are undone here.
+        return text, [span.replace("\x00N\x00", "\x00") for span in spans]
+
+    def _restore_inline_math(self, text: str, spans: list[str]) -> str:
+        if not spans and "\x00" not in text:
             return text
-        restored = text
-        for token, value in placeholders.items():
-            restored = restored.replace(token, value)
-        return restored
+
+        def repl(match: re.Match[str]) -> str:
+            index = match.group(1)
+            return "\x00" if index is None else spans[int(index)]
+
+        return self._math_token_pattern.sub(repl, text)
 
     def _format_inline_math(self, content: str) -> str:
         template = self._config.inline.inline_math_template
@@ -162,61 +250,32 @@ class InlineTransformer:
         return f"{template}{content}"
 
     def _apply_custom_markers(self, text: str) -> str:
-        if not self._config.inline.custom_markers:
-            return text
-        markers = sorted(
-            self._config.inline.custom_markers.items(),
-            key=lambda item: len(item[0]),
-            reverse=True,
-        )
         rendered = text
-        for marker, template in markers:
-            if not marker:
-                continue
-            pattern = re.compile(rf"{re.escape(marker)}([^\n]+?){re.escape(marker)}")
-            rendered = pattern.sub(
-                lambda match: self._format_custom_marker(template, match.group(1)),
-                rendered,
-            )
+        for pattern, formatter in self._custom_marker_patterns:
+            rendered = pattern.sub(formatter, rendered)
         return rendered
 
-    def _format_custom_marker(self, template: str, text: str) -> str:
+    def _custom_marker_formatter(self, template: str) -> Callable[[re.Match[str]], str]:
         if "{text}" in template or "{content}" in template:
-            return template.format(text=text, content=text)
+            return lambda match: template.format(text=match.group(1), content=match.group(1))
         command = self._ensure_command(template)
-        return f"{command}{{{text}}}"
+        return lambda match: f"{command}{{{match.group(1)}}}"
 
     def _format_link(self, text: str, url: str) -> str:
+        links = self._config.links
         if url.startswith("#"):
-            label = slugify(url.lstrip("#"), self._config.labels.label_separator)
-            prefix = self._config.labels.label_prefix
-            if prefix:
-                label = f"{prefix}{self._config.labels.label_separator}{label}"
-            return self._config.links.format_internal(label)
-        link_text = self._convert_link_text(text)
+            labels = self._config.labels
+            label = make_label(url.lstrip("#"), labels.label_separator, labels.label_prefix)
+            return links.format_internal(label)
         if text.strip() == url.strip():
-            return self._config.links.format_url_only(url)
-        return self._config.links.format_external(url, link_text)
+            return links.format_url_only(url)
+        return links.format_external(url, self._convert_link_text(text))
 
     def _format_autolink(self, url: str) -> str:
         return self._config.links.format_autolink(url)
 
     def _convert_link_text(self, text: str) -> str:
-        bold_command = self._ensure_command(self._config.inline.bold_command)
-        italic_command = self._ensure_command(self._config.inline.italic_command)
-        text = self._bold_pattern.sub(
-            lambda match: f"{bold_command}{{{match.group(1)}}}",
-            text,
-        )
-        text = self._italic_star_pattern.sub(
-            lambda match: f"{italic_command}{{{match.group(1)}}}",
-            text,
-        )
-        text = self._italic_underscore_pattern.sub(
-            lambda match: f"{italic_command}{{{match.group(1)}}}",
-            text,
-        )
-        return self._normalize_characters(text)
+        return self._normalize_characters(self._apply_emphasis(text))
 
     def _format_citation(self, raw: str) -> str:
         entries: list[tuple[str, str | None]] = []
@@ -235,21 +294,18 @@ class InlineTransformer:
         if not entries:
             return raw
 
+        citations = self._config.citations
         if all(locator is None for _key, locator in entries):
             keys = [key for key, _ in entries]
-            return self._config.citations.format_citation(keys)
+            return citations.format_citation(keys)
 
         rendered = []
         for key, locator_value in entries:
             if locator_value:
-                rendered.append(
-                    self._config.citations.format_citation_with_locator(
-                        [key], locator_value
-                    )
-                )
+                rendered.append(citations.format_citation_with_locator([key], locator_value))
             else:
-                rendered.append(self._config.citations.format_citation([key]))
-        return self._config.citations.multi_cite_separator.join(rendered)
+                rendered.append(citations.format_citation([key]))
+        return citations.multi_cite_separator.join(rendered)
 
     def _format_footnote_ref(self, key: str) -> str:
         footnote = self._footnotes_map.get(key)
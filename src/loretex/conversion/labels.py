@@ -4,12 +4,34 @@ Label normalization helpers.
 
 from __future__ import annotations
 
+from functools import lru_cache
+import re
 
+# ``\w`` is ``str.isalnum()`` plus the underscore, so these match exactly the characters
+# (or runs of characters) that slugify turns into separators.
+_NON_ALNUM_RE = re.compile(r"[\W_]")
+_NON_ALNUM_RUN_RE = re.compile(r"[\W_]+")
+
+
+@lru_cache(maxsize=4096)
 def slugify(text: str, separator: str = "-") -> str:
     normalized = text.strip().lower()
-    normalized = "".join(
-        char if char.isalnum() else separator for char in normalized
-    )
+    # Escaped so a backslash in the separator is inserted literally by re.sub.
+    replacement = separator.replace("\\", "\\\\")
+    if separator and _NON_ALNUM_RUN_RE.fullmatch(separator):
+        # Each run becomes one separator, so no doubled separator is left to collapse.
+        return _NON_ALNUM_RUN_RE.sub(replacement, normalized).strip(separator)
+    # Alphanumeric separators can also merge with the text around them.
+    normalized = _NON_ALNUM_RE.sub(replacement, normalized)
     while separator * 2 in normalized:
         normalized = normalized.replace(separator * 2, separator)
     return normalized.strip(separator)
+
+
+@lru_cache(maxsize=4096)
+def make_label(title: str, separator: str = "-", prefix: str = "") -> str:
+    """Slugify ``title`` and join it to ``prefix`` (if any) with ``separator``."""
+    normalized = slugify(title, separator)
+    if prefix:
+        return f"{prefix}{separator}{normalized}"
+    return normalized
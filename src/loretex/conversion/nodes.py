@@ -14,6 +14,9 @@ class Node(ABC):
     All AST nodes must implement the visitor pattern via the accept method.
     """
 
+    # Empty, so the slotted node dataclasses below carry no per-instance __dict__.
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor: NodeVisitor) -> str:
         """Accept a visitor for transformation.
@@ -31,7 +34,7 @@ class Node(ABC):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class Document(Node):
     """Root node containing document structure."""
 
@@ -41,7 +44,7 @@ class Document(Node):
         return visitor.visit_document(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Section(Node):
     """Section node (h1, h2, h3 → section, subsection, subsubsection)."""
 
@@ -52,7 +55,7 @@ class Section(Node):
         return visitor.visit_section(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Paragraph(Node):
     """Paragraph containing plain text."""
 
@@ -62,7 +65,7 @@ class Paragraph(Node):
         return visitor.visit_paragraph(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class List(Node):
     """List node (ordered or unordered)."""
 
@@ -73,7 +76,7 @@ class List(Node):
         return visitor.visit_list(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ListItem(Node):
     """Individual list item."""
 
@@ -83,7 +86,7 @@ class ListItem(Node):
         return visitor.visit_list_item(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeBlock(Node):
     """Fenced code block."""
 
@@ -94,7 +97,7 @@ class CodeBlock(Node):
         return visitor.visit_code_block(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class HorizontalRule(Node):
     """Horizontal rule block."""
 
@@ -102,7 +105,7 @@ class HorizontalRule(Node):
         return visitor.visit_horizontal_rule(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class MathBlock(Node):
     """Block math expression."""
 
@@ -112,7 +115,7 @@ class MathBlock(Node):
         return visitor.visit_math_block(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Callout(Node):
     """Callout block with an optional title."""
 
@@ -124,7 +127,7 @@ class Callout(Node):
         return visitor.visit_callout(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Image(Node):
     """HTML image tag converted to LaTeX includegraphics."""
 
@@ -135,7 +138,7 @@ class Image(Node):
         return visitor.visit_image(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Table(Node):
     """Table with header and body rows."""
 
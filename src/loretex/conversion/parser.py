@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Iterable
+from pathlib import Path
 import re
 
 from .constants import TAB_WIDTH
@@ -27,6 +30,17 @@ from .nodes import (
     Table,
 )
 
+_OPENER_FIRST_CHARS = frozenset("`$\\#-*+_<")
+"""First non-whitespace characters of the block openers, besides the (``\\d``) list digits.
+
+Lines starting with anything else are paragraph text (or table rows) without running
+``_opener_pattern``.
+"""
+
+
+_DeferredBodies = deque[tuple[list[Node], list[str]]]
+"""Block bodies waiting to be parsed: the node's child list and the body's lines."""
+
 
 class MarkdownParser:
     """Parse Markdown text into an AST."""
@@ -47,7 +61,24 @@ class MarkdownParser:
     )
     _table_row_pattern = re.compile(r"^\|(.+)\|$")
     _table_separator_pattern = re.compile(r"^\|[\s:|-]+\|$")
-    _horizontal_rule_pattern = re.compile(r"^[ \t]*([-*_])(?:[ \t]*\1){2,}[ \t]*$")
+    _chevron_pattern = re.compile(r"^(?P<indent>[ \t]*)> ?(?P<rest>.*)$")
+    _callout_prefix_pattern = re.compile(r"^[ \t]*> ?(.*)$")
+    # Block openers that are decided by a single (normalized) line, as one alternation in the
+    # order _parse_lines tests them: the first alternative that matches names the block.
+    # Tables need the following line too and callout headers are matched on the raw line,
+    # so both are checked separately.
+    _opener_pattern = re.compile(
+        "|".join(
+            (
+                r"(?P<fence>[ \t]*```[A-Za-z0-9_-]*\s*$)",
+                r"(?P<math>\s*(?:(?:\$\$|\\\[)\s*$|\$\$.+\$\$\s*$|\\\[.+\\\]\s*$))",
+                r"(?P<heading>#{1,6}[ \t]+.+$)",
+                r"(?P<list>[ \t]*(?:[-*+]|\d+\.)\s+.*$)",
+                r"(?P<image>\s*<img src=\"[^\"]+\.svg\" width=\"\d+\"[^>]*>\s*$)",
+                r"(?P<rule>[ \t]*(?P<rule_char>[-*_])(?:[ \t]*(?P=rule_char)){2,}[ \t]*$)",
+            )
+        )
+    )
 
     def parse(self, source: str) -> Document:
         """Parse Markdown source into AST.
@@ -63,63 +94,126 @@ class MarkdownParser:
             Parsed document node.
         """
         lines = source.splitlines()
-        children = self._parse_lines(lines)
+        return self._parse_document(lines)
+
+    def parse_stream(self, reader: Iterable[str]) -> Document:
+        """Parse Markdown read line by line from a text stream into AST.
+
+        Parameters
+        ----------
+        reader : Iterable[str]
+            Text stream (or any iterable of lines), with or without line terminators.
+
+        Returns
+        -------
+        Document
+            Parsed document node.
+
+        Notes
+        -----
+        Lines are taken as the stream yields them, so the whole source is never held as one
+        string. Unlike ``parse``, only ``\\n`` and ``\\r\\n`` terminate a line; other
+        ``str.splitlines`` boundaries (form feeds, ``\\u2028``...) stay inside it.
+        """
+        lines = [line.removesuffix("\n").removesuffix("\r") for line in reader]
+        return self._parse_document(lines)
+
+    def parse_file(self, path: str | Path) -> Document:
+        """Parse a UTF-8 Markdown file into AST, streaming its lines.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path to the Markdown file.
+
+        Returns
+        -------
+        Document
+            Parsed document node.
+        """
+        with open(path, "r", encoding="utf-8") as reader:
+            return self.parse_stream(reader)
+
+    def _parse_document(self, lines: list[str]) -> Document:
+        """Parse the document's lines, then the bodies of its callouts and list items.
+
+        Block bodies are not parsed recursively: ``_parse_lines`` queues each one with the
+        (still empty) child list of its node, and the queue is drained here until no nested
+        body is left.
+        """
+        deferred: _DeferredBodies = deque()
+        children = self._parse_lines(lines, self._normalize_lines(lines), deferred)
+        while deferred:
+            nodes, body_lines = deferred.popleft()
+            nodes.extend(self._parse_lines(body_lines, self._normalize_lines(body_lines), deferred))
         return Document(children=children)
 
-    def _parse_lines(self, lines: list[str]) -> list[Node]:
-        """Parse a list of lines into AST nodes."""
+    def _parse_lines(
+        self, lines: list[str], normalized: list[str], deferred: _DeferredBodies
+    ) -> list[Node]:
+        """Parse a list of lines into AST nodes.
+
+        ``normalized`` holds ``_normalized_line`` of each entry of ``lines``, computed once
+        so the block parsers below index it instead of re-stripping chevrons. Callout and
+        list item bodies are appended to ``deferred`` rather than parsed here.
+        """
         nodes: list[Node] = []
         i = 0
+        # Kind of line ``i`` when the paragraph loop already classified it (then stopped).
+        pending: tuple[str | None, str] | None = None
 
         while i < len(lines):
-            raw_line = lines[i]
-            normalized_line = self._normalized_line(raw_line)
+            if pending is None:
+                kind, normalized_line = self._line_kind(lines, normalized, i)
+            else:
+                kind, normalized_line = pending
+                pending = None
 
-            if self._is_blank(normalized_line):
+            if kind == "blank":
                 i += 1
                 continue
 
-            if self._is_callout_header(raw_line):
-                callout, consumed = self._parse_callout(lines, i)
+            if kind == "callout":
+                callout, consumed = self._parse_callout(lines, i, deferred)
                 nodes.append(callout)
                 i += consumed
                 continue
 
-            if self._is_code_fence_start(normalized_line):
-                code_block, consumed = self._parse_code_block(lines, i)
+            if kind == "fence":
+                code_block, consumed = self._parse_code_block(lines, normalized, i)
                 nodes.append(code_block)
                 i += consumed
                 continue
 
-            if self._is_math_block_start(normalized_line):
-                math_block, consumed = self._parse_math_block(lines, i)
+            if kind == "math":
+                math_block, consumed = self._parse_math_block(normalized, i)
                 nodes.append(math_block)
                 i += consumed
                 continue
 
-            if self._is_heading(normalized_line):
+            if kind == "heading":
                 nodes.append(self._parse_heading(normalized_line, i))
                 i += 1
                 continue
 
-            if self._is_list_item(normalized_line):
-                list_node, consumed = self._parse_list(lines, i)
+            if kind == "list":
+                list_node, consumed = self._parse_list(lines, normalized, i, deferred)
                 nodes.append(list_node)
                 i += consumed
                 continue
 
-            if self._is_image_line(normalized_line):
+            if kind == "image":
                 nodes.append(self._parse_image_line(normalized_line, i))
                 i += 1
                 continue
 
-            if self._is_table_start(lines, i):
-                table, consumed = self._parse_table(lines, i)
+            if kind == "table":
+                table, consumed = self._parse_table(lines, normalized, i)
                 nodes.append(table)
                 i += consumed
                 continue
 
-            if self._is_horizontal_rule(normalized_line):
+            if kind == "rule":
                 nodes.append(HorizontalRule())
                 i += 1
                 continue
@@ -127,25 +221,9 @@ class MarkdownParser:
             paragraph_lines = [normalized_line]
             i += 1
             while i < len(lines):
-                raw_line = lines[i]
-                normalized_line = self._normalized_line(raw_line)
-                if self._is_blank(normalized_line):
-                    break
-                if self._is_callout_header(raw_line):
-                    break
-                if self._is_code_fence_start(normalized_line):
-                    break
-                if self._is_math_block_start(normalized_line):
-                    break
-                if self._is_heading(normalized_line):
-                    break
-                if self._is_list_item(normalized_line):
-                    break
-                if self._is_image_line(normalized_line):
-                    break
-                if self._is_table_start(lines, i):
-                    break
-                if self._is_horizontal_rule(normalized_line):
+                kind, normalized_line = self._line_kind(lines, normalized, i)
+                if kind is not None:
+                    pending = kind, normalized_line
                     break
                 paragraph_lines.append(normalized_line)
                 i += 1
@@ -154,47 +232,75 @@ class MarkdownParser:
 
         return nodes
 
-    def _parse_code_block(self, lines: list[str], start_idx: int) -> tuple[CodeBlock, int]:
+    def _line_kind(
+        self, lines: list[str], normalized: list[str], idx: int
+    ) -> tuple[str | None, str]:
+        """Classify the line at ``idx`` and return it with its normalized form.
+
+        The kind is the block the line opens ("blank", "callout", "fence", "math",
+        "heading", "list", "image", "table" or "rule"), or None for paragraph text.
+        """
+        raw_line = lines[idx]
+        if self._callout_header_pattern.match(raw_line) is not None:
+            return "callout", raw_line
+        normalized_line = normalized[idx]
+        if not normalized_line or normalized_line.isspace():
+            return "blank", normalized_line
+        first = normalized_line.lstrip()[0]
+        if first in _OPENER_FIRST_CHARS or first.isdecimal():
+            match = self._opener_pattern.match(normalized_line)
+            # lastgroup is the outermost group closed last, i.e. the alternative's name.
+            kind = match.lastgroup if match is not None else None
+        else:
+            kind = None
+        if (kind is None or kind == "rule") and self._is_table_start(normalized, idx):
+            return "table", normalized_line
+        return kind, normalized_line
+
+    def _parse_code_block(
+        self, lines: list[str], normalized: list[str], start_idx: int
+    ) -> tuple[CodeBlock, int]:
         """Parse fenced code block."""
-        normalized_start = self._normalized_line(lines[start_idx])
+        normalized_start = normalized[start_idx]
         match = self._code_fence_pattern.match(normalized_start)
         if not match:
             raise InvalidCodeFenceError(start_idx + 1, lines[start_idx])
         indent = match.group("indent") or ""
         language = match.group("lang")
 
-        content_lines: list[str] = []
-        i = start_idx + 1
-        while i < len(lines):
-            normalized_line = self._normalized_line(lines[i])
-            if self._code_fence_end_pattern.match(normalized_line):
-                i += 1
+        # Find the closing fence first (the substring test rules out most body lines without
+        # the regex), then take the body as one slice.
+        fence_end = self._code_fence_end_pattern.match
+        for end_idx in range(start_idx + 1, len(normalized)):
+            line = normalized[end_idx]
+            if "```" in line and fence_end(line):
                 break
-            if indent and normalized_line.startswith(indent):
-                content_lines.append(normalized_line[len(indent):])
-            else:
-                content_lines.append(normalized_line)
-            i += 1
         else:
             raise InvalidCodeFenceError(start_idx + 1, lines[start_idx])
 
-        return CodeBlock(language=language, content="\n".join(content_lines)), i - start_idx
+        content_lines = normalized[start_idx + 1 : end_idx]
+        if indent:
+            width = len(indent)
+            content_lines = [
+                line[width:] if line.startswith(indent) else line for line in content_lines
+            ]
+        code_block = CodeBlock(language=language, content="\n".join(content_lines))
+        return code_block, end_idx + 1 - start_idx
 
-    def _parse_math_block(self, lines: list[str], start_idx: int) -> tuple[MathBlock, int]:
+    def _parse_math_block(self, normalized: list[str], start_idx: int) -> tuple[MathBlock, int]:
         """Parse block math delimited by $$ or \\[."""
-        start_line = self._normalized_line(lines[start_idx]).strip()
+        start_line = normalized[start_idx].strip()
         if start_line in {"$$", "\\["}:
             end_delimiter = "$$" if start_line == "$$" else "\\]"
-            content_lines: list[str] = []
-            i = start_idx + 1
-            while i < len(lines):
-                line = self._normalized_line(lines[i]).strip()
-                if line == end_delimiter:
-                    i += 1
+            for end_idx in range(start_idx + 1, len(normalized)):
+                line = normalized[end_idx]
+                if end_delimiter in line and line.strip() == end_delimiter:
                     break
-                content_lines.append(self._normalized_line(lines[i]))
-                i += 1
-            return MathBlock(content="\n".join(content_lines)), i - start_idx
+            else:
+                # Unterminated: the block runs to the end of the lines.
+                end_idx = len(normalized)
+            content = "\n".join(normalized[start_idx + 1 : end_idx])
+            return MathBlock(content=content), min(end_idx + 1, len(normalized)) - start_idx
 
         if start_line.startswith("$$") and start_line.endswith("$$") and len(start_line) > 4:
             content = start_line[2:-2].strip()
@@ -206,7 +312,9 @@ class MarkdownParser:
 
         return MathBlock(content=start_line), 1
 
-    def _parse_callout(self, lines: list[str], start_idx: int) -> tuple[Callout, int]:
+    def _parse_callout(
+        self, lines: list[str], start_idx: int, deferred: _DeferredBodies
+    ) -> tuple[Callout, int]:
         """Parse callout block."""
         header_line = lines[start_idx]
         match = self._callout_header_pattern.match(header_line)
@@ -226,8 +334,9 @@ class MarkdownParser:
             content_lines.append(self._strip_callout_prefix(line))
             i += 1
 
-        children = self._parse_lines(content_lines)
-        return Callout(callout_type=callout_type, title=title, children=children), i - start_idx
+        callout = Callout(callout_type=callout_type, title=title)
+        deferred.append((callout.children, content_lines))
+        return callout, i - start_idx
 
     def _parse_heading(self, line: str, line_idx: int) -> Section:
         """Parse Markdown heading line."""
@@ -238,9 +347,15 @@ class MarkdownParser:
         title = match.group("title").strip()
         return Section(level=level, title=title)
 
-    def _parse_list(self, lines: list[str], start_idx: int) -> tuple[List, int]:
+    def _parse_list(
+        self,
+        lines: list[str],
+        normalized: list[str],
+        start_idx: int,
+        deferred: _DeferredBodies,
+    ) -> tuple[List, int]:
         """Parse list starting at start_idx."""
-        start_line = self._normalized_line(lines[start_idx])
+        start_line = normalized[start_idx]
         match = self._list_item_pattern.match(start_line)
         if not match:
             raise InvalidListError(start_idx + 1, start_line)
@@ -249,31 +364,39 @@ class MarkdownParser:
         ordered = self._is_ordered_marker(match.group("marker"))
         list_node = List(ordered=ordered)
 
+        # Each item ends at the end of the lines or on a line that is not more indented
+        # (blank lines belong to the item). The item parser hands back its match for that
+        # line when it is a list item, so it is not matched and measured a second time here.
         i = start_idx
-        while i < len(lines):
-            normalized_line = self._normalized_line(lines[i])
-            if self._is_blank(normalized_line):
-                i += 1
-                continue
-            item_match = self._list_item_pattern.match(normalized_line)
-            if not item_match:
-                break
-            indent = self._indent_width(item_match.group("indent"))
-            if indent != base_indent:
-                break
-            if self._is_ordered_marker(item_match.group("marker")) != ordered:
-                break
-            item, consumed = self._parse_list_item(lines, i, item_match)
+        item_match: re.Match[str] | None = match
+        while item_match is not None:
+            if i > start_idx:
+                if self._indent_width(item_match.group("indent")) != base_indent:
+                    break
+                if self._is_ordered_marker(item_match.group("marker")) != ordered:
+                    break
+            item, consumed, item_match = self._parse_list_item(
+                lines, normalized, i, item_match, base_indent, deferred
+            )
             list_node.items.append(item)
             i += consumed
 
         return list_node, i - start_idx
 
     def _parse_list_item(
-        self, lines: list[str], start_idx: int, match: re.Match[str]
-    ) -> tuple[ListItem, int]:
-        """Parse a list item and its continuation lines."""
-        base_indent = self._indent_width(match.group("indent"))
+        self,
+        lines: list[str],
+        normalized: list[str],
+        start_idx: int,
+        match: re.Match[str],
+        base_indent: int,
+        deferred: _DeferredBodies,
+    ) -> tuple[ListItem, int, re.Match[str] | None]:
+        """Parse a list item and its continuation lines.
+
+        Also returns the list item match of the line that ended the item, or None when the
+        item ran to the end of the lines or was ended by another kind of line.
+        """
         content_indent = match.start("content")
         item_lines: list[str] = []
         first_content = match.group("content").strip()
@@ -282,24 +405,31 @@ class MarkdownParser:
 
         i = start_idx + 1
         while i < len(lines):
-            normalized_line = self._normalized_line(lines[i])
+            normalized_line = normalized[i]
             if self._is_blank(normalized_line):
                 item_lines.append("")
                 i += 1
                 continue
             next_match = self._list_item_pattern.match(normalized_line)
+            # A list item's indent group is the line's whole leading run of spaces and tabs,
+            # and a line starting with neither has no indent to measure.
             if next_match:
-                next_indent = self._indent_width(next_match.group("indent"))
-                if next_indent <= base_indent:
-                    break
-            current_indent = self._indent_width(normalized_line)
+                current_indent = self._indent_width(next_match.group("indent"))
+            elif normalized_line[0] in " \t":
+                current_indent = self._indent_width(normalized_line)
+            else:
+                current_indent = 0
             if current_indent <= base_indent:
                 break
             item_lines.append(self._dedent_line(normalized_line, content_indent))
             i += 1
+        else:
+            next_match = None
 
-        children = self._parse_lines(item_lines) if item_lines else []
-        return ListItem(content=children), i - start_idx
+        item = ListItem(content=[])
+        if item_lines:
+            deferred.append((item.content, item_lines))
+        return item, i - start_idx, next_match
 
     def _parse_image_line(self, line: str, line_idx: int) -> Image:
         """Parse HTML image tag line."""
@@ -311,21 +441,23 @@ class MarkdownParser:
             width_px=int(match.group("width")),
         )
 
-    def _is_table_start(self, lines: list[str], idx: int) -> bool:
+    def _is_table_start(self, normalized: list[str], idx: int) -> bool:
         """Check if a table starts at the given index."""
-        if idx + 1 >= len(lines):
+        if idx + 1 >= len(normalized):
             return False
-        header_line = self._normalized_line(lines[idx]).strip()
-        separator_line = self._normalized_line(lines[idx + 1]).strip()
+        header_line = normalized[idx].strip()
+        separator_line = normalized[idx + 1].strip()
         return (
             self._table_row_pattern.match(header_line) is not None
             and self._table_separator_pattern.match(separator_line) is not None
         )
 
-    def _parse_table(self, lines: list[str], start_idx: int) -> tuple[Table, int]:
+    def _parse_table(
+        self, lines: list[str], normalized: list[str], start_idx: int
+    ) -> tuple[Table, int]:
         """Parse a Markdown table starting at start_idx."""
-        header_line = self._normalized_line(lines[start_idx]).strip()
-        separator_line = self._normalized_line(lines[start_idx + 1]).strip()
+        header_line = normalized[start_idx].strip()
+        separator_line = normalized[start_idx + 1].strip()
 
         header = self._parse_table_row(header_line)
         alignments = self._parse_alignments(separator_line)
@@ -333,7 +465,7 @@ class MarkdownParser:
         rows: list[list[str]] = []
         i = start_idx + 2
         while i < len(lines):
-            normalized_line = self._normalized_line(lines[i]).strip()
+            normalized_line = normalized[i].strip()
             if not self._table_row_pattern.match(normalized_line):
                 break
             rows.append(self._parse_table_row(normalized_line))
@@ -348,18 +480,19 @@ class MarkdownParser:
 
     def _parse_alignments(self, separator_line: str) -> list[str]:
         """Parse alignment indicators from separator row."""
-        content = separator_line.strip("|")
-        cells = [cell.strip() for cell in content.split("|")]
         alignments: list[str] = []
-        for cell in cells:
-            if cell.startswith(":") and cell.endswith(":"):
-                alignments.append("c")
-            elif cell.endswith(":"):
-                alignments.append("r")
+        for cell in separator_line.strip("|").split("|"):
+            cell = cell.strip()
+            if cell.endswith(":"):
+                alignments.append("c" if cell.startswith(":") else "r")
             else:
                 alignments.append("l")
         return alignments
 
+    def _normalize_lines(self, lines: list[str]) -> list[str]:
+        """Normalize every line once, for indexing by the block parsers."""
+        return [self._normalized_line(line) for line in lines]
+
     def _normalized_line(self, line: str) -> str:
         """Apply blockquote stripping when applicable."""
         if self._is_callout_header(line):
@@ -368,23 +501,19 @@ class MarkdownParser:
 
     def _strip_leading_chevron(self, line: str) -> str:
         """Strip leading blockquote chevron while preserving indentation."""
-        match = re.match(r"^(?P<indent>[ \t]*)> ?(?P<rest>.*)$", line)
+        match = self._chevron_pattern.match(line)
         if match:
             return f"{match.group('indent')}{match.group('rest')}"
         return line
 
     def _strip_callout_prefix(self, line: str) -> str:
         """Strip callout prefix and leading chevrons."""
-        match = re.match(r"^[ \t]*> ?(.*)$", line)
+        match = self._callout_prefix_pattern.match(line)
         return match.group(1) if match else line
 
     def _is_blank(self, line: str) -> bool:
         """Check if line is blank."""
-        return line.strip() == ""
-
-    def _is_code_fence_start(self, line: str) -> bool:
-        """Check if line starts a fenced code block."""
-        return self._code_fence_pattern.match(line) is not None
+        return not line or line.isspace()
 
     def _is_callout_header(self, line: str) -> bool:
         """Check if line is a callout header."""
@@ -392,34 +521,7 @@ class MarkdownParser:
 
     def _is_blockquote_line(self, line: str) -> bool:
         """Check if line starts with a blockquote chevron."""
-        return re.match(r"^[ \t]*>", line) is not None
-
-    def _is_heading(self, line: str) -> bool:
-        """Check if line is a heading."""
-        return self._heading_pattern.match(line) is not None
-
-    def _is_list_item(self, line: str) -> bool:
-        """Check if line is a list item."""
-        return self._list_item_pattern.match(line) is not None
-
-    def _is_image_line(self, line: str) -> bool:
-        """Check if line is an image tag on its own line."""
-        return self._image_line_pattern.match(line.strip()) is not None
-
-    def _is_math_block_start(self, line: str) -> bool:
-        """Check if line starts a block math section."""
-        stripped = line.strip()
-        if stripped in {"$$", "\\["}:
-            return True
-        if stripped.startswith("$$") and stripped.endswith("$$") and len(stripped) > 4:
-            return True
-        if stripped.startswith("\\[") and stripped.endswith("\\]") and len(stripped) > 4:
-            return True
-        return False
-
-    def _is_horizontal_rule(self, line: str) -> bool:
-        """Check if line is a horizontal rule."""
-        return self._horizontal_rule_pattern.match(line) is not None
+        return line.lstrip(" \t").startswith(">")
 
     def _is_ordered_marker(self, marker: str) -> bool:
         """Check if list marker is ordered."""
@@ -427,15 +529,9 @@ class MarkdownParser:
 
     def _indent_width(self, line: str) -> int:
         """Compute leading indentation width accounting for tabs."""
-        width = 0
-        for char in line:
-            if char == " ":
-                width += 1
-            elif char == "\t":
-                width += TAB_WIDTH
-            else:
-                break
-        return width
+        prefix = line[: len(line) - len(line.lstrip(" \t"))]
+        tabs = prefix.count("\t")
+        return len(prefix) + tabs * (TAB_WIDTH - 1)
 
     def _dedent_line(self, line: str, indent: int) -> str:
         """Remove leading indentation from a line."""
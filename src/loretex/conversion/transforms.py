@@ -22,3 +22,21 @@ def apply_transforms(document: Document, transforms: Iterable[Transform]) -> Doc
     for transform in transforms:
         current = transform(current)
     return current
+
+
+def compose_transforms(transforms: Iterable[Transform]) -> Transform:
+    """Freeze ``transforms`` into one transform that applies them in order.
+
+    A single transform is returned as is; otherwise the sequence is captured once as a
+    tuple, so reusing the result (one converter, many documents) skips re-collecting it.
+    """
+    frozen = tuple(transforms)
+    if len(frozen) == 1:
+        return frozen[0]
+
+    def composed(document: Document) -> Document:
+        for transform in frozen:
+            document = transform(document)
+        return document
+
+    return composed
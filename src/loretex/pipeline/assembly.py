@@ -9,6 +9,7 @@ import os
 from pathlib import Path
 
 from loretex.pipeline.templates import TemplateContext, load_template, render_template
+from loretex.utils.io import write_text_if_changed
 
 
 @dataclass(frozen=True)
@@ -26,12 +27,10 @@ def build_inputs(chapter_outputs: list[Path], *, main_output: Path) -> str:
     """
     Build a sequence of \\input{...} lines for chapter outputs.
     """
-    lines = []
-    base_dir = main_output.parent
-    for chapter in chapter_outputs:
-        relative = os.path.relpath(Path(chapter).resolve(), base_dir.resolve())
-        lines.append(f"\\input{{{Path(relative).as_posix()}}}")
-    return "\n".join(lines)
+    base_dir = os.path.realpath(main_output.parent)
+    return "\n".join(
+        f"\\input{{{_relative_posix_path(chapter, base_dir)}}}" for chapter in chapter_outputs
+    )
 
 
 def assemble(plan: AssemblyPlan) -> Path:
@@ -43,5 +42,13 @@ def assemble(plan: AssemblyPlan) -> Path:
     context = TemplateContext(content=inputs, values=plan.template_vars)
     rendered = render_template(template_text, context)
     plan.main_output.parent.mkdir(parents=True, exist_ok=True)
-    plan.main_output.write_text(rendered, encoding="utf-8")
+    write_text_if_changed(plan.main_output, rendered)
     return plan.main_output
+
+
+def _relative_posix_path(path: Path, base_dir: str) -> str:
+    # Forward slashes on every platform, since the result is written into LaTeX source.
+    relative = os.path.relpath(os.path.realpath(path), base_dir)
+    if os.sep != "/":
+        relative = relative.replace(os.sep, "/")
+    return relative
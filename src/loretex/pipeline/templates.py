@@ -5,9 +5,14 @@ Template rendering utilities for LaTeX assembly.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+import os
 from pathlib import Path
+import re
 from typing import Mapping
 
+_PLACEHOLDER_RE = re.compile(r"\{\{([^{}]+)\}\}")
+
 
 @dataclass(frozen=True)
 class TemplateContext:
@@ -25,15 +30,37 @@ class TemplateContext:
 def render_template(template_text: str, context: TemplateContext) -> str:
     """
     Render template by replacing {{key}} placeholders with values.
+
+    The template is scanned once; placeholders whose key is not in the context are left as
+    they are, and substituted values are not scanned for further placeholders.
     """
-    rendered = template_text
-    for key, value in context.as_mapping().items():
-        rendered = rendered.replace(f"{{{{{key}}}}}", value)
-    return rendered
+    mapping = context.as_mapping()
+    parts = list(_split_template(template_text))
+    # Odd indices hold placeholder keys, between the literal chunks at even indices.
+    for index in range(1, len(parts), 2):
+        key = parts[index]
+        parts[index] = mapping.get(key, f"{{{{{key}}}}}")
+    return "".join(parts)
 
 
 def load_template(path: Path) -> str:
     """
     Load a template file from disk.
+
+    Contents are cached per path and reused while the file's modification time and size
+    are unchanged. An edit that keeps the size within the same filesystem timestamp tick
+    (coarse on some filesystems) is therefore not seen until the file changes again.
     """
-    return path.read_text(encoding="utf-8")
+    stat = os.stat(path)
+    return _read_template(os.fspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _read_template(path: str, mtime_ns: int, size: int) -> str:
+    # ``mtime_ns`` and ``size`` are only part of the cache key, so edits invalidate it.
+    return Path(path).read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=32)
+def _split_template(template_text: str) -> tuple[str, ...]:
+    return tuple(_PLACEHOLDER_RE.split(template_text))
@@ -9,11 +9,25 @@ load_yaml_spec(path: str) -> dict
     Load a YAML specification file and return its contents as a dictionary.
 ensure_output_dir(path: Path)
     Ensure that the specified output directory exists, creating it if necessary.
+read_utf8(path: str | Path) -> str
+    Read a whole UTF-8 text file with universal newlines.
+read_utf8_files(paths: Iterable[str | Path]) -> list[str]
+    Read several UTF-8 text files, opening each parent directory only once.
+write_utf8(path: str | Path, text: str)
+    Write UTF-8 text to a file, replacing its content.
+write_text_if_changed(path: Path, text: str) -> bool
+    Write UTF-8 text to a file unless it already holds exactly that content.
 """
+from collections.abc import Iterable
+import mmap
+import os
 from pathlib import Path
 
 import yaml
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+"""Safe YAML loader, preferring the libyaml C extension when PyYAML was built with it."""
+
 
 def load_yaml_spec(path: str | Path) -> dict:
     """
@@ -27,9 +41,14 @@ def load_yaml_spec(path: str | Path) -> dict:
     -------
     dict
         Contents of the YAML file as a dictionary.
+
+    Notes
+    -----
+    The C-accelerated ``CSafeLoader`` is used when available, falling back to the pure-Python
+    ``SafeLoader`` otherwise. Both accept the same (safe) subset of YAML.
     """
     with open(Path(path), "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YAML_LOADER)
 
 
 def ensure_output_dir(path: Path):
@@ -42,3 +61,182 @@ def ensure_output_dir(path: Path):
         Path to the output directory.
     """
     path.mkdir(parents=True, exist_ok=True)
+
+
+_READ_CHUNK_SIZE = 1 << 16
+"""Size of follow-up reads when a file is larger than its reported size (or reports none)."""
+
+
+_MMAP_MIN_SIZE = 1 << 20
+"""Files at least this large are decoded straight from a read-only mapping."""
+
+
+_DIR_FD_READS = hasattr(os, "O_DIRECTORY") and os.open in os.supports_dir_fd
+"""Whether files can be opened relative to an open directory descriptor on this platform."""
+
+
+def _read_bytes(path: str | Path, *, dir_fd: int | None = None) -> bytes:
+    """Read a whole file with raw ``os`` calls, sizing the first read from ``fstat``."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0), dir_fd=dir_fd)
+    try:
+        return _read_fd(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+def _read_fd(fd: int, size: int) -> bytes:
+    """Read an open file to its end, starting with one read of its reported ``size``."""
+    parts = [os.read(fd, size)] if size else []
+    while chunk := os.read(fd, _READ_CHUNK_SIZE):
+        parts.append(chunk)
+    return parts[0] if len(parts) == 1 else b"".join(parts)
+
+
+def _read_utf8(path: str | Path, *, dir_fd: int | None = None) -> str:
+    """Read and decode a UTF-8 file, mapping it instead of copying it when it is large."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0), dir_fd=dir_fd)
+    try:
+        size = os.fstat(fd).st_size
+        if size >= _MMAP_MIN_SIZE:
+            try:
+                mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass  # Not mappable (e.g. a special file): read it instead.
+            else:
+                with mapped:
+                    return _decode_utf8(mapped)
+        return _decode_utf8(_read_fd(fd, size))
+    finally:
+        os.close(fd)
+
+
+def _write_bytes(path: str | Path, data: bytes) -> None:
+    """Replace a file's content with ``data`` using raw ``os`` calls."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _decode_utf8(data: bytes | mmap.mmap) -> str:
+    """Decode UTF-8 bytes and translate \\r\\n / \\r line endings to \\n."""
+    text = str(data, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _with_filename(error: OSError, name: str) -> OSError:
+    """Same error reported against the full path rather than the ``dir_fd``-relative one."""
+    return OSError(error.errno, error.strerror, name)
+
+
+def read_utf8(path: str | Path) -> str:
+    """
+    Read a whole UTF-8 text file.
+
+    Equivalent to ``Path.read_text(encoding="utf-8")`` (including universal newline
+    translation), but bypasses the text I/O stack: one ``fstat``, one sized ``read`` and a
+    single decode.
+
+    Arguments
+    ---------
+    path : str | Path
+        Path to the file.
+
+    Returns
+    -------
+    str
+        Decoded file content, with ``\\r\\n`` and ``\\r`` line endings translated to ``\\n``.
+    """
+    return _read_utf8(path)
+
+
+def read_utf8_files(paths: Iterable[str | Path]) -> list[str]:
+    """
+    Read several UTF-8 text files, in order, with the semantics of :func:`read_utf8`.
+
+    Files are grouped by parent directory; where the platform supports ``dir_fd``, each
+    directory is opened once and its files are opened relative to it (one path lookup per
+    directory instead of one per file).
+
+    Arguments
+    ---------
+    paths : Iterable[str | Path]
+        Paths to the files.
+
+    Returns
+    -------
+    list[str]
+        Decoded contents, in the order of ``paths``.
+    """
+    names = [os.fspath(path) for path in paths]
+    if not _DIR_FD_READS:
+        return [read_utf8(path) for path in names]
+    groups: dict[str, list[int]] = {}
+    for index, name in enumerate(names):
+        groups.setdefault(os.path.dirname(name), []).append(index)
+    contents: list[str] = [""] * len(names)
+    for directory, indices in groups.items():
+        try:
+            dir_fd = os.open(directory or ".", os.O_RDONLY | os.O_DIRECTORY)
+        except OSError as error:
+            raise _with_filename(error, names[indices[0]]) from None
+        try:
+            for index in indices:
+                entry = os.path.basename(names[index])
+                try:
+                    contents[index] = _read_utf8(entry, dir_fd=dir_fd)
+                except OSError as error:
+                    raise _with_filename(error, names[index]) from None
+        finally:
+            os.close(dir_fd)
+    return contents
+
+
+def write_utf8(path: str | Path, text: str) -> None:
+    """
+    Write UTF-8 text to a file, replacing its content.
+
+    Newlines are written as-is (no platform translation).
+
+    Arguments
+    ---------
+    path : str | Path
+        Path to the file.
+    text : str
+        Content to write.
+    """
+    _write_bytes(path, text.encode("utf-8"))
+
+
+def write_text_if_changed(path: Path, text: str) -> bool:
+    """
+    Write UTF-8 text to a file unless it already holds exactly that content.
+
+    Skipping identical rewrites keeps the file's mtime stable, so LaTeX build tools
+    (latexmk) and file watchers do not treat unchanged outputs as modified.
+
+    Arguments
+    ---------
+    path : Path
+        Path to the output file.
+    text : str
+        Content to write.
+
+    Returns
+    -------
+    bool
+        True if the file was written, False if it was already up to date.
+    """
+    encoded = text.encode("utf-8")
+    try:
+        if os.stat(path).st_size == len(encoded) and _read_bytes(path) == encoded:
+            return False
+    except FileNotFoundError:
+        pass
+    _write_bytes(path, encoded)
+    return True
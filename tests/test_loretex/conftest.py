@@ -0,0 +1,19 @@
+"""Shared fixtures for loretex tests."""
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+
+@pytest.fixture(scope="session")
+def app() -> typer.Typer:
+    """The loretex Typer application, imported on first use by a CLI test."""
+    from loretex.cli import app as cli_app
+
+    return cli_app
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """CLI runner with plain, wide output: no colors or terminal probing when Rich renders."""
+    return CliRunner(env={"NO_COLOR": "1", "TERM": "dumb", "COLUMNS": "200"})
@@ -2,7 +2,10 @@
 
 from pathlib import Path
 
-from loretex import convert_file, convert_string
+import pytest
+
+from loretex import convert_file, convert_spec, convert_string
+from loretex.conversion import InvalidCodeFenceError
 
 
 def test_api_convert_string() -> None:
@@ -19,3 +22,70 @@ def test_api_convert_file(tmp_path: Path) -> None:
     latex = convert_file(input_file, output_file)
     assert r"\section{Title}" in latex
     assert output_file.read_text(encoding="utf-8").startswith(r"\section{Title}")
+
+
+def test_api_convert_spec_parallel_matches_serial(tmp_path: Path) -> None:
+    """Chapters converted in worker processes match the serial output, in order."""
+    chapters = []
+    for index, name in enumerate(["one", "two", "three"]):
+        source = tmp_path / f"{name}.md"
+        source.write_text(
+            f"# {name}\n\nText **{index}** with [^1].\n\n[^1]: Note.", encoding="utf-8"
+        )
+        chapters.append({"file": str(source), "anchor_level": 1 + index % 2})
+
+    def run(output_dir: Path, max_workers: int) -> list[str]:
+        spec = {"output_dir": str(output_dir), "chapters": chapters}
+        result = convert_spec(spec, max_workers=max_workers)
+        return [path.read_text(encoding="utf-8") for path in result.chapter_outputs]
+
+    assert run(tmp_path / "parallel", 2) == run(tmp_path / "serial", 1)
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_api_convert_spec_worker_errors_match_serial(tmp_path: Path, max_workers: int) -> None:
+    """A parsing error raised in a worker reaches the caller with its type and context."""
+    chapters = []
+    for name, text in [("one", "# One"), ("two", "```python\nprint()"), ("three", "# Three")]:
+        source = tmp_path / f"{name}.md"
+        source.write_text(text, encoding="utf-8")
+        chapters.append({"file": str(source)})
+    spec = {"output_dir": str(tmp_path / "out"), "chapters": chapters}
+
+    with pytest.raises(InvalidCodeFenceError) as excinfo:
+        convert_spec(spec, max_workers=max_workers)
+    assert excinfo.value.exit_code == 2
+    assert excinfo.value.context == {"line": 1, "content": "```python"}
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_api_convert_spec_worker_warnings_reach_caller(tmp_path: Path, max_workers: int) -> None:
+    """Missing-image warnings from worker processes are re-issued in the caller."""
+    chapters = []
+    for name in ("one", "two", "three"):
+        source = tmp_path / f"{name}.md"
+        source.write_text(f'<img src="{name}.svg" width="10">', encoding="utf-8")
+        chapters.append({"file": str(source)})
+    spec = {
+        "output_dir": str(tmp_path / "out"),
+        "conversion": {"images": {"base_dir": str(tmp_path), "validate_paths": True}},
+        "chapters": chapters,
+    }
+
+    with pytest.warns(UserWarning, match="Image not found") as record:
+        convert_spec(spec, max_workers=max_workers)
+    assert [str(warning.message).rsplit("/", 1)[-1] for warning in record] == [
+        "one.pdf",
+        "two.pdf",
+        "three.pdf",
+    ]
+
+
+def test_api_convert_string_config_cache_respects_marker_order() -> None:
+    """Equal-length custom markers are tried in mapping order, so order is part of the key."""
+    markers = {"=-": "one", "-=": "two"}
+    first = convert_string("b=-=a=-==a", config={"inline": {"custom_markers": markers}})
+    reversed_markers = dict(reversed(list(markers.items())))
+    second = convert_string("b=-=a=-==a", config={"inline": {"custom_markers": reversed_markers}})
+    assert first == r"b\one{=a}==a"
+    assert second == r"b=\two{a=}=a"
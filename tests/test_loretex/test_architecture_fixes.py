@@ -1,10 +1,17 @@
 from pathlib import Path
+import pickle
 
 import pytest
 
 from loretex.api import convert_spec
 from loretex.config.exceptions import SpecValidationError
-from loretex.conversion import ConversionConfig, InvalidCodeFenceError, MarkdownParser, TransformRegistry
+from loretex.conversion import (
+    ConversionConfig,
+    InvalidCodeFenceError,
+    MarkdownParser,
+    MarkdownToLaTeXConverter,
+    TransformRegistry,
+)
 
 
 def test_conversion_config_rejects_unknown_keys() -> None:
@@ -12,12 +19,55 @@ def test_conversion_config_rejects_unknown_keys() -> None:
         ConversionConfig.from_dict({"unknown_section": {"value": 1}})
 
 
+def test_conversion_config_with_overrides_is_memoized_by_value() -> None:
+    config = ConversionConfig()
+    first = config.with_overrides({"headings": {"anchor_level": 2}})
+    second = config.with_overrides({"headings": {"anchor_level": 2}})
+    assert first is second
+    assert first.headings.anchor_level == 2
+    assert config.with_overrides({"headings": {"anchor_level": 3}}) is not first
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [("=-", "-="), ("~~", "~="), ("^^", "^~"), ("%%", "%+")],
+)
+def test_override_memo_distinguishes_marker_order(first: str, second: str) -> None:
+    # Equal-length overlapping markers: whichever comes first in the mapping wins.
+    converter = MarkdownToLaTeXConverter()
+    end = second[-1]
+    text = f"b{first}{end}a{first}{end}a"
+    forward = {"inline": {"custom_markers": {first: "one", second: "two"}}}
+    backward = {"inline": {"custom_markers": {second: "two", first: "one"}}}
+    assert converter.convert_string(text, overrides=forward) == f"b\\one{{{end}a}}{end}a"
+    assert converter.convert_string(text, overrides=backward) == f"b{first[0]}\\two{{a{first[0]}}}a"
+
+
+def test_conversion_config_round_trips_through_pickle() -> None:
+    config = ConversionConfig.from_dict(
+        {"headings": {"anchor_level": 2}, "links": {"external_link_template": r"\href{url}{text}"}}
+    )
+    restored = pickle.loads(pickle.dumps(config))
+    assert restored == config
+    assert restored.links.format_external("https://x.y", "x") == r"\href{https://x.y}{x}"
+
+
 def test_markdown_parser_rejects_unterminated_code_fence() -> None:
     parser = MarkdownParser()
     with pytest.raises(InvalidCodeFenceError):
         parser.parse("```python\nprint('hello')\n")
 
 
+def test_markdown_parser_streams_files_like_strings(tmp_path: Path) -> None:
+    source = "# Title\r\n\n> [!note] Tip\n> - item\n\n| a | b |\n|---|:-:|\n| 1 | 2 |\n"
+    path = tmp_path / "notes.md"
+    path.write_bytes(source.encode("utf-8"))
+    parser = MarkdownParser()
+    expected = parser.parse(source)
+    assert parser.parse_file(path) == expected
+    assert parser.parse_stream(source.splitlines()) == expected
+
+
 def test_convert_spec_preserves_relative_chapter_layout(tmp_path: Path) -> None:
     template = tmp_path / "main.tex"
     template.write_text("{{content}}", encoding="utf-8")
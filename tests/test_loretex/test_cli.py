@@ -10,13 +10,9 @@ loretex.cli:
 typer.testing.CliRunner:
     Utility for testing command-line interfaces built with Typer.
 """
-from typer.testing import CliRunner
 
-from loretex.cli import app
 
-runner = CliRunner()
-
-def test_cli_help():
+def test_cli_help(app, runner):
     """
     Test that the CLI responds correctly to the `--help` command.
     """
@@ -26,7 +22,7 @@ def test_cli_help():
     assert "convert" in result.stdout  # checks if subcommand appears in help
 
 
-def test_cli_runs_on_spec(tmp_path):
+def test_cli_runs_on_spec(app, runner, tmp_path):
     """
     Test that the CLI can run with a valid specification file.
     This test creates a temporary specification file and invokes the CLI to ensure it can process
@@ -38,7 +34,24 @@ def test_cli_runs_on_spec(tmp_path):
     assert result.exit_code == 0
 
 
-def test_cli_convert_file_stdout(tmp_path):
+def test_cli_convert_spec_with_jobs(app, runner, tmp_path):
+    """
+    Test that the `--jobs` option is forwarded and every chapter is reported.
+    """
+    chapters = []
+    for name in ("one", "two", "three"):
+        source = tmp_path / f"{name}.md"
+        source.write_text(f"# {name}", encoding="utf-8")
+        chapters.append(f"  - file: {source}")
+    spec_file = tmp_path / "spec.yml"
+    spec_file.write_text("\n".join([f"output_dir: {tmp_path / 'out'}", "chapters:", *chapters]))
+    result = runner.invoke(app, ["convert", "--spec", str(spec_file), "--jobs", "2"])
+    assert result.exit_code == 0
+    assert result.stdout.count("[SUCCESS] Generated") == 3
+    assert (tmp_path / "out" / "three.tex").read_text(encoding="utf-8") == r"\section{three}"
+
+
+def test_cli_convert_file_stdout(app, runner, tmp_path):
     """
     Test that the CLI can convert a single file and write to stdout.
     """
@@ -50,7 +63,7 @@ def test_cli_convert_file_stdout(tmp_path):
     assert "World" in result.stdout
 
 
-def test_cli_convert_file_output(tmp_path):
+def test_cli_convert_file_output(app, runner, tmp_path):
     """
     Test that the CLI can convert a single file and write to a file.
     """
@@ -60,3 +73,17 @@ def test_cli_convert_file_output(tmp_path):
     result = runner.invoke(app, ["convert-file", str(input_file), "--out", str(output_file)])
     assert result.exit_code == 0
     assert output_file.read_text(encoding="utf-8").startswith(r"\section{Hello}")
+
+
+def test_cli_convert_file_reports_invalid_headings(app, runner, tmp_path):
+    """
+    Test that a non-mapping ``headings`` section is reported by the config, not the CLI merge.
+    """
+    input_file = tmp_path / "input.md"
+    input_file.write_text("# Hello", encoding="utf-8")
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("headings: x\n", encoding="utf-8")
+    result = runner.invoke(app, ["convert-file", str(input_file), "--config", str(config_file)])
+    assert result.exit_code != 0
+    assert isinstance(result.exception, ValueError)
+    assert "Unknown headings key(s): x" in str(result.exception)
@@ -0,0 +1,11 @@
+"""Shared fixtures for conversion tests."""
+
+import pytest
+
+from loretex.conversion import MarkdownToLaTeXConverter
+
+
+@pytest.fixture(scope="session")
+def converter() -> MarkdownToLaTeXConverter:
+    """Default converter, shared because conversion keeps no per-document state."""
+    return MarkdownToLaTeXConverter()
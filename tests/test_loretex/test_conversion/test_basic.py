@@ -1,115 +1,86 @@
 """Basic tests for conversion pipeline."""
 
-from loretex.conversion import MarkdownToLaTeXConverter
-
-
-def test_single_heading() -> None:
-    """Test conversion of single heading."""
-    converter = MarkdownToLaTeXConverter()
-
-    markdown = "# Introduction"
-    latex = converter.convert_string(markdown)
+import pytest
 
-    assert r"\section{Introduction}" in latex
-
-
-def test_nested_headings() -> None:
-    """Test conversion of nested headings."""
-    converter = MarkdownToLaTeXConverter()
+from loretex.conversion import MarkdownToLaTeXConverter
 
-    markdown = """# Chapter One
+BASIC_CASES = [
+    pytest.param(
+        "# Introduction",
+        [r"\section{Introduction}"],
+        id="single_heading",
+    ),
+    pytest.param(
+        """# Chapter One
 ## First Section
 ### Subsection A
-"""
-
-    latex = converter.convert_string(markdown)
-
-    assert r"\section{Chapter One}" in latex
-    assert r"\subsection{First Section}" in latex
-    assert r"\subsubsection{Subsection A}" in latex
-
-
-def test_paragraph() -> None:
-    """Test conversion of paragraph."""
-    converter = MarkdownToLaTeXConverter()
-
-    markdown = """# Title
+""",
+        [
+            r"\section{Chapter One}",
+            r"\subsection{First Section}",
+            r"\subsubsection{Subsection A}",
+        ],
+        id="nested_headings",
+    ),
+    pytest.param(
+        """# Title
 
 This is a paragraph.
-"""
-
-    latex = converter.convert_string(markdown)
-
-    assert r"\section{Title}" in latex
-    assert "This is a paragraph." in latex
-
-
-def test_unordered_list() -> None:
-    """Test conversion of unordered list."""
-    converter = MarkdownToLaTeXConverter()
-
-    markdown = """# Items
+""",
+        [r"\section{Title}", "This is a paragraph."],
+        id="paragraph",
+    ),
+    pytest.param(
+        """# Items
 
 - First item
 - Second item
 - Third item
-"""
-
-    latex = converter.convert_string(markdown)
-
-    assert r"\begin{itemize}" in latex
-    assert r"\item First item" in latex
-    assert r"\item Second item" in latex
-    assert r"\item Third item" in latex
-    assert r"\end{itemize}" in latex
-
-
-def test_ordered_list() -> None:
-    """Test conversion of ordered list."""
-    converter = MarkdownToLaTeXConverter()
-
-    markdown = """# Steps
+""",
+        [
+            r"\begin{itemize}",
+            r"\item First item",
+            r"\item Second item",
+            r"\item Third item",
+            r"\end{itemize}",
+        ],
+        id="unordered_list",
+    ),
+    pytest.param(
+        """# Steps
 
 1. First step
 2. Second step
 3. Third step
-"""
-
-    latex = converter.convert_string(markdown)
-
-    assert r"\begin{enumerate}" in latex
-    assert r"\item First step" in latex
-    assert r"\item Second step" in latex
-    assert r"\item Third step" in latex
-    assert r"\end{enumerate}" in latex
-
-
-def test_nested_list() -> None:
-    """Test conversion of nested list."""
-    converter = MarkdownToLaTeXConverter()
-
-    markdown = """# Hierarchy
+""",
+        [
+            r"\begin{enumerate}",
+            r"\item First step",
+            r"\item Second step",
+            r"\item Third step",
+            r"\end{enumerate}",
+        ],
+        id="ordered_list",
+    ),
+    pytest.param(
+        """# Hierarchy
 
 - Top level item
   - Nested item 1
   - Nested item 2
 - Another top level item
-"""
-
-    latex = converter.convert_string(markdown)
-
-    assert r"\begin{itemize}" in latex
-    assert r"\item Top level item" in latex
-    assert r"\item Nested item 1" in latex
-    assert r"\item Nested item 2" in latex
-    assert r"\item Another top level item" in latex
-
-
-def test_mixed_content() -> None:
-    """Test conversion with mixed content types."""
-    converter = MarkdownToLaTeXConverter()
-
-    markdown = """# Document
+""",
+        [
+            r"\begin{itemize}",
+            r"\item Top level item",
+            r"\item Nested item 1",
+            r"\item Nested item 2",
+            r"\item Another top level item",
+        ],
+        id="nested_list",
+    ),
+    pytest.param(
+        """# Document
 
 This is a paragraph before the list.
 
@@ -117,12 +88,28 @@ This is a paragraph before the list.
 - Item two
 
 This is a paragraph after the list.
-"""
-
+""",
+        [
+            r"\section{Document}",
+            "This is a paragraph before the list.",
+            r"\begin{itemize}",
+            r"\item Item one",
+            "This is a paragraph after the list.",
+        ],
+        id="mixed_content",
+    ),
+]
+"""Markdown documents and the LaTeX fragments their conversion must contain."""
+
+
+@pytest.mark.parametrize(("markdown", "expected_snippets"), BASIC_CASES)
+def test_conversion_contains_expected_latex(
+    converter: MarkdownToLaTeXConverter,
+    markdown: str,
+    expected_snippets: list[str],
+) -> None:
+    """Test conversion of headings, paragraphs, lists and mixed content."""
     latex = converter.convert_string(markdown)
 
-    assert r"\section{Document}" in latex
-    assert "This is a paragraph before the list." in latex
-    assert r"\begin{itemize}" in latex
-    assert r"\item Item one" in latex
-    assert "This is a paragraph after the list." in latex
+    missing = [snippet for snippet in expected_snippets if snippet not in latex]
+    assert not missing
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pickle
+
 from loretex.conversion import (
     InvalidCalloutError,
     InvalidCodeFenceError,
@@ -82,6 +84,16 @@ class TestInvalidCodeFenceError:
         assert error.context["line"] == 5
         assert error.context["content"] == "``invalid"
 
+    def test_pickle_round_trip(self) -> None:
+        """Error survives pickling, as when raised in a worker process."""
+        # Act
+        error = pickle.loads(pickle.dumps(InvalidCodeFenceError(line=5, content="``invalid")))
+
+        # Assert
+        assert type(error) is InvalidCodeFenceError
+        assert str(error) == "Invalid code fence at line 5: '``invalid'"
+        assert error.context == {"line": 5, "content": "``invalid"}
+
 
 class TestInvalidCalloutError:
     """Tests for InvalidCalloutError."""
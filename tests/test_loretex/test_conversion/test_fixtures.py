@@ -2,89 +2,90 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
 
 from loretex.conversion import MarkdownToLaTeXConverter
 
-FIXTURE_DIR = Path(__file__).resolve().parents[2] / "fixtures"
+FIXTURE_DIR = Path(__file__).parents[2] / "fixtures"
 
-FIXTURE_EXPECTATIONS: list[tuple[str, list[str]]] = [
+FIXTURE_EXPECTATIONS: tuple[tuple[str, tuple[str, ...]], ...] = (
     (
         "inline-formatting.md",
-        [
+        (
             r"\textbf{bold}",
             r"\textit{italic}",
             r"\texttt{a\_b\%\#\textbackslash{}",
             r"\texttt{**not bold**}",
             r"\includegraphics",
-        ],
+        ),
     ),
     (
         "code-blocks.md",
-        [
+        (
             r"\begin{lstlisting}",
             "def add(a, b):",
             "**bold**",
             r"\end{lstlisting}",
-        ],
+        ),
     ),
     (
         "callouts.md",
-        [
+        (
             r"\begin{notebox}[Title line]",
             r"\begin{warningbox}",
             r"\item item one",
             r"\includegraphics",
-        ],
+        ),
     ),
     (
         "images.md",
-        [
+        (
             r"\includegraphics[width=220\htmlpx]{../figures-pdfs/figs/figure-one.pdf}",
             r"\includegraphics[width=150\htmlpx]{../figures-pdfs/figs/figure-two.pdf}",
-        ],
+        ),
     ),
     (
         "lists.md",
-        [
+        (
             r"\begin{itemize}",
             r"\begin{enumerate}",
             r"\item Item one",
             r"\item Ordered one",
-        ],
+        ),
     ),
     (
         "blockquotes.md",
-        [
+        (
             "This is a quoted line.",
             r"\textbf{bold}",
-        ],
+        ),
     ),
     (
         "mixed-structure.md",
-        [
+        (
             r"\section{Mixed Document}",
             r"\subsection{Section A}",
             r"\subsubsection{Subsection A1}",
             r"\paragraph{Minor Heading}",
             r"\begin{importantbox}[Reminder]",
             r"\begin{lstlisting}",
-        ],
+        ),
     ),
     (
         "edge-cases.md",
-        [
+        (
             "pre*fix",
             "pre_fix",
             "asterisk*stuck",
             "x_1",
-        ],
+        ),
     ),
     (
         "tables.md",
-        [
+        (
             r"\begin{tabular}{lcr}",
             r"\hline",
             "Name & Age & City",
@@ -92,24 +93,27 @@ FIXTURE_EXPECTATIONS: list[tuple[str, list[str]]] = [
             r"\end{tabular}",
             r"\textbf{Bold}",
             r"\newline",
-        ],
+        ),
     ),
-]
+)
+
+
+@lru_cache(maxsize=None)
+def _convert_fixture(fixture_name: str) -> str:
+    """Convert a fixture file once, however many parametrized cases share it."""
+    markdown = (FIXTURE_DIR / fixture_name).read_text(encoding="utf-8")
+    return MarkdownToLaTeXConverter().convert_string(markdown)
 
 
 @pytest.mark.parametrize("fixture_name, expected_snippets", FIXTURE_EXPECTATIONS)
 def test_fixture_conversion_contains_expected_snippets(
     fixture_name: str,
-    expected_snippets: list[str],
+    expected_snippets: tuple[str, ...],
 ) -> None:
     """Verify fixture conversion includes expected LaTeX markers."""
-    # Arrange
-    converter = MarkdownToLaTeXConverter()
-    markdown = (FIXTURE_DIR / fixture_name).read_text(encoding="utf-8")
-
     # Act
-    latex = converter.convert_string(markdown)
+    latex = _convert_fixture(fixture_name)
 
     # Assert
-    for snippet in expected_snippets:
-        assert snippet in latex
+    missing = [snippet for snippet in expected_snippets if snippet not in latex]
+    assert not missing
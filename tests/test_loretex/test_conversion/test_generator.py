@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from loretex.conversion import ConversionConfig, InlineTransformer, LaTeXGenerator
 from loretex.conversion import (
     Callout,
@@ -16,157 +18,78 @@ from loretex.conversion import (
 )
 
 
-class TestInlineTransformer:
-    """Tests for InlineTransformer class."""
-
-    def test_bold_conversion(self) -> None:
-        """Convert **bold** to \\textbf."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
-
-        # Act
-        result = transformer.convert("This is **bold** text")
-
-        # Assert
-        assert r"\textbf{bold}" in result
-
-    def test_italic_star_conversion(self) -> None:
-        """Convert *italic* to \\textit."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
-
-        # Act
-        result = transformer.convert("This is *italic* text")
-
-        # Assert
-        assert r"\textit{italic}" in result
-
-    def test_italic_underscore_conversion(self) -> None:
-        """Convert _italic_ to \\textit."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
-
-        # Act
-        result = transformer.convert("This is _italic_ text")
-
-        # Assert
-        assert r"\textit{italic}" in result
-
-    def test_inline_code_conversion(self) -> None:
-        """Convert `code` to \\texttt."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
-
-        # Act
-        result = transformer.convert("Use `print()` function")
-
-        # Assert
-        assert r"\texttt{print()}" in result
-
-    def test_inline_code_escapes_backslash(self) -> None:
-        """Escape backslash in inline code."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
-
-        # Act
-        result = transformer.convert(r"`\n`")
-
-        # Assert
-        assert r"\texttt{\textbackslash{}n}" in result
-
-    def test_inline_code_escapes_braces(self) -> None:
-        """Escape braces in inline code."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
-
-        # Act
-        result = transformer.convert("`{}`")
-
-        # Assert
-        assert r"\texttt{\{\}}" in result
+INLINE_CASES = [
+    pytest.param("This is **bold** text", r"\textbf{bold}", id="bold"),
+    pytest.param("This is *italic* text", r"\textit{italic}", id="italic_star"),
+    pytest.param("This is _italic_ text", r"\textit{italic}", id="italic_underscore"),
+    pytest.param("Use `print()` function", r"\texttt{print()}", id="inline_code"),
+    pytest.param(r"`\n`", r"\texttt{\textbackslash{}n}", id="inline_code_escapes_backslash"),
+    pytest.param("`{}`", r"\texttt{\{\}}", id="inline_code_escapes_braces"),
+    pytest.param("`100%`", r"\texttt{100\%}", id="inline_code_escapes_percent"),
+    pytest.param("`#comment`", r"\texttt{\#comment}", id="inline_code_escapes_hash"),
+    pytest.param("`$var`", r"\texttt{\$var}", id="inline_code_escapes_dollar"),
+    pytest.param("`a & b`", r"\texttt{a \& b}", id="inline_code_escapes_ampersand"),
+    pytest.param("`var_name`", r"\texttt{var\_name}", id="inline_code_escapes_underscore"),
+    pytest.param("`~home`", r"\texttt{\textasciitilde{}home}", id="inline_code_escapes_tilde"),
+    pytest.param("`a^b`", r"\texttt{a\textasciicircum{}b}", id="inline_code_escapes_caret"),
+    pytest.param("it\u2019s fine", "it's fine", id="character_normalization_curly_quote"),
+    pytest.param("x ≤ 5", r"x \leq 5", id="character_normalization_leq"),
+    pytest.param("x ≥ 5", r"x \geq 5", id="character_normalization_geq"),
+    pytest.param("cœur", "coeur", id="character_normalization_oe"),
+    pytest.param("2020–2021", "2020-2021", id="character_normalization_endash"),
+]
+"""Inline Markdown snippets and a fragment of LaTeX their conversion must contain."""
 
-    def test_inline_code_escapes_percent(self) -> None:
-        """Escape percent in inline code."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
+INLINE_BATCH_SEPARATOR = "\n\n<!--SEP-->\n\n"
+"""Joins the inline cases into one text; it holds no Markdown and passes through unchanged."""
 
-        # Act
-        result = transformer.convert("`100%`")
+DEFAULT_CONFIG = ConversionConfig()
+"""Default conversion config, built once for the fixtures below (configs are frozen)."""
 
-        # Assert
-        assert r"\texttt{100\%}" in result
 
-    def test_inline_code_escapes_hash(self) -> None:
-        """Escape hash in inline code."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
+@pytest.fixture(scope="module")
+def transformer() -> InlineTransformer:
+    """Default inline transformer, shared by the tests of this module."""
+    return InlineTransformer(DEFAULT_CONFIG)
 
-        # Act
-        result = transformer.convert("`#comment`")
 
-        # Assert
-        assert r"\texttt{\#comment}" in result
+@pytest.fixture(scope="class")
+def generator() -> LaTeXGenerator:
+    """Default generator, shared by the tests of a class."""
+    return LaTeXGenerator(DEFAULT_CONFIG)
 
-    def test_inline_code_escapes_dollar(self) -> None:
-        """Escape dollar in inline code."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
 
-        # Act
-        result = transformer.convert("`$var`")
+@pytest.fixture(scope="module")
+def inline_results(transformer: InlineTransformer) -> dict[str, str]:
+    """Conversion of every inline case, from a single ``convert`` call over all of them."""
+    texts = [case.values[0] for case in INLINE_CASES]
+    results = transformer.convert(INLINE_BATCH_SEPARATOR.join(texts)).split(INLINE_BATCH_SEPARATOR)
+    assert len(results) == len(texts)
+    return dict(zip(texts, results))
 
-        # Assert
-        assert r"\texttt{\$var}" in result
 
-    def test_inline_code_escapes_ampersand(self) -> None:
-        """Escape ampersand in inline code."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
+def _simple_list(ordered: bool, texts: tuple[str, ...]) -> List:
+    """List whose items each hold one paragraph of text."""
+    items = [ListItem(content=[Paragraph(content=text)]) for text in texts]
+    return List(ordered=ordered, items=items)
 
-        # Act
-        result = transformer.convert("`a & b`")
 
-        # Assert
-        assert r"\texttt{a \& b}" in result
-
-    def test_inline_code_escapes_underscore(self) -> None:
-        """Escape underscore in inline code."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
-
-        # Act
-        result = transformer.convert("`var_name`")
-
-        # Assert
-        assert r"\texttt{var\_name}" in result
-
-    def test_inline_code_escapes_tilde(self) -> None:
-        """Escape tilde in inline code."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
-
-        # Act
-        result = transformer.convert("`~home`")
-
-        # Assert
-        assert r"\texttt{\textasciitilde{}home}" in result
-
-    def test_inline_code_escapes_caret(self) -> None:
-        """Escape caret in inline code."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
+class TestInlineTransformer:
+    """Tests for InlineTransformer class."""
 
+    @pytest.mark.parametrize(("text", "expected"), INLINE_CASES)
+    def test_conversion_contains_expected_latex(
+        self, inline_results: dict[str, str], text: str, expected: str
+    ) -> None:
+        """Convert inline markup, code escapes and normalized characters."""
         # Act
-        result = transformer.convert("`a^b`")
+        result = inline_results[text]
 
         # Assert
-        assert r"\texttt{a\textasciicircum{}b}" in result
+        assert expected in result
 
-    def test_formatting_preserved_in_inline_code(self) -> None:
+    def test_formatting_preserved_in_inline_code(self, transformer: InlineTransformer) -> None:
         """Bold markers inside inline code are not converted."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
-
         # Act
         result = transformer.convert("`**not bold**`")
 
@@ -174,69 +97,13 @@ class TestInlineTransformer:
         assert r"\texttt{**not bold**}" in result
         assert r"\textbf" not in result
 
-    def test_character_normalization_curly_quote(self) -> None:
-        """Normalize curly quote to straight apostrophe."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
-
-        # Act
-        result = transformer.convert("it\u2019s fine")
-
-        # Assert
-        assert "it's fine" in result
-
-    def test_character_normalization_leq(self) -> None:
-        """Normalize ≤ to \\leq."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
-
-        # Act
-        result = transformer.convert("x ≤ 5")
-
-        # Assert
-        assert r"x \leq 5" in result
-
-    def test_character_normalization_geq(self) -> None:
-        """Normalize ≥ to \\geq."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
-
-        # Act
-        result = transformer.convert("x ≥ 5")
-
-        # Assert
-        assert r"x \geq 5" in result
-
-    def test_character_normalization_oe(self) -> None:
-        """Normalize œ to oe."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
-
-        # Act
-        result = transformer.convert("cœur")
-
-        # Assert
-        assert "coeur" in result
-
-    def test_character_normalization_endash(self) -> None:
-        """Normalize en-dash to hyphen."""
-        # Arrange
-        transformer = InlineTransformer(ConversionConfig())
-
-        # Act
-        result = transformer.convert("2020–2021")
-
-        # Assert
-        assert "2020-2021" in result
-
 
 class TestLaTeXGenerator:
     """Tests for LaTeXGenerator class."""
 
-    def test_visit_document_empty(self) -> None:
+    def test_visit_document_empty(self, generator: LaTeXGenerator) -> None:
         """Empty document produces empty output."""
         # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
         doc = Document(children=[])
 
         # Act
@@ -245,10 +112,9 @@ class TestLaTeXGenerator:
         # Assert
         assert result == ""
 
-    def test_visit_document_with_children(self) -> None:
+    def test_visit_document_with_children(self, generator: LaTeXGenerator) -> None:
         """Document with children joins with double newlines."""
         # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
         doc = Document(children=[
             Section(level=1, title="Title"),
             Paragraph(content="Hello"),
@@ -258,74 +124,34 @@ class TestLaTeXGenerator:
         result = generator.visit_document(doc)
 
         # Assert
-        assert r"\section{Title}" in result
-        assert "Hello" in result
-        assert "\n\n" in result
-
-    def test_visit_section_level_1(self) -> None:
-        """Level 1 heading produces section command."""
-        # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
-        section = Section(level=1, title="Introduction")
-
-        # Act
-        result = generator.visit_section(section)
-
-        # Assert
-        assert result == r"\section{Introduction}"
-
-    def test_visit_section_level_2(self) -> None:
-        """Level 2 heading produces subsection command."""
-        # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
-        section = Section(level=2, title="Details")
-
-        # Act
-        result = generator.visit_section(section)
-
-        # Assert
-        assert result == r"\subsection{Details}"
-
-    def test_visit_section_level_3(self) -> None:
-        """Level 3 heading produces subsubsection command."""
-        # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
-        section = Section(level=3, title="Minor")
-
-        # Act
-        result = generator.visit_section(section)
-
-        # Assert
-        assert result == r"\subsubsection{Minor}"
+        assert result.split("\n\n") == [r"\section{Title}", "Hello"]
 
-    def test_visit_section_level_4(self) -> None:
-        """Level 4 heading produces paragraph command."""
+    @pytest.mark.parametrize(
+        ("level", "title", "expected"),
+        [
+            pytest.param(1, "Introduction", r"\section{Introduction}", id="level_1"),
+            pytest.param(2, "Details", r"\subsection{Details}", id="level_2"),
+            pytest.param(3, "Minor", r"\subsubsection{Minor}", id="level_3"),
+            pytest.param(4, "Point", r"\paragraph{Point}", id="level_4"),
+            pytest.param(5, "Deep", r"\paragraph{Deep}", id="level_5_fallback"),
+        ],
+    )
+    def test_visit_section_level(
+        self, generator: LaTeXGenerator, level: int, title: str, expected: str
+    ) -> None:
+        """Heading levels 1-3 map to sectioning commands; 4 and deeper to paragraph."""
         # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
-        section = Section(level=4, title="Point")
+        section = Section(level=level, title=title)
 
         # Act
         result = generator.visit_section(section)
 
         # Assert
-        assert result == r"\paragraph{Point}"
+        assert result == expected
 
-    def test_visit_section_level_5_fallback(self) -> None:
-        """Level 5+ heading falls back to paragraph command."""
-        # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
-        section = Section(level=5, title="Deep")
-
-        # Act
-        result = generator.visit_section(section)
-
-        # Assert
-        assert result == r"\paragraph{Deep}"
-
-    def test_visit_paragraph(self) -> None:
+    def test_visit_paragraph(self, generator: LaTeXGenerator) -> None:
         """Paragraph content is processed for inline formatting."""
         # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
         para = Paragraph(content="Text with **bold**")
 
         # Act
@@ -334,44 +160,34 @@ class TestLaTeXGenerator:
         # Assert
         assert r"\textbf{bold}" in result
 
-    def test_visit_list_unordered(self) -> None:
-        """Unordered list produces itemize environment."""
-        # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
-        lst = List(ordered=False, items=[
-            ListItem(content=[Paragraph(content="Item 1")]),
-            ListItem(content=[Paragraph(content="Item 2")]),
-        ])
+    @pytest.mark.parametrize(
+        ("ordered", "environment", "texts"),
+        [
+            pytest.param(False, "itemize", ("Item 1", "Item 2"), id="unordered"),
+            pytest.param(True, "enumerate", ("Step 1",), id="ordered"),
+        ],
+    )
+    def test_visit_list(
+        self,
+        generator: LaTeXGenerator,
+        ordered: bool,
+        environment: str,
+        texts: tuple[str, ...],
+    ) -> None:
+        """Unordered lists produce itemize and ordered lists enumerate environments."""
+        # Arrange
+        lst = _simple_list(ordered, texts)
 
         # Act
         result = generator.visit_list(lst)
 
         # Assert
-        assert r"\begin{itemize}" in result
-        assert r"\item Item 1" in result
-        assert r"\item Item 2" in result
-        assert r"\end{itemize}" in result
+        begin, end = f"\\begin{{{environment}}}", f"\\end{{{environment}}}"
+        assert result.split("\n") == [begin, *(f"\\item {text}" for text in texts), end]
 
-    def test_visit_list_ordered(self) -> None:
-        """Ordered list produces enumerate environment."""
-        # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
-        lst = List(ordered=True, items=[
-            ListItem(content=[Paragraph(content="Step 1")]),
-        ])
-
-        # Act
-        result = generator.visit_list(lst)
-
-        # Assert
-        assert r"\begin{enumerate}" in result
-        assert r"\item Step 1" in result
-        assert r"\end{enumerate}" in result
-
-    def test_visit_list_item_empty(self) -> None:
+    def test_visit_list_item_empty(self, generator: LaTeXGenerator) -> None:
         """Empty list item produces just \\item."""
         # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
         item = ListItem(content=[])
 
         # Act
@@ -380,10 +196,9 @@ class TestLaTeXGenerator:
         # Assert
         assert result == r"\item"
 
-    def test_visit_list_item_with_text(self) -> None:
+    def test_visit_list_item_with_text(self, generator: LaTeXGenerator) -> None:
         """List item with text paragraph."""
         # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
         item = ListItem(content=[Paragraph(content="Content")])
 
         # Act
@@ -392,41 +207,32 @@ class TestLaTeXGenerator:
         # Assert
         assert result == r"\item Content"
 
-    def test_visit_list_item_with_nested_list(self) -> None:
+    def test_visit_list_item_with_nested_list(self, generator: LaTeXGenerator) -> None:
         """List item with nested list."""
         # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
-        nested = List(ordered=False, items=[
-            ListItem(content=[Paragraph(content="Nested")])
-        ])
+        nested = _simple_list(False, ("Nested",))
         item = ListItem(content=[nested])
 
         # Act
         result = generator.visit_list_item(item)
 
         # Assert
-        assert r"\item" in result
-        assert r"\begin{itemize}" in result
-        assert r"\item Nested" in result
+        assert result == "\\item\n\\begin{itemize}\n\\item Nested\n\\end{itemize}"
 
-    def test_visit_code_block(self) -> None:
+    def test_visit_code_block(self, generator: LaTeXGenerator) -> None:
         """Code block produces lstlisting environment."""
         # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
         code = CodeBlock(language="python", content="print('hi')")
 
         # Act
         result = generator.visit_code_block(code)
 
         # Assert
-        assert r"\begin{lstlisting}" in result
-        assert "print('hi')" in result
-        assert r"\end{lstlisting}" in result
+        assert result == "\\begin{lstlisting}\nprint('hi')\n\\end{lstlisting}"
 
-    def test_visit_callout_with_title(self) -> None:
+    def test_visit_callout_with_title(self, generator: LaTeXGenerator) -> None:
         """Callout with title includes title in environment."""
         # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
         callout = Callout(
             callout_type="note",
             title="Important",
@@ -437,14 +243,11 @@ class TestLaTeXGenerator:
         result = generator.visit_callout(callout)
 
         # Assert
-        assert r"\begin{notebox}[Important]" in result
-        assert "Content" in result
-        assert r"\end{notebox}" in result
+        assert result == "\\begin{notebox}[Important]\nContent\n\\end{notebox}"
 
-    def test_visit_callout_without_title(self) -> None:
+    def test_visit_callout_without_title(self, generator: LaTeXGenerator) -> None:
         """Callout without title uses plain environment."""
         # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
         callout = Callout(
             callout_type="warning",
             title=None,
@@ -455,14 +258,11 @@ class TestLaTeXGenerator:
         result = generator.visit_callout(callout)
 
         # Assert
-        assert r"\begin{warningbox}" in result
-        assert "Warning text" in result
-        assert r"\end{warningbox}" in result
+        assert result == "\\begin{warningbox}\nWarning text\n\\end{warningbox}"
 
-    def test_visit_image(self) -> None:
+    def test_visit_image(self, generator: LaTeXGenerator) -> None:
         """Image produces centered includegraphics."""
         # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
         image = Image(source_path="figures/test", width_px=300)
 
         # Act
@@ -489,10 +289,9 @@ class TestLaTeXGenerator:
         # Assert
         assert result == "HELLO"
 
-    def test_visit_table_basic(self) -> None:
+    def test_visit_table_basic(self, generator: LaTeXGenerator) -> None:
         """Table produces tabular environment with header and rows."""
         # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
         table = Table(
             alignments=["l", "c", "r"],
             header=["Name", "Age", "City"],
@@ -503,17 +302,20 @@ class TestLaTeXGenerator:
         result = generator.visit_table(table)
 
         # Assert
-        assert r"\begin{tabular}{lcr}" in result
-        assert r"\hline" in result
-        assert "Name & Age & City" in result
-        assert "Alice & 30 & Paris" in result
-        assert "Bob & 25 & Lyon" in result
-        assert r"\end{tabular}" in result
-
-    def test_visit_table_inline_formatting(self) -> None:
+        assert result.split("\n") == [
+            r"\begin{tabular}{lcr}",
+            r"\hline",
+            r"Name & Age & City \\",
+            r"\hline",
+            r"Alice & 30 & Paris \\",
+            r"Bob & 25 & Lyon \\",
+            r"\hline",
+            r"\end{tabular}",
+        ]
+
+    def test_visit_table_inline_formatting(self, generator: LaTeXGenerator) -> None:
         """Table cells support inline formatting."""
         # Arrange
-        generator = LaTeXGenerator(ConversionConfig())
         table = Table(
             alignments=["l"],
             header=["Text"],
@@ -525,3 +327,19 @@ class TestLaTeXGenerator:
 
         # Assert
         assert r"\textbf{bold}" in result
+
+    def test_visit_document_renders_node_subclasses_through_accept(
+        self, generator: LaTeXGenerator
+    ) -> None:
+        """Node types outside the dispatch table still reach their visit method."""
+        # Arrange
+        class Note(Paragraph):
+            pass
+
+        doc = Document(children=[Note(content="**Hi**"), Paragraph(content="there")])
+
+        # Act
+        result = generator.visit_document(doc)
+
+        # Assert
+        assert result == "\\textbf{Hi}\n\nthere"
@@ -1,22 +1,41 @@
 """Tests for internal link and label handling."""
 
 from loretex.conversion import MarkdownToLaTeXConverter
+from loretex.conversion.labels import slugify
 
 
-def test_internal_link_to_ref() -> None:
+def test_internal_link_to_ref(converter: MarkdownToLaTeXConverter) -> None:
     """Convert [text](#label) to \\ref{label}."""
-    converter = MarkdownToLaTeXConverter()
     markdown = "See [section](#intro)."
     latex = converter.convert_string(markdown)
     assert r"\ref{intro}" in latex
 
 
-def test_auto_label_headings() -> None:
+def test_auto_label_headings(converter: MarkdownToLaTeXConverter) -> None:
     """Add labels to headings when enabled."""
-    converter = MarkdownToLaTeXConverter()
     markdown = "# Intro Section"
     latex = converter.convert_string(
         markdown,
         overrides={"labels": {"auto_label_headings": True}},
     )
     assert r"\label{intro-section}" in latex
+
+
+def test_slugify_keeps_unicode_alphanumerics() -> None:
+    """Collapse non-alphanumeric runs into one separator, keeping accented letters."""
+    assert slugify("  Équation (1) — Résumé_final ") == "équation-1-résumé-final"
+    assert slugify("a b", "\\") == "a\\b"
+    assert slugify("a  b", "x") == "axb"
+
+
+def test_label_prefix_applies_to_headings_and_internal_links(
+    converter: MarkdownToLaTeXConverter,
+) -> None:
+    """Heading labels and #links share the same prefixed slug."""
+    markdown = "# Intro Section\n\nSee [it](#Intro Section) and [again](#intro-section)."
+    latex = converter.convert_string(
+        markdown,
+        overrides={"labels": {"auto_label_headings": True, "label_prefix": "sec"}},
+    )
+    assert r"\label{sec-intro-section}" in latex
+    assert latex.count(r"\ref{sec-intro-section}") == 2
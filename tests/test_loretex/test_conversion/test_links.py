@@ -3,9 +3,8 @@
 from loretex.conversion import ConversionConfig, MarkdownToLaTeXConverter
 
 
-def test_markdown_link_converts_to_href() -> None:
+def test_markdown_link_converts_to_href(converter: MarkdownToLaTeXConverter) -> None:
     """Convert [text](url) to \\href."""
-    converter = MarkdownToLaTeXConverter()
     markdown = "See [Docs](https://example.com)."
     latex = converter.convert_string(markdown)
     assert r"\href{https://example.com}{Docs}" in latex
@@ -27,9 +26,18 @@ def test_markdown_link_same_text_uses_url_template() -> None:
     assert r"\url{https://example.com}" in latex
 
 
-def test_autolink_converts_to_url() -> None:
+def test_autolink_converts_to_url(converter: MarkdownToLaTeXConverter) -> None:
     """Convert <https://...> to \\url."""
-    converter = MarkdownToLaTeXConverter()
     markdown = "Visit <https://example.com>."
     latex = converter.convert_string(markdown)
     assert r"\url{https://example.com}" in latex
+
+
+def test_link_template_with_conversion_field_still_formats() -> None:
+    """Templates outside the plain-field fast path keep full str.format semantics."""
+    config = ConversionConfig.from_dict(
+        {"links": {"external_link_template": r"\href{{{url}}}{{{text!s:>5}}}"}}
+    )
+    converter = MarkdownToLaTeXConverter(config=config)
+    latex = converter.convert_string("[ab](https://example.com)")
+    assert r"\href{https://example.com}{   ab}" in latex
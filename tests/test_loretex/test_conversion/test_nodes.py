@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from loretex.conversion import (
     Callout,
     CodeBlock,
@@ -11,6 +13,7 @@ from loretex.conversion import (
     List,
     ListItem,
     MathBlock,
+    Node,
     NodeVisitor,
     Paragraph,
     Section,
@@ -55,205 +58,74 @@ class MockVisitor(NodeVisitor):
         return f"table:{len(node.rows)}rows"
 
 
-class TestDocumentNode:
-    """Tests for Document node."""
-
-    def test_document_accepts_visitor(self) -> None:
-        """Document node dispatches to visit_document."""
-        # Arrange
-        doc = Document(children=[])
-        visitor = MockVisitor()
-
-        # Act
-        result = doc.accept(visitor)
-
-        # Assert
-        assert result == "document"
-
-    def test_document_default_children(self) -> None:
-        """Document initializes with empty children list."""
-        # Act
-        doc = Document()
-
-        # Assert
-        assert doc.children == []
-
-
-class TestSectionNode:
-    """Tests for Section node."""
-
-    def test_section_accepts_visitor(self) -> None:
-        """Section node dispatches to visit_section."""
-        # Arrange
-        section = Section(level=2, title="Test Title")
-        visitor = MockVisitor()
-
-        # Act
-        result = section.accept(visitor)
-
-        # Assert
-        assert result == "section:2:Test Title"
-
-
-class TestParagraphNode:
-    """Tests for Paragraph node."""
-
-    def test_paragraph_accepts_visitor(self) -> None:
-        """Paragraph node dispatches to visit_paragraph."""
-        # Arrange
-        para = Paragraph(content="Hello world")
-        visitor = MockVisitor()
-
-        # Act
-        result = para.accept(visitor)
-
-        # Assert
-        assert result == "paragraph:Hello world"
-
-
-class TestListNode:
-    """Tests for List node."""
-
-    def test_ordered_list_accepts_visitor(self) -> None:
-        """Ordered list dispatches correctly."""
-        # Arrange
-        lst = List(ordered=True)
-        visitor = MockVisitor()
-
-        # Act
-        result = lst.accept(visitor)
-
-        # Assert
-        assert result == "list:ordered"
-
-    def test_unordered_list_accepts_visitor(self) -> None:
-        """Unordered list dispatches correctly."""
-        # Arrange
-        lst = List(ordered=False)
-        visitor = MockVisitor()
-
-        # Act
-        result = lst.accept(visitor)
-
-        # Assert
-        assert result == "list:unordered"
-
-    def test_list_default_items(self) -> None:
-        """List initializes with empty items list."""
-        # Act
-        lst = List(ordered=True)
-
-        # Assert
-        assert lst.items == []
-
-
-class TestListItemNode:
-    """Tests for ListItem node."""
-
-    def test_list_item_accepts_visitor(self) -> None:
-        """ListItem node dispatches to visit_list_item."""
-        # Arrange
-        item = ListItem()
-        visitor = MockVisitor()
-
-        # Act
-        result = item.accept(visitor)
-
-        # Assert
-        assert result == "list_item"
-
-    def test_list_item_default_content(self) -> None:
-        """ListItem initializes with empty content list."""
-        # Act
-        item = ListItem()
-
-        # Assert
-        assert item.content == []
-
-
-class TestCodeBlockNode:
-    """Tests for CodeBlock node."""
-
-    def test_code_block_accepts_visitor(self) -> None:
-        """CodeBlock node dispatches to visit_code_block."""
-        # Arrange
-        code = CodeBlock(language="python", content="print('hi')")
-        visitor = MockVisitor()
-
-        # Act
-        result = code.accept(visitor)
-
-        # Assert
-        assert result == "code:python"
-
-    def test_code_block_without_language(self) -> None:
-        """CodeBlock with no language returns 'none'."""
-        # Arrange
-        code = CodeBlock(language=None, content="text")
-        visitor = MockVisitor()
-
-        # Act
-        result = code.accept(visitor)
-
-        # Assert
-        assert result == "code:none"
-
+ACCEPT_CASES = [
+    pytest.param(Document(children=[]), "document", id="document"),
+    pytest.param(Section(level=2, title="Test Title"), "section:2:Test Title", id="section"),
+    pytest.param(Paragraph(content="Hello world"), "paragraph:Hello world", id="paragraph"),
+    pytest.param(List(ordered=True), "list:ordered", id="ordered_list"),
+    pytest.param(List(ordered=False), "list:unordered", id="unordered_list"),
+    pytest.param(ListItem(), "list_item", id="list_item"),
+    pytest.param(
+        CodeBlock(language="python", content="print('hi')"), "code:python", id="code_block"
+    ),
+    pytest.param(
+        CodeBlock(language=None, content="text"), "code:none", id="code_block_no_language"
+    ),
+    pytest.param(Callout(callout_type="note", title="Title"), "callout:note", id="callout"),
+    pytest.param(Image(source_path="figures/test", width_px=200), "image:figures/test", id="image"),
+    pytest.param(
+        Table(alignments=["l", "c"], header=["A", "B"], rows=[["1", "2"], ["3", "4"]]),
+        "table:2rows",
+        id="table",
+    ),
+]
+"""Nodes and the result of dispatching a MockVisitor through their accept method."""
 
-class TestCalloutNode:
-    """Tests for Callout node."""
+VISITOR = MockVisitor()
+"""Visitor shared by the dispatch tests (it keeps no state)."""
 
-    def test_callout_accepts_visitor(self) -> None:
-        """Callout node dispatches to visit_callout."""
-        # Arrange
-        callout = Callout(callout_type="note", title="Title")
-        visitor = MockVisitor()
 
-        # Act
-        result = callout.accept(visitor)
+@pytest.mark.parametrize(("node", "expected"), ACCEPT_CASES)
+def test_node_accept_dispatches_to_visit_method(node: Node, expected: str) -> None:
+    """Each node type dispatches to its own visit method."""
+    # Act
+    result = node.accept(VISITOR)
 
-        # Assert
-        assert result == "callout:note"
+    # Assert
+    assert result == expected
 
-    def test_callout_default_children(self) -> None:
-        """Callout initializes with empty children list."""
-        # Act
-        callout = Callout(callout_type="warning", title=None)
 
-        # Assert
-        assert callout.children == []
+def test_document_default_children() -> None:
+    """Document initializes with empty children list."""
+    # Act
+    doc = Document()
 
+    # Assert
+    assert doc.children == []
 
-class TestImageNode:
-    """Tests for Image node."""
 
-    def test_image_accepts_visitor(self) -> None:
-        """Image node dispatches to visit_image."""
-        # Arrange
-        image = Image(source_path="figures/test", width_px=200)
-        visitor = MockVisitor()
+def test_list_default_items() -> None:
+    """List initializes with empty items list."""
+    # Act
+    lst = List(ordered=True)
 
-        # Act
-        result = image.accept(visitor)
+    # Assert
+    assert lst.items == []
 
-        # Assert
-        assert result == "image:figures/test"
 
+def test_list_item_default_content() -> None:
+    """ListItem initializes with empty content list."""
+    # Act
+    item = ListItem()
 
-class TestTableNode:
-    """Tests for Table node."""
+    # Assert
+    assert item.content == []
 
-    def test_table_accepts_visitor(self) -> None:
-        """Table node dispatches to visit_table."""
-        # Arrange
-        table = Table(
-            alignments=["l", "c"],
-            header=["A", "B"],
-            rows=[["1", "2"], ["3", "4"]],
-        )
-        visitor = MockVisitor()
 
-        # Act
-        result = table.accept(visitor)
+def test_callout_default_children() -> None:
+    """Callout initializes with empty children list."""
+    # Act
+    callout = Callout(callout_type="warning", title=None)
 
-        # Assert
-        assert result == "table:2rows"
+    # Assert
+    assert callout.children == []
@@ -1,43 +1,188 @@
 """Rule coverage tests for md2latex converter."""
 
-from loretex.conversion import MarkdownToLaTeXConverter
-
-
-def test_code_block_python_to_lstlisting() -> None:
-    """Convert Python fenced code block to lstlisting."""
-    # Arrange
-    converter = MarkdownToLaTeXConverter()
-    markdown = "```python\nprint('hi')\n```"
-
-    # Act
-    latex = converter.convert_string(markdown)
-
-    # Assert
-    assert r"\begin{lstlisting}" in latex
-    assert "print('hi')" in latex
-    assert r"\end{lstlisting}" in latex
-
-
-def test_callout_converts_to_environment() -> None:
-    """Convert callout block to custom LaTeX environment."""
-    # Arrange
-    converter = MarkdownToLaTeXConverter()
-    markdown = "> [!note] Titre\n> Ligne 1\n> Ligne 2"
-
-    # Act
-    latex = converter.convert_string(markdown)
-
-    # Assert
-    assert r"\begin{notebox}[Titre]" in latex
-    assert "Ligne 1" in latex
-    assert "Ligne 2" in latex
-    assert r"\end{notebox}" in latex
-
-
-def test_blockquote_strip_leading_chevron() -> None:
+import warnings
+
+import pytest
+
+from loretex.conversion import ConversionConfig, MarkdownToLaTeXConverter
+
+
+RULE_CASES = [
+    pytest.param(
+        "```python\nprint('hi')\n```",
+        None,
+        [r"\begin{lstlisting}", "print('hi')", r"\end{lstlisting}"],
+        id="code_block_python_to_lstlisting",
+    ),
+    pytest.param(
+        "> [!note] Titre\n> Ligne 1\n> Ligne 2",
+        None,
+        [r"\begin{notebox}[Titre]", "Ligne 1", "Ligne 2", r"\end{notebox}"],
+        id="callout_converts_to_environment",
+    ),
+    pytest.param(
+        "# Titre\n## Sous-titre\n### Sous-sous-titre",
+        None,
+        [r"\section{Titre}", r"\subsection{Sous-titre}", r"\subsubsection{Sous-sous-titre}"],
+        id="headings_convert_to_sections",
+    ),
+    pytest.param(
+        "1. Premier\n2. Second",
+        None,
+        [r"\begin{enumerate}", r"\item Premier", r"\item Second", r"\end{enumerate}"],
+        id="ordered_list_conversion",
+    ),
+    pytest.param(
+        "Texte **gras** *italique* _italique_ `code`.",
+        None,
+        [r"\textbf{gras}", r"\textit{italique}", r"\texttt{code}"],
+        id="inline_formatting_rules",
+    ),
+    pytest.param(
+        "This is ==important==.",
+        None,
+        [r"\textbf{important}"],
+        id="custom_inline_marker",
+    ),
+    pytest.param(
+        "Code `a_b%#\\`",
+        None,
+        [r"\texttt{a\_b\%\#\textbackslash{}}"],
+        id="inline_code_escapes_special_characters",
+    ),
+    pytest.param(
+        '<img src="figures-svg/figure_1.svg" width="250">',
+        None,
+        [
+            r"\begin{center}",
+            r"\includegraphics[width=250\htmlpx]{../figures-pdfs/figures-svg/figure_1.pdf}",
+            r"\end{center}",
+        ],
+        id="image_tag_conversion",
+    ),
+    pytest.param(
+        "\u2264 \u2265 \u0153 \u2013 \u2019",
+        None,
+        [r"\leq", r"\geq", "oe", "-", "'"],
+        id="character_normalization",
+    ),
+    pytest.param(
+        "Inline math $a_b + c$ should stay.",
+        None,
+        ["$a_b + c$"],
+        id="inline_math_preserved",
+    ),
+    pytest.param(
+        "Texte _und_$x^2$.",
+        None,
+        [r"\textit{und}$x^2$"],
+        id="italic_underscore_next_to_inline_math",
+    ),
+    pytest.param(
+        "_$a$b$_",
+        None,
+        [r"\textit{$a$b$}"],
+        id="italic_underscore_around_inline_math",
+    ),
+    pytest.param(
+        "| A | B |\n|---|---|\n| 1 | 2 |",
+        None,
+        [r"\begin{tabular}{ll}", "A & B", "1 & 2", r"\hline", r"\end{tabular}"],
+        id="table_converts_to_tabular",
+    ),
+    pytest.param(
+        "Paragraph\n\n---\n\nAfter",
+        None,
+        [r"\hrule"],
+        id="horizontal_rule",
+    ),
+    pytest.param(
+        "| L | C | R |\n|:--|:--:|--:|\n| a | b | c |",
+        None,
+        [r"\begin{tabular}{lcr}"],
+        id="table_alignment_detection",
+    ),
+    pytest.param(
+        "| Text |\n|------|\n| **bold** |",
+        None,
+        [r"\textbf{bold}"],
+        id="table_inline_formatting",
+    ),
+    pytest.param(
+        "| Text |\n|------|\n| Line1<br>Line2 |",
+        None,
+        [r"\newline"],
+        id="table_br_to_newline",
+    ),
+    pytest.param(
+        "See [@doe2020].",
+        None,
+        [r"\cite{doe2020}"],
+        id="citation_single",
+    ),
+    pytest.param(
+        "See [@doe2020; @smith2021].",
+        None,
+        [r"\cite{doe2020,smith2021}"],
+        id="citation_multiple",
+    ),
+    pytest.param(
+        "See [@doe2020, p. 2].",
+        None,
+        [r"\cite[p. 2]{doe2020}"],
+        id="citation_with_locator",
+    ),
+    pytest.param(
+        "$$\nE = mc^2\n$$",
+        {"math": {"block_style": "brackets"}},
+        [r"\[", r"\]"],
+        id="math_block_brackets",
+    ),
+    pytest.param(
+        "| A | B | C |\n|---|---|---|\n| Span{col=2} | X |",
+        None,
+        [r"\multicolumn{2}{c}{Span}"],
+        id="table_colspan",
+    ),
+]
+"""Markdown snippets, optional config overrides and the LaTeX fragments they must produce."""
+
+RULE_BATCH_SEPARATOR = "\n\n<!--SEP-->\n\n"
+"""Separates the snippets converted together; a standalone paragraph that survives verbatim."""
+
+
+@pytest.fixture(scope="module")
+def rule_results(converter: MarkdownToLaTeXConverter) -> dict[str, str]:
+    """Conversion of every default-config snippet, as one document split back per snippet."""
+    snippets = [case.values[0] for case in RULE_CASES if case.values[1] is None]
+    latex = converter.convert_string(RULE_BATCH_SEPARATOR.join(snippets))
+    results = latex.split(RULE_BATCH_SEPARATOR)
+    assert len(results) == len(snippets)
+    return dict(zip(snippets, results))
+
+
+@pytest.mark.parametrize(("markdown", "overrides", "expected_snippets"), RULE_CASES)
+def test_rule_produces_expected_latex(
+    converter: MarkdownToLaTeXConverter,
+    rule_results: dict[str, str],
+    markdown: str,
+    overrides: dict | None,
+    expected_snippets: list[str],
+) -> None:
+    """Convert one snippet per rule and check the LaTeX fragments it must contain."""
+    # Overrides change the conversion, so those snippets are not part of the batch.
+    if overrides is None:
+        latex = rule_results[markdown]
+    else:
+        latex = converter.convert_string(markdown, overrides=overrides)
+
+    missing = [snippet for snippet in expected_snippets if snippet not in latex]
+    assert not missing
+
+
+def test_blockquote_strip_leading_chevron(converter: MarkdownToLaTeXConverter) -> None:
     """Strip leading chevrons for non-callout blockquotes."""
     # Arrange
-    converter = MarkdownToLaTeXConverter()
     markdown = "> Ligne 1\n> Ligne 2"
 
     # Act
@@ -49,25 +194,9 @@ def test_blockquote_strip_leading_chevron() -> None:
     assert "> Ligne" not in latex
 
 
-def test_headings_convert_to_sections() -> None:
-    """Convert heading levels to LaTeX section commands."""
-    # Arrange
-    converter = MarkdownToLaTeXConverter()
-    markdown = "# Titre\n## Sous-titre\n### Sous-sous-titre"
-
-    # Act
-    latex = converter.convert_string(markdown)
-
-    # Assert
-    assert r"\section{Titre}" in latex
-    assert r"\subsection{Sous-titre}" in latex
-    assert r"\subsubsection{Sous-sous-titre}" in latex
-
-
-def test_nested_unordered_lists() -> None:
+def test_nested_unordered_lists(converter: MarkdownToLaTeXConverter) -> None:
     """Convert nested unordered lists to itemize environments."""
     # Arrange
-    converter = MarkdownToLaTeXConverter()
     markdown = "- Parent\n  - Enfant 1\n  - Enfant 2"
 
     # Act
@@ -80,97 +209,48 @@ def test_nested_unordered_lists() -> None:
     assert r"\item Enfant 2" in latex
 
 
-def test_ordered_list_conversion() -> None:
-    """Convert ordered list to enumerate environment."""
+def test_image_path_validation_warns_only_for_missing_files(tmp_path) -> None:
+    """Warn when a validated image path does not exist on disk."""
     # Arrange
-    converter = MarkdownToLaTeXConverter()
-    markdown = "1. Premier\n2. Second"
-
-    # Act
-    latex = converter.convert_string(markdown)
-
-    # Assert
-    assert r"\begin{enumerate}" in latex
-    assert r"\item Premier" in latex
-    assert r"\item Second" in latex
-    assert r"\end{enumerate}" in latex
-
-
-def test_inline_formatting_rules() -> None:
-    """Convert inline bold, italic, and code formatting."""
-    # Arrange
-    converter = MarkdownToLaTeXConverter()
-    markdown = "Texte **gras** *italique* _italique_ `code`."
-
-    # Act
-    latex = converter.convert_string(markdown)
-
-    # Assert
-    assert r"\textbf{gras}" in latex
-    assert r"\textit{italique}" in latex
-    assert r"\texttt{code}" in latex
-
-
-def test_custom_inline_marker() -> None:
-    """Convert custom inline markers using configured templates."""
-    converter = MarkdownToLaTeXConverter()
-    markdown = "This is ==important==."
-    latex = converter.convert_string(markdown)
-    assert r"\textbf{important}" in latex
-
-
-def test_inline_code_escapes_special_characters() -> None:
-    """Escape LaTeX special characters inside inline code."""
-    # Arrange
-    converter = MarkdownToLaTeXConverter()
-    markdown = "Code `a_b%#\\`"
-
-    # Act
-    latex = converter.convert_string(markdown)
+    (tmp_path / "figs").mkdir()
+    (tmp_path / "figs" / "present.pdf").write_text("", encoding="utf-8")
+    config = ConversionConfig.from_dict(
+        {"images": {"path_prefix": "figs", "base_dir": str(tmp_path), "validate_paths": True}}
+    )
+    converter = MarkdownToLaTeXConverter(config=config)
 
-    # Assert
-    assert r"\texttt{a\_b\%\#\textbackslash{}}" in latex
+    # Act / Assert
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        converter.convert_string('<img src="present.svg" width="10">')
+    with pytest.warns(UserWarning, match="Image not found"):
+        converter.convert_string('<img src="missing.svg" width="10">')
 
 
-def test_image_tag_conversion() -> None:
-    """Convert HTML image tag to includegraphics."""
+def test_image_path_validation_sees_files_created_between_conversions(tmp_path) -> None:
+    """Existence checks are not cached across conversions by the same converter."""
     # Arrange
-    converter = MarkdownToLaTeXConverter()
-    markdown = '<img src="figures-svg/figure_1.svg" width="250">'
-
-    # Act
-    latex = converter.convert_string(markdown)
-
-    # Assert
-    assert r"\begin{center}" in latex
-    assert (
-        r"\includegraphics[width=250\htmlpx]{../figures-pdfs/figures-svg/figure_1.pdf}"
-        in latex
+    config = ConversionConfig.from_dict(
+        {"images": {"path_prefix": "figs", "base_dir": str(tmp_path), "validate_paths": True}}
     )
-    assert r"\end{center}" in latex
-
-
-def test_character_normalization() -> None:
-    """Normalize typographic characters to LaTeX equivalents."""
-    # Arrange
-    converter = MarkdownToLaTeXConverter()
-    markdown = "\u2264 \u2265 \u0153 \u2013 \u2019"
+    converter = MarkdownToLaTeXConverter(config=config)
+    (tmp_path / "figs").mkdir()
+    markdown = '<img src="later.svg" width="10">'
+    with pytest.warns(UserWarning, match="Image not found"):
+        converter.convert_string(markdown)
 
     # Act
-    latex = converter.convert_string(markdown)
+    (tmp_path / "figs" / "later.pdf").write_text("", encoding="utf-8")
 
     # Assert
-    assert r"\leq" in latex
-    assert r"\geq" in latex
-    assert "oe" in latex
-    assert "-" in latex
-    assert "'" in latex
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        converter.convert_string(markdown)
 
 
-def test_inline_formatting_not_applied_in_code_block() -> None:
+def test_inline_formatting_not_applied_in_code_block(converter: MarkdownToLaTeXConverter) -> None:
     """Avoid inline formatting inside fenced code blocks."""
     # Arrange
-    converter = MarkdownToLaTeXConverter()
     markdown = "```python\n**gras**\n```"
 
     # Act
@@ -181,10 +261,9 @@ def test_inline_formatting_not_applied_in_code_block() -> None:
     assert r"\textbf{gras}" not in latex
 
 
-def test_inline_formatting_not_applied_in_inline_code() -> None:
+def test_inline_formatting_not_applied_in_inline_code(converter: MarkdownToLaTeXConverter) -> None:
     """Avoid inline formatting inside inline code."""
     # Arrange
-    converter = MarkdownToLaTeXConverter()
     markdown = "Texte `**x**`"
 
     # Act
@@ -195,81 +274,27 @@ def test_inline_formatting_not_applied_in_inline_code() -> None:
     assert r"\textbf{x}" not in latex
 
 
-def test_inline_math_preserved() -> None:
-    """Avoid inline formatting inside inline math."""
-    converter = MarkdownToLaTeXConverter()
-    markdown = "Inline math $a_b + c$ should stay."
-    latex = converter.convert_string(markdown)
-    assert "$a_b + c$" in latex
-
-
-def test_table_converts_to_tabular() -> None:
-    """Convert Markdown table to LaTeX tabular environment."""
-    # Arrange
-    converter = MarkdownToLaTeXConverter()
-    markdown = "| A | B |\n|---|---|\n| 1 | 2 |"
-
-    # Act
-    latex = converter.convert_string(markdown)
-
-    # Assert
-    assert r"\begin{tabular}{ll}" in latex
-    assert "A & B" in latex
-    assert "1 & 2" in latex
-    assert r"\hline" in latex
-    assert r"\end{tabular}" in latex
-
-
-def test_horizontal_rule() -> None:
-    """Convert Markdown horizontal rule to LaTeX rule."""
-    converter = MarkdownToLaTeXConverter()
-    markdown = "Paragraph\n\n---\n\nAfter"
-    latex = converter.convert_string(markdown)
-    assert r"\hrule" in latex
-
-
-def test_table_alignment_detection() -> None:
-    """Detect left, center, and right alignment from separator."""
-    # Arrange
-    converter = MarkdownToLaTeXConverter()
-    markdown = "| L | C | R |\n|:--|:--:|--:|\n| a | b | c |"
-
-    # Act
+def test_inline_math_with_nested_delimiters_is_restored(
+    converter: MarkdownToLaTeXConverter,
+) -> None:
+    """Keep \\(...\\) inside $...$ (and many spans per line) intact."""
+    markdown = r"Nested $a \(b\) c$ and " + " ".join(f"$x_{i}$" for i in range(6))
     latex = converter.convert_string(markdown)
+    assert r"$a \(b\) c$" in latex
+    assert "$x_5$" in latex
+    assert "LORETEX_MATH" not in latex
 
-    # Assert
-    assert r"\begin{tabular}{lcr}" in latex
 
+def test_inline_math_placeholder_lookalikes_are_left_alone(
+    converter: MarkdownToLaTeXConverter,
+) -> None:
+    """NUL-delimited text resembling the internal math placeholder passes through verbatim."""
+    for markdown in ["$a$ \x00M5\x00 b", "$a$ \x00M0\x00 b", "$a\x00b$ c\x00"]:
+        assert converter.convert_string(markdown) == markdown
 
-def test_table_inline_formatting() -> None:
-    """Apply inline formatting inside table cells."""
-    # Arrange
-    converter = MarkdownToLaTeXConverter()
-    markdown = "| Text |\n|------|\n| **bold** |"
 
-    # Act
-    latex = converter.convert_string(markdown)
-
-    # Assert
-    assert r"\textbf{bold}" in latex
-
-
-def test_table_br_to_newline() -> None:
-    """Convert <br> tags to newline in table cells."""
-    # Arrange
-    converter = MarkdownToLaTeXConverter()
-    markdown = "| Text |\n|------|\n| Line1<br>Line2 |"
-
-    # Act
-    latex = converter.convert_string(markdown)
-
-    # Assert
-    assert r"\newline" in latex
-
-
-def test_strip_yaml_front_matter() -> None:
+def test_strip_yaml_front_matter(converter: MarkdownToLaTeXConverter) -> None:
     """Strip YAML front matter when configured."""
-    converter = MarkdownToLaTeXConverter()
     markdown = """---
 title: Sample
 tags:
@@ -286,47 +311,3 @@ Content here.
     )
     assert r"\section{Heading}" in latex
     assert "title:" not in latex
-
-
-def test_citation_single() -> None:
-    """Convert [@key] to \\cite{key}."""
-    converter = MarkdownToLaTeXConverter()
-    markdown = "See [@doe2020]."
-    latex = converter.convert_string(markdown)
-    assert r"\cite{doe2020}" in latex
-
-
-def test_citation_multiple() -> None:
-    """Convert [@a; @b] to \\cite{a,b}."""
-    converter = MarkdownToLaTeXConverter()
-    markdown = "See [@doe2020; @smith2021]."
-    latex = converter.convert_string(markdown)
-    assert r"\cite{doe2020,smith2021}" in latex
-
-
-def test_citation_with_locator() -> None:
-    """Convert [@key, p. 2] to \\cite[p. 2]{key}."""
-    converter = MarkdownToLaTeXConverter()
-    markdown = "See [@doe2020, p. 2]."
-    latex = converter.convert_string(markdown)
-    assert r"\cite[p. 2]{doe2020}" in latex
-
-
-def test_math_block_brackets() -> None:
-    """Convert $$...$$ to \\[...\\] when configured."""
-    converter = MarkdownToLaTeXConverter()
-    markdown = "$$\nE = mc^2\n$$"
-    latex = converter.convert_string(
-        markdown,
-        overrides={"math": {"block_style": "brackets"}},
-    )
-    assert r"\[" in latex
-    assert r"\]" in latex
-
-
-def test_table_colspan() -> None:
-    """Support colspan in table cells."""
-    converter = MarkdownToLaTeXConverter()
-    markdown = "| A | B | C |\n|---|---|---|\n| Span{col=2} | X |"
-    latex = converter.convert_string(markdown)
-    assert r"\multicolumn{2}{c}{Span}" in latex
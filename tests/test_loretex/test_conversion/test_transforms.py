@@ -4,26 +4,38 @@ from loretex.conversion import (
     Document,
     MarkdownToLaTeXConverter,
     Paragraph,
+    compose_transforms,
     register_transform,
 )
 
 
+def _add_notice(doc: Document) -> Document:
+    return Document(children=[Paragraph("NOTICE")] + doc.children)
+
+
 def test_transform_pipeline_applied() -> None:
     """Apply a transform to prepend a notice paragraph."""
-    def add_notice(doc: Document) -> Document:
-        return Document(children=[Paragraph("NOTICE")] + doc.children)
-
-    converter = MarkdownToLaTeXConverter(transforms=[add_notice])
+    converter = MarkdownToLaTeXConverter(transforms=[_add_notice])
     latex = converter.convert_string("# Title")
     assert "NOTICE" in latex
 
 
 def test_transform_registry_by_name() -> None:
     """Resolve registered transforms by name."""
-    def add_notice(doc: Document) -> Document:
-        return Document(children=[Paragraph("NOTICE")] + doc.children)
-
-    register_transform("notice-test", add_notice, overwrite=True)
+    register_transform("notice-test", _add_notice, overwrite=True)
     converter = MarkdownToLaTeXConverter(transform_names=["notice-test"])
     latex = converter.convert_string("# Title")
     assert "NOTICE" in latex
+
+
+def test_compose_transforms_applies_in_order() -> None:
+    """Compose transforms left to right, returning a lone transform unchanged."""
+    def append(text: str):
+        def transform(doc: Document) -> Document:
+            return Document(children=[*doc.children, Paragraph(text)])
+        return transform
+
+    first = append("a")
+    assert compose_transforms([first]) is first
+    composed = compose_transforms(iter([first, append("b"), append("c")]))
+    assert [child.content for child in composed(Document()).children] == ["a", "b", "c"]
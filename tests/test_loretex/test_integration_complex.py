@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+from functools import lru_cache
+import os
 import shutil
 import subprocess
 from pathlib import Path
+from typing import NamedTuple
 
 import pytest
 import yaml
 
 from loretex.api import convert_spec
 
+# libyaml bindings when available, as in loretex.utils.io.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def _fixture_dir() -> Path:
-    return Path(__file__).resolve().parents[1] / "fixtures" / "complex"
+    return Path(__file__).parents[1] / "fixtures" / "complex"
 
 
 def _write_temp_spec(
@@ -21,7 +28,7 @@ def _write_temp_spec(
     main_output: Path,
     working_dir: Path,
 ) -> Path:
-    spec = yaml.safe_load(spec_template.read_text(encoding="utf-8"))
+    spec = yaml.load(spec_template.read_text(encoding="utf-8"), Loader=_YAML_LOADER)
     spec["output_dir"] = str(output_dir)
     spec["template"] = str(template_path)
     spec["main_output"] = str(main_output)
@@ -38,7 +45,7 @@ def _write_temp_spec(
     if updated_chapters:
         spec["chapters"] = updated_chapters
     spec_path = output_dir / "spec.yml"
-    spec_path.write_text(yaml.safe_dump(spec, sort_keys=False), encoding="utf-8")
+    spec_path.write_text(yaml.dump(spec, Dumper=_YAML_DUMPER, sort_keys=False), encoding="utf-8")
     return spec_path
 
 
@@ -47,56 +54,97 @@ def _ensure_assets(tmp_root: Path, fixture_root: Path) -> bool:
     if not assets_src.exists():
         return False
     assets_dst = tmp_root / "assets"
-    shutil.copytree(assets_src, assets_dst, dirs_exist_ok=True)
+    shutil.copytree(assets_src, assets_dst, dirs_exist_ok=True, copy_function=_link_or_copy)
     expected = assets_dst / "figs" / "diagram.pdf"
     return expected.exists()
 
 
+def _link_or_copy(src: str | Path, dst: str | Path) -> None:
+    # Fixture files are only read, so a hard link serves; copy across devices or without links.
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+@lru_cache(maxsize=None)
 def _latexmk_available() -> bool:
     return shutil.which("latexmk") is not None
 
 
+@lru_cache(maxsize=None)
 def _pdflatex_available() -> bool:
     return shutil.which("pdflatex") is not None
 
 
 def _compile_pdf(output_dir: Path, main_tex: Path) -> Path:
+    # Batch mode and discarded streams: errors are in the .log file and fail the run anyway.
     if _latexmk_available():
-        subprocess.run(
-            ["latexmk", "-pdf", "-interaction=nonstopmode", "-halt-on-error", main_tex.name],
-            check=True,
-            cwd=output_dir,
-        )
+        _run_latex(["latexmk", "-pdf", "-interaction=batchmode", "-halt-on-error"], main_tex)
     elif _pdflatex_available():
-        for _ in range(2):
-            subprocess.run(
-                ["pdflatex", "-interaction=nonstopmode", "-halt-on-error", main_tex.name],
-                check=True,
-                cwd=output_dir,
-            )
+        log_path = output_dir / main_tex.with_suffix(".log").name
+        _run_latex(["pdflatex", "-interaction=batchmode", "-halt-on-error"], main_tex)
+        if _needs_rerun(log_path):
+            _run_latex(["pdflatex", "-interaction=batchmode", "-halt-on-error"], main_tex)
     else:
         pytest.skip("No LaTeX engine available (latexmk or pdflatex).")
     return output_dir / main_tex.with_suffix(".pdf").name
 
 
-def test_complex_pipeline_to_pdf(tmp_path: Path) -> None:
+def _run_latex(command: list[str], main_tex: Path) -> None:
+    try:
+        subprocess.run(
+            [*command, main_tex.name],
+            check=True,
+            cwd=main_tex.parent,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except subprocess.CalledProcessError as error:
+        # The streams were discarded, so the log is the only place the LaTeX error shows.
+        log_path = main_tex.with_suffix(".log")
+        log = log_path.read_text(encoding="utf-8", errors="ignore") if log_path.exists() else ""
+        tail = "\n".join(log.splitlines()[-_LOG_TAIL_LINES:]) or "(no log written)"
+        pytest.fail(f"{' '.join(error.cmd)} exited with {error.returncode}:\n{tail}")
+
+
+_LOG_TAIL_LINES = 40
+"""Lines of the LaTeX log shown when a build fails."""
+
+
+def _needs_rerun(log_path: Path) -> bool:
+    log = log_path.read_text(encoding="utf-8", errors="ignore")
+    return "Rerun to get" in log or "Label(s) may have changed" in log
+
+
+class _ComplexBuild(NamedTuple):
+    output_dir: Path
+    main_output: Path
+    chapter_outputs: list[Path]
+    assets_ready: bool
+
+
+@pytest.fixture(scope="module")
+def complex_build(tmp_path_factory: pytest.TempPathFactory) -> _ComplexBuild:
+    """Copy the complex fixture and convert its spec once for every test of this module."""
     fixture_root = _fixture_dir()
-    working_dir = tmp_path / "complex"
-    working_dir.mkdir()
+    working_dir = tmp_path_factory.mktemp("complex")
 
     chapters_src = fixture_root / "chapters"
     chapters_dst = working_dir / "chapters"
-    shutil.copytree(chapters_src, chapters_dst, dirs_exist_ok=True)
+    shutil.copytree(chapters_src, chapters_dst, dirs_exist_ok=True, copy_function=_link_or_copy)
 
     template_src = fixture_root / "template.tex"
     template_dst = working_dir / "template.tex"
-    shutil.copy2(template_src, template_dst)
+    _link_or_copy(template_src, template_dst)
     callout_src = fixture_root / "loretex-callouts.sty"
     callout_dst = working_dir / "loretex-callouts.sty"
-    shutil.copy2(callout_src, callout_dst)
+    _link_or_copy(callout_src, callout_dst)
     icons_src = fixture_root / "icons"
     if icons_src.exists():
-        shutil.copytree(icons_src, working_dir / "icons", dirs_exist_ok=True)
+        shutil.copytree(
+            icons_src, working_dir / "icons", dirs_exist_ok=True, copy_function=_link_or_copy
+        )
 
     assets_ready = _ensure_assets(working_dir, fixture_root)
 
@@ -113,11 +161,23 @@ def test_complex_pipeline_to_pdf(tmp_path: Path) -> None:
     )
 
     result = convert_spec(spec_path)
-    assert result.chapter_outputs, "Expected chapter outputs to be generated."
-    assert main_output.exists()
+    return _ComplexBuild(
+        output_dir=output_dir,
+        main_output=main_output,
+        chapter_outputs=result.chapter_outputs,
+        assets_ready=assets_ready,
+    )
+
+
+def test_complex_pipeline_generates_outputs(complex_build: _ComplexBuild) -> None:
+    assert complex_build.chapter_outputs, "Expected chapter outputs to be generated."
+    assert complex_build.main_output.exists()
+
 
-    if not assets_ready:
+@pytest.mark.slow
+def test_complex_pipeline_to_pdf(complex_build: _ComplexBuild) -> None:
+    if not complex_build.assets_ready:
         pytest.skip("Missing PDF assets under tests/fixtures/complex/assets.")
 
-    pdf_path = _compile_pdf(output_dir, main_output)
+    pdf_path = _compile_pdf(complex_build.output_dir, complex_build.main_output)
     assert pdf_path.exists()
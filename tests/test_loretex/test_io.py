@@ -0,0 +1,65 @@
+"""Tests for file I/O helpers."""
+
+import mmap
+from pathlib import Path
+
+import pytest
+
+from loretex.utils import io
+from loretex.utils.io import read_utf8, read_utf8_files
+
+SAMPLES = {
+    "a/lf.md": "# LF\nline é\n".encode("utf-8"),
+    "a/crlf.md": b"# CRLF\r\nline\r\n\r\nend",
+    "b/cr.md": b"# CR\rline\r",
+    "b/mixed.md": b"one\r\ntwo\rthree\n",
+    "b/empty.md": b"",
+}
+"""Files spread over two directories, covering every line-ending style."""
+
+
+def _write_samples(root: Path) -> list[Path]:
+    paths = []
+    for relative, data in SAMPLES.items():
+        path = root / relative
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(data)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("mapped", [False, True], ids=["read", "mmap"])
+def test_read_utf8_files_matches_read_text(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mapped: bool
+) -> None:
+    mappings: list[int] = []
+    real_mmap = mmap.mmap
+
+    def recording_mmap(fd: int, length: int, **kwargs: object) -> mmap.mmap:
+        mappings.append(fd)
+        return real_mmap(fd, length, **kwargs)
+
+    if mapped:
+        monkeypatch.setattr(io, "_MMAP_MIN_SIZE", 1)
+    monkeypatch.setattr(io.mmap, "mmap", recording_mmap)
+    paths = _write_samples(tmp_path)
+    # Interleave the two directories so grouping by directory must restore the order.
+    paths = paths[::2] + paths[1::2]
+
+    expected = [path.read_text(encoding="utf-8") for path in paths]
+    assert read_utf8_files(paths) == expected
+    assert [read_utf8(path) for path in paths] == expected
+    # Each non-empty file is mapped once per reader; empty files are below any minimum.
+    non_empty = sum(1 for data in SAMPLES.values() if data)
+    assert len(mappings) == (2 * non_empty if mapped else 0)
+
+
+@pytest.mark.parametrize("relative", ["sub/nope.md", "missing-dir/nope.md"])
+def test_read_utf8_files_reports_full_path_of_missing_file(tmp_path: Path, relative: str) -> None:
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "present.md").write_text("ok", encoding="utf-8")
+    missing = tmp_path / relative
+
+    with pytest.raises(FileNotFoundError) as excinfo:
+        read_utf8_files([tmp_path / "sub" / "present.md", missing])
+    assert excinfo.value.filename == str(missing)
@@ -1,8 +1,31 @@
 """Tests for template assembly pipeline."""
 
+import os
 from pathlib import Path
 
 from loretex.api import convert_spec
+from loretex.pipeline import TemplateContext, load_template, render_template
+
+
+def _make_spec(tmp_path: Path) -> tuple[dict, Path, Path]:
+    # Template and chapter live on disk; the spec itself is passed to convert_spec as a dict.
+    template = tmp_path / "main.tex"
+    template.write_text(
+        "\\documentclass{article}\n\\begin{document}\n{{content}}\n\\end{document}",
+        encoding="utf-8",
+    )
+    chapter_md = tmp_path / "chapter.md"
+    chapter_md.write_text("# Title\n\nBody", encoding="utf-8")
+
+    output_dir = tmp_path / "tex"
+    main_output = output_dir / "main.tex"
+    spec = {
+        "output_dir": str(output_dir),
+        "template": str(template),
+        "main_output": str(main_output),
+        "chapters": [{"file": str(chapter_md)}],
+    }
+    return spec, output_dir, main_output
 
 
 def test_convert_spec_with_template(tmp_path: Path) -> None:
@@ -38,3 +61,34 @@ def test_convert_spec_with_template(tmp_path: Path) -> None:
     assert "\\input{chapter.tex}" in main_text
     assert result.chapter_outputs == [output_dir / "chapter.tex"]
     assert result.main_output == main_output
+
+
+def test_convert_spec_rerun_leaves_unchanged_outputs_untouched(tmp_path: Path) -> None:
+    spec, output_dir, main_output = _make_spec(tmp_path)
+    chapter_tex = output_dir / "chapter.tex"
+    convert_spec(spec)
+    os.utime(chapter_tex, ns=(0, 0))
+    os.utime(main_output, ns=(0, 0))
+
+    convert_spec(spec)
+
+    assert chapter_tex.stat().st_mtime_ns == 0
+    assert main_output.stat().st_mtime_ns == 0
+
+
+def test_render_template_substitutes_known_placeholders_once() -> None:
+    context = TemplateContext(content="{{title}}", values={"title": "{Doc}", "x-y": "z"})
+    template = "\\title{{title}} {{x-y}} {{ title }} {{missing}}\n{{content}}"
+    rendered = render_template(template, context)
+    assert rendered == "\\title{Doc} z {{ title }} {{missing}}\n{{title}}"
+
+
+def test_load_template_rereads_edited_files(tmp_path: Path) -> None:
+    template = tmp_path / "main.tex"
+    template.write_text("{{content}}", encoding="utf-8")
+    assert load_template(template) == "{{content}}"
+    mtime_ns = template.stat().st_mtime_ns
+    # Same size, so only the newer modification time can invalidate the cached content.
+    template.write_text("{{CONTENT}}", encoding="utf-8")
+    os.utime(template, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+    assert load_template(template) == "{{CONTENT}}"
@@ -13,24 +13,17 @@ def test_template_variables_and_bibliography(tmp_path: Path) -> None:
     )
     chapter_md = tmp_path / "chapter.md"
     chapter_md.write_text("# Title\n\nBody", encoding="utf-8")
-    spec = tmp_path / "spec.yml"
     output_dir = tmp_path / "tex"
     main_output = output_dir / "main.tex"
-    spec.write_text(
-        "\n".join(
-            [
-                f"output_dir: {output_dir}",
-                f"template: {template}",
-                f"main_output: {main_output}",
-                "title: Doc",
-                "author: Me",
-                "bibliography: \\\\bibliography{refs}",
-                "chapters:",
-                f"  - file: {chapter_md}",
-            ]
-        ),
-        encoding="utf-8",
-    )
+    spec = {
+        "output_dir": str(output_dir),
+        "template": str(template),
+        "main_output": str(main_output),
+        "title": "Doc",
+        "author": "Me",
+        "bibliography": "\\bibliography{refs}",
+        "chapters": [{"file": str(chapter_md)}],
+    }
 
     convert_spec(spec)
     content = main_output.read_text(encoding="utf-8")